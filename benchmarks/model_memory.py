@@ -0,0 +1,117 @@
+"""
+Retained memory of the in-memory course model (CourseSpec) per content block.
+
+Usage (from the repository root):
+
+    python -m benchmarks.model_memory                       # 100k blocks, default budget
+    python -m benchmarks.model_memory --blocks 20000 --max-bytes-per-block 200
+
+Builds a synthetic course with the requested number of content blocks, runs
+`validate_course_dict` on it and measures (tracemalloc) how much memory the
+resulting spec keeps alive once the raw mapping has been dropped. Block text
+(body, prompt, title, ...) is subtracted, so the figure is the per-block cost of
+the model objects themselves. Exits non-zero when it exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from course_engine.schema import validate_course_dict
+
+from .synth import SynthConfig, course_data
+
+# Slotted model classes measure ~111 bytes/block on CPython 3.11 (~168 with the
+# previous __dict__-based dataclasses); the budget leaves headroom for other versions.
+DEFAULT_MAX_BYTES_PER_BLOCK = 140
+
+_TEXT_FIELDS = ("body", "title", "style", "prompt", "solution")
+
+
+def _block_text_bytes(spec: Any) -> int:
+    seen: set[int] = set()
+    total = 0
+    for m in spec.modules:
+        for lesson in m.lessons:
+            for b in lesson.content_blocks:
+                for s in [getattr(b, f) for f in _TEXT_FIELDS] + list(b.options):
+                    if isinstance(s, str) and id(s) not in seen:
+                        seen.add(id(s))
+                        total += sys.getsizeof(s)
+    return total
+
+
+def measure_block_overhead(blocks: int, *, blocks_per_lesson: int = 10, body_bytes: int = 16) -> Dict[str, Any]:
+    """Build a course with ~`blocks` content blocks and report retained model memory."""
+    lessons = max(1, blocks // blocks_per_lesson)
+    modules = max(1, lessons // 100)
+    cfg = SynthConfig(
+        modules=modules,
+        lessons_per_module=max(1, lessons // modules),
+        blocks_per_lesson=blocks_per_lesson,
+        body_bytes=body_bytes,
+        capability_domains=1,
+    )
+
+    with tempfile.TemporaryDirectory(prefix="course-engine-model-memory-") as tmp:
+        root = Path(tmp)
+        data = course_data(root, cfg)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            spec = validate_course_dict(data, source_course_yml=root / "course.yml")
+            del data
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+    n_blocks = sum(len(lesson.content_blocks) for m in spec.modules for lesson in m.lessons)
+    text = _block_text_bytes(spec)
+    return {
+        "blocks": n_blocks,
+        "lessons": cfg.lessons,
+        "retained_bytes": retained,
+        "block_text_bytes": text,
+        "bytes_per_block": round((retained - text) / n_blocks, 1),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--blocks", type=int, default=100_000, help="content blocks in the synthetic course")
+    ap.add_argument("--blocks-per-lesson", type=int, default=10, help="content blocks per lesson")
+    ap.add_argument(
+        "--max-bytes-per-block",
+        type=float,
+        default=DEFAULT_MAX_BYTES_PER_BLOCK,
+        help="fail when model overhead per block exceeds this",
+    )
+    ap.add_argument("--json", dest="json_path", help="also write the result as JSON")
+    args = ap.parse_args(argv)
+
+    result = measure_block_overhead(args.blocks, blocks_per_lesson=args.blocks_per_lesson)
+    result["max_bytes_per_block"] = args.max_bytes_per_block
+
+    print(
+        f"{result['blocks']} blocks / {result['lessons']} lessons: "
+        f"{result['retained_bytes'] / 2**20:.1f} MiB retained, "
+        f"{result['bytes_per_block']} bytes/block excluding text "
+        f"(budget {args.max_bytes_per_block:g})"
+    )
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    return 0 if result["bytes_per_block"] <= args.max_bytes_per_block else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
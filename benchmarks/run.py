@@ -0,0 +1,288 @@
+"""
+Timed benchmark scenarios for every pipeline phase over synthetic courses.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 10x10,20x20,40x40 --repeat 5 --json bench.json
+    python -m benchmarks.run --scenarios validate,build_quarto --source-fraction 0.5
+    python -m benchmarks.run --scenarios yaml_parse,yaml_parse_pure --body-bytes 20000
+
+For every size and scenario this reports best/median wall time and peak Python
+memory (tracemalloc, measured in a separate run so it does not skew timings), then
+a scaling exponent per scenario between consecutive sizes (time ~ lessons^k:
+k ≈ 1 is linear, k ≈ 2 is quadratic).
+
+Generation-only builders are timed; Quarto is never invoked, so the Quarto
+fail-fast guard is disabled for the duration of the run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from course_engine import __version__
+from course_engine.exporters.markdown import build_markdown_package
+from course_engine.explain import explain_course_yml
+from course_engine.generator import build as build_mod
+from course_engine.generator.build import build_course_nav, build_quarto_project
+from course_engine.generator.html_single import build_html_single_project
+from course_engine.pack.packer import run_pack
+from course_engine.schema import validate_course_dict
+from course_engine.snapshot import snapshot_from_path
+from course_engine.utils import manifest as manifest_mod
+from course_engine.utils.manifest import build_file_inventory, load_manifest, write_manifest
+from course_engine.utils import yaml_io
+from course_engine.utils.reporting import build_capability_report
+from course_engine.utils.validation import load_profile, validate_manifest
+
+from .synth import SynthConfig, generate_course
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+@dataclass
+class BenchContext:
+    """Inputs prepared once per course size; scenarios reuse them."""
+
+    cfg: SynthConfig
+    root: Path
+    course_yml: Path
+    text: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)
+    spec: Any = None
+    artefact_dir: Optional[Path] = None
+
+    def scratch(self, name: str) -> Path:
+        return self.root / "out" / name
+
+
+def _prepare(root: Path, cfg: SynthConfig) -> BenchContext:
+    course_yml = generate_course(root / "src", cfg)
+    ctx = BenchContext(cfg=cfg, root=root, course_yml=course_yml)
+    ctx.text = course_yml.read_text(encoding="utf-8")
+    ctx.data = yaml_io.safe_load(ctx.text)
+    ctx.spec = validate_course_dict(ctx.data, source_course_yml=course_yml)
+
+    # A built artefact (with manifest) for the inventory/pack/validate scenarios.
+    ctx.artefact_dir = build_quarto_project(ctx.spec, ctx.root / "artefact", TEMPLATES_DIR)
+    write_manifest(
+        spec=ctx.spec,
+        out_dir=ctx.artefact_dir,
+        output_format="quarto",
+        source_course_yml=course_yml,
+        include_hashes=True,
+    )
+    return ctx
+
+
+def _validate_manifest(ctx: BenchContext) -> Any:
+    manifest = load_manifest(ctx.artefact_dir)  # type: ignore[arg-type]
+    report = build_capability_report(manifest)
+    profile = dict(load_profile(None))
+    profile.setdefault("signals", {"default_action": "info", "overrides": {}, "ignore": []})
+    return validate_manifest(manifest=manifest, report=report, profile=profile)
+
+
+def _file_inventory_serial(ctx: BenchContext) -> Any:
+    workers = manifest_mod.INVENTORY_HASH_WORKERS
+    manifest_mod.INVENTORY_HASH_WORKERS = 1
+    try:
+        return build_file_inventory(ctx.artefact_dir)  # type: ignore[arg-type]
+    finally:
+        manifest_mod.INVENTORY_HASH_WORKERS = workers
+
+
+# name -> callable(ctx); each call performs one complete unit of work.
+SCENARIOS: Dict[str, Callable[[BenchContext], Any]] = {
+    "yaml_parse": lambda c: yaml_io.safe_load(c.text),
+    # Baseline for yaml_parse: the pure-Python loader it replaces.
+    "yaml_parse_pure": lambda c: yaml.load(c.text, Loader=yaml.SafeLoader),
+    "validate": lambda c: validate_course_dict(c.data, source_course_yml=c.course_yml),
+    "nav": lambda c: build_course_nav(c.spec),
+    "build_quarto": lambda c: build_quarto_project(c.spec, c.scratch("quarto"), TEMPLATES_DIR),
+    "build_html_single": lambda c: build_html_single_project(
+        c.spec, out_root=c.scratch("html-single"), templates_dir=TEMPLATES_DIR
+    ),
+    "build_markdown": lambda c: build_markdown_package(c.spec, out_root=c.scratch("markdown")),
+    "file_inventory": lambda c: build_file_inventory(c.artefact_dir),  # type: ignore[arg-type]
+    "file_inventory_serial": _file_inventory_serial,
+    "explain": lambda c: explain_course_yml(str(c.course_yml), __version__, command="bench"),
+    "snapshot": lambda c: snapshot_from_path(c.course_yml, __version__, "bench"),
+    "pack": lambda c: run_pack(
+        input_path=c.artefact_dir,  # type: ignore[arg-type]
+        out_dir=c.scratch("pack"),
+        engine_version=__version__,
+        command="bench",
+    ),
+    "validate_manifest": _validate_manifest,
+}
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def _peak_bytes(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(
+    configs: List[SynthConfig],
+    *,
+    scenarios: List[str],
+    repeat: int = 3,
+    workdir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Run the selected scenarios for each config; returns a JSON-serialisable result."""
+    unknown = [s for s in scenarios if s not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}")
+
+    base = Path(workdir) if workdir else Path(tempfile.mkdtemp(prefix="course-engine-bench-"))
+    original_guard = build_mod._require_quarto
+    build_mod._require_quarto = lambda: None  # generation only; Quarto is never invoked
+    results: List[Dict[str, Any]] = []
+    try:
+        for cfg in configs:
+            ctx = _prepare(base / cfg.label, cfg)
+            for name in scenarios:
+                fn = SCENARIOS[name]
+                samples = _time(lambda: fn(ctx), repeat)
+                results.append(
+                    {
+                        "scenario": name,
+                        "size": cfg.label,
+                        "lessons": cfg.lessons,
+                        "course_yml_bytes": len(ctx.text.encode("utf-8")),
+                        "best_s": round(min(samples), 6),
+                        "median_s": round(statistics.median(samples), 6),
+                        "peak_bytes": _peak_bytes(lambda: fn(ctx)),
+                    }
+                )
+    finally:
+        build_mod._require_quarto = original_guard
+        if workdir is None:
+            shutil.rmtree(base, ignore_errors=True)
+
+    return {
+        "engine_version": __version__,
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "configs": [dict(vars(c)) for c in configs],
+        "results": results,
+        "scaling": _scaling(results),
+    }
+
+
+def _scaling(results: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Exponent k in time ~ lessons^k between consecutive sizes, per scenario."""
+    by_scenario: Dict[str, List[Dict[str, Any]]] = {}
+    for r in results:
+        by_scenario.setdefault(r["scenario"], []).append(r)
+
+    out: Dict[str, List[Dict[str, Any]]] = {}
+    for name, rows in by_scenario.items():
+        rows = sorted(rows, key=lambda r: r["lessons"])
+        steps = []
+        for a, b in zip(rows, rows[1:]):
+            if a["lessons"] == b["lessons"] or a["best_s"] <= 0 or b["best_s"] <= 0:
+                continue
+            k = math.log(b["best_s"] / a["best_s"]) / math.log(b["lessons"] / a["lessons"])
+            steps.append({"from": a["size"], "to": b["size"], "exponent": round(k, 2)})
+        out[name] = steps
+    return out
+
+
+def format_results(payload: Dict[str, Any]) -> str:
+    lines = [f"course-engine {payload['engine_version']} / Python {payload['python']}"]
+    lines.append(f"{'scenario':<20} {'size':>8} {'lessons':>8} {'best ms':>10} {'median ms':>10} {'peak MiB':>9}")
+    for r in payload["results"]:
+        lines.append(
+            f"{r['scenario']:<20} {r['size']:>8} {r['lessons']:>8} "
+            f"{r['best_s'] * 1000:>10.2f} {r['median_s'] * 1000:>10.2f} "
+            f"{r['peak_bytes'] / (1024 * 1024):>9.2f}"
+        )
+
+    scaling = {k: v for k, v in payload["scaling"].items() if v}
+    if scaling:
+        lines.append("")
+        lines.append("scaling (time ~ lessons^k)")
+        for name, steps in scaling.items():
+            parts = ", ".join(f"{s['from']}->{s['to']}: k={s['exponent']}" for s in steps)
+            lines.append(f"  {name:<18} {parts}")
+    return "\n".join(lines)
+
+
+def _parse_sizes(raw: str) -> List[tuple[int, int]]:
+    sizes = []
+    for part in raw.split(","):
+        m, _, n = part.strip().lower().partition("x")
+        sizes.append((int(m), int(n)))
+    return sizes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default="5x5,10x10,20x20", help="MODULESxLESSONS list (comma separated)")
+    ap.add_argument("--blocks", type=int, default=3, help="content blocks per inline lesson")
+    ap.add_argument("--body-bytes", type=int, default=1000, help="approximate markdown body size")
+    ap.add_argument("--source-fraction", type=float, default=0.0, help="share of lessons using source: files")
+    ap.add_argument("--domains", type=int, default=6, help="capability_mapping domains")
+    ap.add_argument("--repeat", type=int, default=3, help="timed runs per scenario")
+    ap.add_argument("--scenarios", default=",".join(SCENARIOS), help="comma-separated subset")
+    ap.add_argument("--json", dest="json_path", help="also write results as JSON")
+    ap.add_argument("--workdir", help="keep generated courses/outputs here instead of a temp dir")
+    args = ap.parse_args(argv)
+
+    configs = [
+        SynthConfig(
+            modules=m,
+            lessons_per_module=n,
+            blocks_per_lesson=args.blocks,
+            body_bytes=args.body_bytes,
+            source_fraction=args.source_fraction,
+            capability_domains=args.domains,
+        )
+        for m, n in _parse_sizes(args.sizes)
+    ]
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+
+    payload = run_benchmarks(
+        configs,
+        scenarios=scenarios,
+        repeat=max(1, args.repeat),
+        workdir=Path(args.workdir) if args.workdir else None,
+    )
+    print(format_results(payload))
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+"""
+Synthetic course generator for benchmarks.
+
+Writes a valid course.yml (plus lesson source files when requested) whose size is
+controlled by SynthConfig. Output is deterministic for a given config.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+import yaml
+
+_WORDS = (
+    "capability governance evidence practice learner reflection framework design "
+    "assessment context judgement accountable renewal ethics equity impact applied "
+    "innovation awareness agency decision review policy scope outcome"
+).split()
+
+_DOMAINS = [
+    "Awareness",
+    "Co-Agency",
+    "Applied Practice & Innovation",
+    "Ethics, Equity & Impact",
+    "Decision-Making & Governance",
+    "Reflection, Learning & Renewal",
+]
+
+_BLOCK_CYCLE = ("markdown", "callout", "quiz", "reflection", "submission")
+
+
+@dataclass(frozen=True)
+class SynthConfig:
+    """Shape of a synthetic course."""
+
+    modules: int = 10
+    lessons_per_module: int = 10
+    blocks_per_lesson: int = 3
+    body_bytes: int = 1_000
+    # Fraction of lessons that use `source:` files instead of inline content_blocks.
+    source_fraction: float = 0.0
+    capability_domains: int = 6
+    seed: int = 1
+
+    @property
+    def lessons(self) -> int:
+        return self.modules * self.lessons_per_module
+
+    @property
+    def label(self) -> str:
+        return f"{self.modules}x{self.lessons_per_module}"
+
+
+def _text(rng: random.Random, n_bytes: int) -> str:
+    words: List[str] = []
+    size = 0
+    while size < n_bytes:
+        w = rng.choice(_WORDS)
+        words.append(w)
+        size += len(w) + 1
+    lines = [" ".join(words[i : i + 12]) for i in range(0, len(words), 12)]
+    return "\n".join(lines) + "\n"
+
+
+def _block(kind: str, rng: random.Random, body_bytes: int) -> Dict[str, Any]:
+    if kind == "markdown":
+        return {"type": "markdown", "body": _text(rng, body_bytes)}
+    if kind == "callout":
+        return {"type": "callout", "style": "note", "title": "Note", "body": _text(rng, body_bytes // 4)}
+    if kind == "quiz":
+        return {
+            "type": "quiz",
+            "prompt": _text(rng, 80).strip(),
+            "options": ["Option A", "Option B", "Option C"],
+            "answer": 1,
+        }
+    if kind == "reflection":
+        return {"type": "reflection", "prompt": _text(rng, 120).strip()}
+    return {"type": "submission", "prompt": _text(rng, 120).strip()}
+
+
+def course_data(root: Path, cfg: SynthConfig) -> Dict[str, Any]:
+    """Build the course.yml mapping for cfg (lesson source files are written under root)."""
+    rng = random.Random(cfg.seed)
+    root = Path(root)
+    lessons_dir = root / "lessons"
+    lessons_dir.mkdir(parents=True, exist_ok=True)
+
+    n_source = round(cfg.lessons * cfg.source_fraction)
+    source_every = (cfg.lessons / n_source) if n_source else 0.0
+    next_source = 0.0
+
+    modules: List[Dict[str, Any]] = []
+    index = 0
+    for mi in range(1, cfg.modules + 1):
+        lessons: List[Dict[str, Any]] = []
+        for li in range(1, cfg.lessons_per_module + 1):
+            lesson: Dict[str, Any] = {
+                "id": f"l{li}",
+                "title": f"Lesson {mi}.{li}",
+                "learning_objectives": [_text(rng, 60).strip()],
+                "readings": [{"title": f"Reading {mi}.{li}", "url": "https://example.org/r", "required": li == 1}],
+            }
+
+            if n_source and index >= next_source:
+                rel = f"lessons/m{mi}-l{li}.md"
+                body = f"# Lesson {mi}.{li}\n\n" + _text(rng, cfg.body_bytes * cfg.blocks_per_lesson)
+                (root / rel).write_text(body, encoding="utf-8")
+                lesson["source"] = rel
+                next_source += source_every
+            else:
+                lesson["content_blocks"] = [
+                    _block(_BLOCK_CYCLE[b % len(_BLOCK_CYCLE)], rng, cfg.body_bytes)
+                    for b in range(cfg.blocks_per_lesson)
+                ]
+
+            lessons.append(lesson)
+            index += 1
+        modules.append({"id": f"m{mi}", "title": f"Module {mi}", "lessons": lessons})
+
+    domains = {
+        f"domain_{d}": {
+            "label": f"Domain {d}",
+            "intent": _text(rng, 100).strip(),
+            "coverage": [f"m{(d % cfg.modules) + 1}"],
+            "evidence": [f"lesson:l{(d % cfg.lessons_per_module) + 1}", "learning_objectives"],
+        }
+        for d in range(1, cfg.capability_domains + 1)
+    }
+
+    return {
+        "course": {
+            "id": f"synth-{cfg.label}",
+            "title": f"Synthetic course {cfg.label}",
+            "version": "0.1.0",
+            "language": "en-GB",
+        },
+        "framework_alignment": {
+            "framework_name": "Synthetic Framework",
+            "domains": _DOMAINS,
+            "mapping_mode": "informational",
+        },
+        "capability_mapping": {"framework": "Synthetic Framework", "version": "1", "domains": domains},
+        "structure": {"modules": modules},
+    }
+
+
+def generate_course(root: Path, cfg: SynthConfig) -> Path:
+    """Write a synthetic course under root and return the course.yml path."""
+    root = Path(root)
+    data = course_data(root, cfg)
+    course_yml = root / "course.yml"
+    course_yml.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+    return course_yml
@@ -6,24 +6,40 @@ import json
 import platform
 import shutil
 import sys
+import time
 from pathlib import Path
 from typing import Literal, Optional
 
 import typer
-import yaml
-from jinja2 import Template
-
 from . import __version__
 from .explain import explain_course_yml
 from .explain.artefact import explain_dist_dir
 from .explain.text import explain_payload_to_summary, explain_payload_to_text
+from .generator.batch import (
+    BATCH_FORMATS,
+    batch_summary,
+    build_many,
+    discover_course_files,
+    read_course_list,
+)
 from .generator.build import build_quarto_project
 from .generator.html_single import build_html_single_project
-from .generator.render import render_quarto
+from .generator.render import (
+    RenderFailed,
+    render_quarto,
+    render_quarto_changed,
+    render_quarto_parallel,
+)
+from .generator.templates import get_env, precompile_templates
+from .generator.watch import WatchSession
 from .pack.packer import PackInputError, run_pack
 from .plugins import BuildContext, load_plugins
 from .schema import validate_course_dict
-from .utils.fileops import write_text
+from .utils import course_cache, yaml_io
+from .utils.build_state import clear_pending_render, load_build_state
+from .utils.cache import cache_subdir
+from .utils.course_context import CourseContext
+from .utils.fileops import WriteTracker, track_writes, write_text
 from .snapshot import snapshot_from_path, snapshot_payload_to_text
 from .utils.manifest import load_manifest, update_manifest_after_render, write_manifest
 from .utils.policy import (
@@ -39,11 +55,11 @@ from .utils.preflight import (
 )
 from .utils.reporting import (
     build_capability_report,
-    build_governance_self_audit,
     governance_audit_to_text,
     report_to_json,
     report_to_text,
 )
+from .utils.watcher import PollingWatcher, open_watcher, wait_for_changes
 from .utils.validation import (
     load_profile,  # v1.3 legacy profile file loader
     validate_manifest,
@@ -77,13 +93,26 @@ def _callback(
 DEFAULT_TEMPLATES_DIR = Path(__file__).resolve().parents[2] / "templates"
 
 
-def _emit_manifest(spec, out_dir: Path, output_format: str, source_course_yml: Path) -> None:
+def _echo_course_cache_stats(verbose: bool) -> None:
+    # stderr: keeps stdout machine-readable for explain/snapshot JSON.
+    if verbose:
+        typer.echo(course_cache.STATS.summary(), err=True)
+
+
+def _emit_manifest(
+    ctx: CourseContext,
+    out_dir: Path,
+    output_format: str,
+    writes: Optional[WriteTracker] = None,
+) -> None:
     mp = write_manifest(
-        spec=spec,
+        spec=ctx.spec,
         out_dir=out_dir,
         output_format=output_format,
-        source_course_yml=source_course_yml,
+        source_course_yml=ctx.course_yml,
         include_hashes=True,
+        context=ctx,
+        writes=writes,
     )
     typer.echo(f"Wrote manifest: {mp}")
 
@@ -187,6 +216,11 @@ def check(
         "--require",
         help="Require specific capabilities (repeatable): pdf",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore the cached PDF toolchain result and re-run the PDF smoke test.",
+    ),
 ) -> None:
     """
     Check whether external runtime prerequisites are installed.
@@ -226,7 +260,7 @@ def check(
 
     # Build payload (catch unexpected errors -> exit 1)
     try:
-        payload = build_preflight_report()
+        payload = build_preflight_report(refresh=refresh)
     except Exception as e:  # noqa: BLE001 (intentional: CLI boundary)
         typer.echo(f"Preflight check failed unexpectedly: {e}", err=True)
         raise typer.Exit(code=1)
@@ -343,6 +377,12 @@ def explain(
         help="One-screen human-readable summary (no policy execution; no judgement).",
     ),
     out: Optional[str] = typer.Option(None, "--out", help="Write output to a file instead of stdout."),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Report parsed-course cache hits/misses on stderr.",
+    ),
 ) -> None:
     """
     Explain an input into a governance-friendly artefact (explain-only).
@@ -418,6 +458,8 @@ def explain(
     else:
         text = explain_payload_to_summary(payload) + "\n"
 
+    _echo_course_cache_stats(verbose)
+
     if out:
         write_text(Path(out), text)
     else:
@@ -511,6 +553,12 @@ def pack(
         "--overwrite",
         help="If the output directory exists, delete it first (safe, opt-in).",
     ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Report parsed-course cache hits/misses on stderr.",
+    ),
 ) -> None:
     """
     Generate a governance pack folder (facts only; no build/render; no policy enforcement).
@@ -537,6 +585,7 @@ def pack(
     except (PackInputError, ValueError) as e:
         raise typer.BadParameter(str(e)) from e
 
+    _echo_course_cache_stats(verbose)
     typer.echo(f"Pack generated: {out_dir}")
     if isinstance(result, dict) and "contents" in result:
         written = [k for k, v in (result.get("contents") or {}).items() if v]
@@ -832,8 +881,7 @@ def _write_handout_pdf_quarto_config(out_dir: Path, templates_dir: Path) -> None
             "Create templates/_handout_pdf_quarto.yml.j2 to enable --format pdf."
         )
 
-    raw = tpl_path.read_text(encoding="utf-8")
-    rendered = Template(raw).render()
+    rendered = get_env(templates_dir).get_template("_handout_pdf_quarto.yml.j2").render()
     write_text(out_dir / "_quarto.yml", rendered)
 
 
@@ -853,6 +901,34 @@ def build(
         "--overwrite",
         help="If the output directory exists, delete it first and rebuild (safe, opt-in).",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Quarto format only: rewrite only outputs whose inputs changed since the last build.",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Quarto format only: number of workers for lesson page generation.",
+    ),
+    jobs_backend: str = typer.Option(
+        "thread",
+        "--jobs-backend",
+        help="Worker type for --jobs: thread | process.",
+    ),
+    refresh_preflight: bool = typer.Option(
+        False,
+        "--refresh-preflight",
+        help="PDF format only: ignore the cached PDF toolchain check and re-run it.",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Report parsed-course cache hits/misses on stderr.",
+    ),
 ):
     course_path = Path(course_yml)
     out_root = Path(out)
@@ -860,44 +936,83 @@ def build(
 
     typer.echo(f"• Loading course project: {course_path.name}")
     try:
-        data = yaml.safe_load(course_path.read_text(encoding="utf-8"))
-        typer.echo("✔ YAML parse complete.")
-    except Exception as e:
+        data_bytes = course_path.read_bytes()
+    except OSError as e:
         raise typer.BadParameter(f"Failed to parse {course_path}: {e}")
 
-    try:
-        typer.echo("• Validating syllabus schema & logic...")
-        spec = validate_course_dict(data, source_course_yml=course_path)
-        typer.echo("✔ Schema validation OK.")
-    except ValueError as e:
-        raise typer.BadParameter(f"Invalid course.yml: {e}") from e
+    cached = course_cache.lookup(course_path, data_bytes)
+    if cached is not None:
+        data, spec = cached
+        typer.echo("✔ Course unchanged since last parse: using cached validated course.")
+    else:
+        try:
+            data = yaml_io.safe_load(data_bytes)
+            typer.echo("✔ YAML parse complete.")
+        except Exception as e:
+            raise typer.BadParameter(f"Failed to parse {course_path}: {e}")
+
+        try:
+            typer.echo("• Validating syllabus schema & logic...")
+            spec = validate_course_dict(data, source_course_yml=course_path)
+            typer.echo("✔ Schema validation OK.")
+        except ValueError as e:
+            raise typer.BadParameter(f"Invalid course.yml: {e}") from e
+
+        course_cache.store(course_path, data_bytes, data, spec)
+
+    course_ctx = CourseContext.from_parsed(
+        course_path, data_bytes, data, spec, from_cache=cached is not None
+    )
+
+    if verbose:
+        typer.echo(f"• {course_cache.STATS.summary()}")
 
     # Governance Self-Audit
     typer.echo("-" * 45)
-    audit = build_governance_self_audit(spec)
-    typer.echo(governance_audit_to_text(audit))
+    typer.echo(governance_audit_to_text(course_ctx.audit))
     typer.echo("-" * 45)
 
     allowed = {"quarto", "markdown", "html-single", "pdf"}
     if output_format not in allowed:
         raise typer.BadParameter("Unknown --format. Use: quarto | markdown | html-single | pdf")
 
+    if incremental and output_format != "quarto":
+        raise typer.BadParameter("--incremental is only supported with --format quarto.")
+
+    if jobs_backend not in {"thread", "process"}:
+        raise typer.BadParameter("Unknown --jobs-backend. Use: thread | process")
+
     if output_format == "quarto":
         out_dir = out_root / spec.id
-        _maybe_overwrite_dir(out_dir, overwrite=overwrite)
+        if not incremental:
+            _maybe_overwrite_dir(out_dir, overwrite=overwrite)
 
         ctx = BuildContext()
         plugins = load_plugins()
         for plg in plugins:
             plg.pre_build(spec, ctx)
 
-        out_dir = build_quarto_project(spec, out_root=out_root, templates_dir=templates_dir)
+        with track_writes() as writes:
+            out_dir = build_quarto_project(
+                spec,
+                out_root=out_root,
+                templates_dir=templates_dir,
+                incremental=incremental,
+                jobs=jobs,
+                jobs_backend=jobs_backend,  # type: ignore[arg-type]
+            )
 
         for plg in plugins:
             plg.post_build(spec, ctx, out_dir)
 
         typer.echo(f"Built Quarto project: {out_dir}")
-        _emit_manifest(spec, out_dir, "quarto", course_path)
+        if incremental:
+            state = load_build_state(out_dir) or {}
+            typer.echo(
+                f"Incremental build: {len(state.get('written') or [])} file(s) written, "
+                f"{len(state.get('removed') or [])} removed."
+            )
+        _emit_manifest(course_ctx, out_dir, "quarto", writes)
         typer.echo(f"ARTEFACT={out_dir.resolve()}")
         return
 
@@ -916,48 +1031,259 @@ def build(
                         "Find which file contains it and update cli.py accordingly."
                     ) from e
 
-        out_dir = build_markdown_package(spec, out_root=out_root)
+        with track_writes() as writes:
+            out_dir = build_markdown_package(spec, out_root=out_root)
         typer.echo(f"Built Markdown package: {out_dir}")
-        _emit_manifest(spec, out_dir, "markdown", course_path)
+        _emit_manifest(course_ctx, out_dir, "markdown", writes)
         typer.echo(f"ARTEFACT={Path(out_dir).resolve()}")
         return
 
     if output_format == "html-single":
-        out_dir = build_html_single_project(spec, out_root=out_root, templates_dir=templates_dir)
+        with track_writes() as writes:
+            out_dir = build_html_single_project(spec, out_root=out_root, templates_dir=templates_dir)
         typer.echo(f"Built single-page HTML Quarto project: {out_dir}")
-        _emit_manifest(spec, out_dir, "html-single", course_path)
+        _emit_manifest(course_ctx, out_dir, "html-single", writes)
         typer.echo(f"ARTEFACT={out_dir.resolve()}")
         typer.echo("Next: course-engine render " + str(out_dir))
         return
 
     if output_format == "pdf":
         try:
-            require_pdf_toolchain()
+            require_pdf_toolchain(refresh=refresh_preflight)
         except PrereqError as e:
             raise typer.BadParameter(str(e)) from e
 
         out_dir = out_root / f"{spec.id}-pdf"
         _maybe_overwrite_dir(out_dir, overwrite=overwrite)
 
-        tmp_dir = build_html_single_project(spec, out_root=out_root, templates_dir=templates_dir)
+        with track_writes() as writes:
+            tmp_dir = build_html_single_project(spec, out_root=out_root, templates_dir=templates_dir)
 
-        if tmp_dir != out_dir:
-            if out_dir.exists():
-                raise typer.BadParameter(
-                    f"Target output folder already exists: {out_dir}\n"
-                    "Delete it, choose a different --out directory, or pass --overwrite."
-                )
-            tmp_dir.rename(out_dir)
+            if tmp_dir != out_dir:
+                if out_dir.exists():
+                    raise typer.BadParameter(
+                        f"Target output folder already exists: {out_dir}\n"
+                        "Delete it, choose a different --out directory, or pass --overwrite."
+                    )
+                tmp_dir.rename(out_dir)
 
-        _write_handout_pdf_quarto_config(out_dir, templates_dir)
+            _write_handout_pdf_quarto_config(out_dir, templates_dir)
 
         typer.echo(f"Built single-page PDF Quarto project: {out_dir}")
-        _emit_manifest(spec, out_dir, "pdf", course_path)
+        _emit_manifest(course_ctx, out_dir, "pdf", writes)
         typer.echo(f"ARTEFACT={out_dir.resolve()}")
         typer.echo("Next: course-engine render " + str(out_dir))
         return
 
 
+@app.command("build-many")
+def build_many_cmd(
+    root: Optional[str] = typer.Argument(
+        None,
+        help="Directory to search for course.yml files (recursively).",
+    ),
+    from_file: Optional[str] = typer.Option(
+        None,
+        "--from-file",
+        help="Text file listing course.yml paths (one per line) instead of searching ROOT.",
+    ),
+    out: str = typer.Option("dist", "--out", help="Output root shared by all courses."),
+    templates: Optional[str] = typer.Option(None, "--templates", help="Templates directory."),
+    output_format: str = typer.Option(
+        "quarto",
+        "--format",
+        "-f",
+        help="quarto | markdown | html-single",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of worker processes (one course per worker at a time).",
+    ),
+    overwrite: bool = typer.Option(
+        False,
+        "--overwrite",
+        help="Replace existing course output folders.",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Quarto format only: rewrite only outputs whose inputs changed.",
+    ),
+    summary: Optional[str] = typer.Option(
+        None,
+        "--summary",
+        help="Also write the JSON summary to this path.",
+    ),
+) -> None:
+    """
+    Build every course under ROOT (or listed in --from-file) in one process pool.
+
+    Each course gets its own output folder and manifest. A failing course does not stop
+    the others. A JSON summary with per-course status and timing is printed to stdout;
+    progress goes to stderr.
+
+    Exit codes:
+      0 = all courses built
+      1 = one or more courses failed
+    """
+    if (root is None) == (from_file is None):
+        raise typer.BadParameter("Pass either ROOT or --from-file (exactly one).")
+
+    if output_format not in BATCH_FORMATS:
+        raise typer.BadParameter("Unknown --format. Use: quarto | markdown | html-single")
+
+    if incremental and output_format != "quarto":
+        raise typer.BadParameter("--incremental is only supported with --format quarto.")
+
+    if from_file is not None:
+        try:
+            course_files = read_course_list(Path(from_file))
+        except OSError as e:
+            raise typer.BadParameter(f"Failed to read {from_file}: {e}") from e
+    else:
+        root_path = Path(root)  # type: ignore[arg-type]
+        if not root_path.exists():
+            raise typer.BadParameter(f"Path not found: {root_path}")
+        course_files = discover_course_files(root_path)
+
+    out_root = Path(out)
+    templates_dir = Path(templates) if templates else DEFAULT_TEMPLATES_DIR
+
+    typer.echo(f"• Building {len(course_files)} course(s) with {jobs} worker(s)...", err=True)
+    started = time.perf_counter()
+    results = build_many(
+        course_files,
+        out_root=out_root,
+        templates_dir=templates_dir,
+        output_format=output_format,  # type: ignore[arg-type]
+        jobs=jobs,
+        overwrite=overwrite,
+        incremental=incremental,
+    )
+    elapsed = time.perf_counter() - started
+
+    for r in results:
+        if r.ok:
+            typer.echo(f"✔ {r.course_yml} ({r.seconds:.2f}s)", err=True)
+        else:
+            typer.echo(f"✖ {r.course_yml}: {r.error}", err=True)
+
+    payload = batch_summary(
+        results,
+        output_format=output_format,
+        out_root=out_root,
+        jobs=jobs,
+        seconds=elapsed,
+    )
+    text = json.dumps(payload, indent=2, ensure_ascii=False)
+    if summary:
+        write_text(Path(summary), text + "\n")
+    typer.echo(text)
+
+    if payload["failed"]:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def watch(
+    course_yml: str,
+    out: str = typer.Option("dist", "--out", help="Output root (as for build)."),
+    templates: Optional[str] = typer.Option(None, "--templates", help="Templates directory."),
+    render_output: bool = typer.Option(
+        False,
+        "--render",
+        help="Also re-render the inputs each rebuild changed (needs Quarto).",
+    ),
+    to: Optional[str] = typer.Option(
+        None,
+        "--to",
+        help="With --render: optional Quarto output format override.",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="With --render: number of concurrent `quarto render` processes.",
+    ),
+    debounce: float = typer.Option(
+        0.3,
+        "--debounce",
+        min=0.0,
+        help="Seconds of quiet to wait for after a change before rebuilding.",
+    ),
+    poll: bool = typer.Option(
+        False,
+        "--poll",
+        help="Use mtime polling instead of inotify (e.g. network filesystems).",
+    ),
+    interval: float = typer.Option(
+        0.5,
+        "--interval",
+        min=0.05,
+        help="Polling interval in seconds (polling mode only).",
+    ),
+) -> None:
+    """
+    Rebuild a Quarto project incrementally whenever course.yml, a lesson source
+    or a template changes (Ctrl+C to stop).
+    """
+    course_path = Path(course_yml)
+    if not course_path.is_file():
+        raise typer.BadParameter(f"Path not found: {course_path}")
+
+    templates_dir = Path(templates) if templates else DEFAULT_TEMPLATES_DIR
+    session = WatchSession(
+        course_path,
+        out_root=Path(out),
+        templates_dir=templates_dir,
+        render=render_output,
+        to=to,
+        jobs=jobs,
+    )
+
+    def _report(result) -> None:
+        if result.error:
+            typer.echo(f"✖ Build failed: {result.error}", err=True)
+            return
+        msg = (
+            f"✔ Rebuilt in {result.seconds:.2f}s: {len(result.written)} written, "
+            f"{len(result.removed)} removed"
+        )
+        if result.rendered is not None:
+            msg += f", {len(result.rendered)} rendered"
+        elif render_output:
+            msg += ", full render"
+        typer.echo(msg + ".")
+
+    _report(session.run_cycle())
+
+    watcher = open_watcher(force_polling=poll, interval=interval)
+    kind = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    typer.echo(f"• Watching {course_path} ({kind}). Press Ctrl+C to stop.")
+    watched: Optional[tuple[list[Path], list[Path]]] = None
+    try:
+        while True:
+            # Only when the set changed: edits saved during the last rebuild must still
+            # be reported by the next poll.
+            paths = (session.watched_files(), [templates_dir, *session.watched_dirs()])
+            if paths != watched:
+                watcher.set_paths(*paths)
+                watched = paths
+            changed = wait_for_changes(watcher, debounce=debounce)
+            if not changed:
+                continue
+            typer.echo(f"• {len(changed)} change(s) detected.")
+            _report(session.run_cycle(changed))
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
+    finally:
+        watcher.close()
+
+
 @app.command()
 def render(
     project_dir: str,
@@ -971,19 +1297,105 @@ def render(
         "--input",
         help='Optional input file to render (e.g., "index.qmd").',
     ),
+    changed: bool = typer.Option(
+        False,
+        "--changed",
+        help=(
+            "Render only the .qmd files rewritten by builds since the last render "
+            "(falls back to a full render when _quarto.yml changed)."
+        ),
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Render inputs with N concurrent `quarto render <file>` processes.",
+    ),
+    refresh_preflight: bool = typer.Option(
+        False,
+        "--refresh-preflight",
+        help="With --to pdf: ignore the cached PDF toolchain check and re-run it.",
+    ),
+    rehash: bool = typer.Option(
+        False,
+        "--rehash",
+        help="Hash every output file for the manifest instead of reusing digests of unchanged files.",
+    ),
 ):
     p = Path(project_dir)
 
-    render_quarto(p, input_file=input_file, to=to)
-    typer.echo("Render complete.")
+    if changed and input_file:
+        raise typer.BadParameter("Use either --changed or --input, not both.")
+    if jobs > 1 and input_file:
+        raise typer.BadParameter("--jobs cannot be combined with --input.")
+
+    if refresh_preflight and to == "pdf":
+        try:
+            require_pdf_toolchain(refresh=True)
+        except PrereqError as e:
+            raise typer.BadParameter(str(e)) from e
 
+    rendered: Optional[list[str]] = None
     try:
-        mp = update_manifest_after_render(p, to=to, input_file=input_file, include_hashes=True)
+        if changed:
+            rendered = render_quarto_changed(p, to=to, jobs=jobs)
+            if rendered is None:
+                typer.echo("Render complete (full render: no build state or site config changed).")
+            elif not rendered:
+                typer.echo("Nothing to render: no inputs changed since the last render.")
+            else:
+                typer.echo(f"Render complete ({len(rendered)} changed input(s)).")
+        elif jobs > 1:
+            shards = render_quarto_parallel(p, jobs=jobs, to=to)
+            clear_pending_render(p)
+            count = sum(len(s.results) for s in shards)
+            typer.echo(f"Render complete ({count} input(s) across {len(shards)} worker(s)).")
+        else:
+            render_quarto(p, input_file=input_file, to=to)
+            clear_pending_render(p, [input_file] if input_file else None)
+            typer.echo("Render complete.")
+    except RenderFailed as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        mp = update_manifest_after_render(
+            p,
+            to=to,
+            input_file=input_file,
+            inputs=rendered,
+            include_hashes=True,
+            rehash=rehash,
+        )
         typer.echo(f"Updated manifest: {mp}")
     except FileNotFoundError:
         pass
 
 
+@app.command("warm-cache")
+def warm_cache_cmd(
+    templates: Optional[str] = typer.Option(None, "--templates", help="Templates directory."),
+) -> None:
+    """
+    Compile every template into the on-disk Jinja bytecode cache.
+
+    Run once after installing or after editing templates, so the first `build` in each
+    new process loads compiled templates instead of compiling them.
+    """
+    templates_dir = Path(templates) if templates else DEFAULT_TEMPLATES_DIR
+    if not templates_dir.is_dir():
+        raise typer.BadParameter(f"Templates directory not found: {templates_dir}")
+
+    cache_dir = cache_subdir("jinja-bytecode")
+    if cache_dir is None:
+        typer.echo("Caching is disabled (COURSE_ENGINE_NO_CACHE); nothing to warm.")
+        return
+
+    n = precompile_templates(templates_dir)
+    typer.echo(f"Compiled {n} template(s) into {cache_dir}")
+
+
 def main() -> None:
     """
     Entry point for `python -m course_engine`.
@@ -8,10 +8,14 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
-
 from ..schema import validate_course_dict
-from ..utils.lesson_sources import load_lesson_source
+from ..utils import course_cache, yaml_io
+from ..utils.lesson_sources import (
+    LessonSourceResult,
+    load_lesson_source,
+    normalise_path_str,
+    resolve_source_path,
+)
 from ..utils.signals import compute_signals  # v1.13
 
 
@@ -127,10 +131,15 @@ def _block_source_summary(block: Any) -> Dict[str, Any]:
     """
     body = getattr(block, "body", None)
     src = getattr(block, "source", None)
+    body_source = getattr(block, "body_source", None)
 
     if isinstance(src, str) and src.strip():
         return {"kind": "file", "path": src, "hash_sha256": None, "bytes": None}
 
+    if body_source is not None:
+        # Lesson source file: hash/size of the file as read by the schema (no re-read).
+        return {"kind": "inline", "path": None, "hash_sha256": body_source.sha256, "bytes": body_source.bytes}
+
     if isinstance(body, str) and body != "":
         b = body.encode("utf-8")
         return {"kind": "inline", "path": None, "hash_sha256": _sha256_bytes(b), "bytes": len(b)}
@@ -148,14 +157,30 @@ def _record_source_provenance(
     file_index: Dict[str, Dict[str, Any]],
     resolution_rows: List[Dict[str, Any]],
     warnings: List[ExplainWarning],
+    known: Any = None,
 ) -> int:
     """
     Record provenance for a declared source path into:
       - file_index (unique resolved files)
       - resolution_rows (mapping lesson/block -> resolved file)
+    `known` is the SourceBody the schema already read for this path, if any; the
+    file is only loaded again when it is missing.
     Returns: missing_increment (0 or 1)
     """
-    res = load_lesson_source(course_yml_path, declared_path)
+    if known is not None:
+        resolved = resolve_source_path(course_yml_path, declared_path)
+        res = LessonSourceResult(
+            declared_path=declared_path,
+            resolved_path=str(resolved),
+            resolved_path_normalised=normalise_path_str(str(resolved)),
+            exists=True,
+            bytes=known.bytes,
+            hash_sha256=known.sha256,
+            markdown=None,
+            error=None,
+        )
+    else:
+        res = load_lesson_source(course_yml_path, declared_path, read_markdown=False)
 
     resolution_rows.append(
         {
@@ -252,7 +277,8 @@ def explain_course_yml(
     sources_obj: Dict[str, Any] = {
         "files": [],
         "resolution": [],
-        "counts": {"files": 0, "missing": 0},
+        "includes": [],
+        "counts": {"files": 0, "missing": 0, "includes": 0},
     }
 
     policies_obj: Dict[str, Any] = {
@@ -316,43 +342,50 @@ def explain_course_yml(
     input_obj["bytes"] = len(data_bytes)
     input_obj["hash_sha256"] = _sha256_bytes(data_bytes)
 
-    try:
-        raw = yaml.safe_load(data_bytes.decode("utf-8"))
-    except Exception as e:
-        errors.append(ExplainError(code="COURSE_YML_PARSE_ERROR", message=str(e), path=path_arg))
-        return _finalise_explain(
-            engine_version=engine_version,
-            command=command,
-            input_obj=input_obj,
-            course_obj=course_obj,
-            structure_obj=structure_obj,
-            sources_obj=sources_obj,
-            policies_obj=policies_obj,
-            rendering_obj=rendering_obj,
-            capability_mapping_obj=capability_mapping_obj,
-            warnings=warnings,
-            errors=errors,
-            signals_obj=[],
-        )
+    # Explain never renders: load the spec without holding lesson source text.
+    cached = course_cache.lookup(p, data_bytes, lazy=True)
+    if cached is not None:
+        _, spec = cached
+    else:
+        try:
+            raw = yaml_io.safe_load(data_bytes)
+        except Exception as e:
+            errors.append(ExplainError(code="COURSE_YML_PARSE_ERROR", message=str(e), path=path_arg))
+            return _finalise_explain(
+                engine_version=engine_version,
+                command=command,
+                input_obj=input_obj,
+                course_obj=course_obj,
+                structure_obj=structure_obj,
+                sources_obj=sources_obj,
+                policies_obj=policies_obj,
+                rendering_obj=rendering_obj,
+                capability_mapping_obj=capability_mapping_obj,
+                warnings=warnings,
+                errors=errors,
+                signals_obj=[],
+            )
 
-    try:
-        spec = validate_course_dict(raw, source_course_yml=p)
-    except Exception as e:
-        errors.append(ExplainError(code="COURSE_YML_INVALID", message=str(e), path=path_arg))
-        return _finalise_explain(
-            engine_version=engine_version,
-            command=command,
-            input_obj=input_obj,
-            course_obj=course_obj,
-            structure_obj=structure_obj,
-            sources_obj=sources_obj,
-            policies_obj=policies_obj,
-            rendering_obj=rendering_obj,
-            capability_mapping_obj=capability_mapping_obj,
-            warnings=warnings,
-            errors=errors,
-            signals_obj=[],
-        )
+        try:
+            spec = validate_course_dict(raw, source_course_yml=p, lazy_bodies=True)
+        except Exception as e:
+            errors.append(ExplainError(code="COURSE_YML_INVALID", message=str(e), path=path_arg))
+            return _finalise_explain(
+                engine_version=engine_version,
+                command=command,
+                input_obj=input_obj,
+                course_obj=course_obj,
+                structure_obj=structure_obj,
+                sources_obj=sources_obj,
+                policies_obj=policies_obj,
+                rendering_obj=rendering_obj,
+                capability_mapping_obj=capability_mapping_obj,
+                warnings=warnings,
+                errors=errors,
+                signals_obj=[],
+            )
+
+        course_cache.store(p, data_bytes, raw, spec, lazy=True)
 
     # v1.13: compute absence signals (informational, deterministic)
     signals_obj = _sort_signals([s.to_dict() for s in compute_signals(spec)])
@@ -400,6 +433,7 @@ def explain_course_yml(
                 # v1.6+ lesson-level source
                 lesson_src = getattr(lesson, "source", None)
                 if isinstance(lesson_src, str) and lesson_src.strip():
+                    first_block = (getattr(lesson, "content_blocks", None) or [None])[0]
                     missing_count += _record_source_provenance(
                         course_yml_path=p,
                         declared_path=lesson_src,
@@ -409,6 +443,7 @@ def explain_course_yml(
                         file_index=file_index,
                         resolution_rows=resolution_rows,
                         warnings=warnings,
+                        known=getattr(first_block, "body_source", None),
                     )
 
                 cb = getattr(lesson, "content_blocks", []) or []
@@ -497,9 +532,24 @@ def explain_course_yml(
         ),
     )
 
+    # Files merged into structure.modules via `include:` (declaration order).
+    sources_obj["includes"] = [
+        {
+            "declared_path": inc.path,
+            "resolved_path": inc.resolved_path,
+            "path_normalised": normalise_path_str(inc.resolved_path),
+            "kind": inc.kind,
+            "module_id": inc.module_id,
+            "bytes": inc.bytes,
+            "hash_sha256": inc.sha256,
+        }
+        for inc in getattr(spec, "includes", None) or []
+    ]
+
     sources_obj["counts"] = {
         "files": len(sources_obj["files"]),
         "missing": int(missing_count),
+        "includes": len(sources_obj["includes"]),
     }
 
     # capability mapping presence (informational)
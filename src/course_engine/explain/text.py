@@ -140,6 +140,15 @@ def explain_payload_to_text(payload: Dict[str, Any]) -> str:
         sample_paths = sorted(sample_paths)[:12]
         lines.append("  Sample files:")
         lines.extend(_bullet(sample_paths, indent=4))
+
+    included = [
+        str(f.get("declared_path"))
+        for f in (sources.get("includes") or [])
+        if isinstance(f, dict) and f.get("declared_path")
+    ]
+    if included:
+        lines.append("  Included files:")
+        lines.extend(_bullet(included, indent=4))
     lines.append("")
 
     lines.append("5. Governance Signals")
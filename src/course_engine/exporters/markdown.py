@@ -218,11 +218,10 @@ def build_markdown_package(spec: CourseSpec, out_root: Path) -> Path:
 
     for module in spec.modules:
         mod_lines = [f"# {module.title}\n", "## Lessons\n"]
-        for item in nav.flat_lessons:
-            if item.module_id == module.id:
-                # link to lesson md file (same filename, but .md)
-                lesson_filename = item.href.split("/")[-1].replace(".qmd", ".md")
-                mod_lines.append(f"- [{item.lesson_title}](../lessons/{lesson_filename})")
+        for item in nav.lessons_by_module.get(module.id, []):
+            # link to lesson md file (same filename, but .md)
+            lesson_filename = item.href.split("/")[-1].replace(".qmd", ".md")
+            mod_lines.append(f"- [{item.lesson_title}](../lessons/{lesson_filename})")
         mod_lines.append("")
 
         module_slug = module.title.lower().replace(" ", "-")
@@ -231,14 +230,7 @@ def build_markdown_package(spec: CourseSpec, out_root: Path) -> Path:
 
     # Lessons
     for item in nav.flat_lessons:
-        module_obj = next((m for m in spec.modules if m.id == item.module_id), None)
-        if not module_obj:
-            continue
-
-        lesson_obj = next(
-            (lesson for lesson in module_obj.lessons if lesson.id == item.lesson_id),
-            None,
-        )
+        lesson_obj = nav.lesson_by_key.get((item.module_id, item.lesson_id))
         if not lesson_obj:
             continue
 
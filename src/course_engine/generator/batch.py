@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Literal, Optional
+
+from .. import __version__
+from ..exporters.markdown import build_markdown_package
+from ..plugins import BuildContext, load_plugins
+from ..utils.course_context import CourseContext
+from ..utils.fileops import track_writes
+from ..utils.manifest import write_manifest
+from .build import build_quarto_project
+from .html_single import build_html_single_project
+from .templates import get_env, precompile_templates
+
+BATCH_SUMMARY_VERSION = "1"
+COURSE_FILENAME = "course.yml"
+
+BatchFormat = Literal["quarto", "markdown", "html-single"]
+BATCH_FORMATS: tuple[str, ...] = ("quarto", "markdown", "html-single")
+
+
+@dataclass(frozen=True)
+class CourseBuildResult:
+    """Outcome of building one course in a batch (JSON-serialisable via asdict)."""
+
+    course_yml: str
+    status: Literal["ok", "error"]
+    seconds: float
+    course_id: Optional[str] = None
+    out_dir: Optional[str] = None
+    manifest: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+def discover_course_files(root: Path) -> list[Path]:
+    """
+    Find every course.yml under root (sorted; hidden and `_`-prefixed directories skipped).
+    A path to a single file is returned as-is.
+    """
+    root = Path(root)
+    if root.is_file():
+        return [root]
+
+    found: list[Path] = []
+    for p in sorted(root.rglob(COURSE_FILENAME)):
+        rel_parts = p.relative_to(root).parts[:-1]
+        if any(part.startswith((".", "_")) for part in rel_parts):
+            continue
+        if p.is_file():
+            found.append(p)
+    return found
+
+
+def read_course_list(list_file: Path) -> list[Path]:
+    """
+    Read course.yml paths from a text file (one per line; blank lines and `#` comments
+    ignored). Relative paths are resolved against the list file's directory.
+    """
+    list_file = Path(list_file)
+    base = list_file.parent
+    paths: list[Path] = []
+    for raw in list_file.read_text(encoding="utf-8").splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        p = Path(line).expanduser()
+        paths.append(p if p.is_absolute() else base / p)
+    return paths
+
+
+def _output_dir_for(course_id: str, out_root: Path, output_format: str) -> Path:
+    if output_format == "markdown":
+        return out_root / f"{course_id}-markdown"
+    if output_format == "html-single":
+        return out_root / f"{course_id}-handout"
+    return out_root / course_id
+
+
+def build_one_course(
+    course_yml: Path,
+    *,
+    out_root: Path,
+    templates_dir: Path,
+    output_format: BatchFormat = "quarto",
+    overwrite: bool = False,
+    incremental: bool = False,
+) -> CourseBuildResult:
+    """
+    Build one course and write its manifest. Never raises: any failure is captured in
+    the returned result so one broken course cannot abort the batch.
+    """
+    course_yml = Path(course_yml)
+    started = time.perf_counter()
+    course_id: Optional[str] = None
+    try:
+        course_ctx = CourseContext.load(course_yml)
+        spec = course_ctx.spec
+        course_id = spec.id
+
+        target = _output_dir_for(spec.id, out_root, output_format)
+        reuse = incremental and output_format == "quarto"
+        if target.exists() and not (overwrite or reuse):
+            raise FileExistsError(
+                f"Target output folder already exists: {target} (pass --overwrite)"
+            )
+
+        if output_format == "quarto":
+            ctx = BuildContext()
+            plugins = load_plugins()
+            for plg in plugins:
+                plg.pre_build(spec, ctx)
+
+            with track_writes() as writes:
+                out_dir = build_quarto_project(
+                    spec, out_root=out_root, templates_dir=templates_dir, incremental=incremental
+                )
+
+            for plg in plugins:
+                plg.post_build(spec, ctx, out_dir)
+        elif output_format == "markdown":
+            with track_writes() as writes:
+                out_dir = build_markdown_package(spec, out_root=out_root)
+        elif output_format == "html-single":
+            with track_writes() as writes:
+                out_dir = build_html_single_project(spec, out_root=out_root, templates_dir=templates_dir)
+        else:
+            raise ValueError(f"Unsupported batch format: {output_format}")
+
+        mp = write_manifest(
+            spec=spec,
+            out_dir=out_dir,
+            output_format=output_format,
+            source_course_yml=course_yml,
+            include_hashes=True,
+            context=course_ctx,
+            writes=writes,
+        )
+    except Exception as e:  # noqa: BLE001 (intentional: isolate per-course failures)
+        return CourseBuildResult(
+            course_yml=str(course_yml),
+            status="error",
+            seconds=round(time.perf_counter() - started, 4),
+            course_id=course_id,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+    return CourseBuildResult(
+        course_yml=str(course_yml),
+        status="ok",
+        seconds=round(time.perf_counter() - started, 4),
+        course_id=course_id,
+        out_dir=str(out_dir),
+        manifest=str(mp),
+    )
+
+
+def _init_batch_worker(templates_dir: Path) -> None:
+    # Load the shared environment once per worker; templates come from the on-disk
+    # bytecode cache warmed by the parent.
+    get_env(templates_dir)
+
+
+def build_many(
+    course_files: Iterable[Path],
+    *,
+    out_root: Path,
+    templates_dir: Path,
+    output_format: BatchFormat = "quarto",
+    jobs: int = 1,
+    overwrite: bool = False,
+    incremental: bool = False,
+) -> list[CourseBuildResult]:
+    """
+    Build many courses, returning one result per input in input order.
+
+    Templates are precompiled once up front; with jobs > 1 courses are built in a
+    process pool whose workers share the on-disk template bytecode cache.
+    """
+    files = [Path(p) for p in course_files]
+    out_root = Path(out_root)
+    kwargs: dict[str, Any] = dict(
+        out_root=out_root,
+        templates_dir=templates_dir,
+        output_format=output_format,
+        overwrite=overwrite,
+        incremental=incremental,
+    )
+
+    if output_format != "markdown":
+        precompile_templates(templates_dir)
+
+    workers = min(max(1, jobs), len(files))
+    if workers <= 1:
+        return [build_one_course(p, **kwargs) for p in files]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_batch_worker,
+        initargs=(templates_dir,),
+    ) as pool:
+        futures: list[Future[CourseBuildResult]] = [
+            pool.submit(build_one_course, p, **kwargs) for p in files
+        ]
+        return [f.result() for f in futures]
+
+
+def batch_summary(
+    results: list[CourseBuildResult],
+    *,
+    output_format: str,
+    out_root: Path,
+    jobs: int,
+    seconds: float,
+) -> dict[str, Any]:
+    """Aggregated machine-readable summary for `course-engine build-many`."""
+    failed = sum(1 for r in results if not r.ok)
+    return {
+        "batch_summary_version": BATCH_SUMMARY_VERSION,
+        "engine": {"name": "course-engine", "version": __version__},
+        "format": output_format,
+        "out_root": str(out_root),
+        "jobs": jobs,
+        "cpu_count": os.cpu_count(),
+        "seconds": round(seconds, 4),
+        "total": len(results),
+        "ok": len(results) - failed,
+        "failed": failed,
+        "courses": [asdict(r) for r in results],
+    }
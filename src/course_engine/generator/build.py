@@ -1,93 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+import hashlib
 import re
-import shutil
-import subprocess
-import tempfile
-from typing import Optional
+from typing import Any, Literal, Optional
+
+from jinja2 import Environment, Template
 
 from ..model import CourseSpec, Module, Lesson
+from ..utils.build_state import (
+    fingerprint,
+    load_build_state,
+    spec_meta,
+    write_build_state,
+)
 from ..utils.fileops import ensure_empty_dir, write_text
+from ..utils.preflight import require_pdf_toolchain as _require_pdf_toolchain
+from ..utils.preflight import require_quarto as _require_quarto
 from .templates import get_env
 
 
-# Cache PDF preflight per process
-_PDF_PREFLIGHT_OK: Optional[bool] = None
-
-
-def _require_quarto() -> None:
-    """Fail fast if Quarto is not installed."""
-    if shutil.which("quarto") is None:
-        raise RuntimeError(
-            "Quarto not found.\n\n"
-            "Install Quarto and ensure `quarto` is on PATH.\n"
-            "Quarto: https://quarto.org/"
-        )
-
-
-def _require_pdf_toolchain() -> None:
-    """
-    Fail fast if PDF rendering is not available.
-
-    Uses a minimal Quarto->PDF smoke test rather than parsing `quarto check`
-    output (which can vary).
-    """
-    global _PDF_PREFLIGHT_OK
-
-    if _PDF_PREFLIGHT_OK is True:
-        return
-
-    _require_quarto()
-
-    with tempfile.TemporaryDirectory(prefix="course-engine-pdf-check-") as td:
-        tdir = Path(td)
-
-        (tdir / "index.qmd").write_text(
-            "# PDF preflight\n\nIf you can read this, PDF rendering works.\n",
-            encoding="utf-8",
-        )
-
-        (tdir / "_quarto.yml").write_text(
-            "project:\n"
-            "  type: default\n"
-            "\n"
-            "format:\n"
-            "  pdf:\n"
-            "    toc: false\n"
-            "execute:\n"
-            "  echo: false\n",
-            encoding="utf-8",
-        )
-
-        cmd = ["quarto", "render", str(tdir)]
-        completed = subprocess.run(cmd, capture_output=True, text=True)
-
-        if completed.returncode != 0:
-            _PDF_PREFLIGHT_OK = False
-
-            stderr = (completed.stderr or "").strip()
-            stdout = (completed.stdout or "").strip()
-            details = stderr if stderr else stdout
-
-            msg = (
-                "PDF output requires a LaTeX toolchain.\n\n"
-                "Recommended fix (one-time):\n"
-                "  quarto install tinytex\n\n"
-                "Then retry your command.\n"
-            )
-
-            # Add short diagnostic tail for debugging
-            if details:
-                tail = "\n".join(details.splitlines()[-25:])
-                msg += "\n---\nQuarto/LaTeX details (tail):\n" + tail + "\n"
-
-            raise RuntimeError(msg)
-
-    _PDF_PREFLIGHT_OK = True
-
-
 def slugify(text: str) -> str:
     s = text.lower().strip()
     s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
@@ -122,18 +56,35 @@ class CourseNav:
     - lessons index generation
     - next/previous links
     - future exports/manifests/plugin checks
+
+    Precomputed indexes keep every template/exporter lookup O(1):
+    - lessons_by_module: module id -> nav items (nav order)
+    - module_by_id / lesson_by_key: first declared module / lesson per id
+    - prev_by_href / next_by_href: neighbours in flat nav order
     """
 
     modules: list[Module]
     flat_lessons: list[LessonNavItem]
     href_to_module_lesson: dict[str, tuple[Module, Lesson]]
 
+    lessons_by_module: dict[str, list[LessonNavItem]] = field(default_factory=dict)
+    module_by_id: dict[str, Module] = field(default_factory=dict)
+    lesson_by_key: dict[tuple[str, str], Lesson] = field(default_factory=dict)
+    prev_by_href: dict[str, Optional[LessonNavItem]] = field(default_factory=dict)
+    next_by_href: dict[str, Optional[LessonNavItem]] = field(default_factory=dict)
+
 
 def build_course_nav(spec: CourseSpec) -> CourseNav:
     flat: list[LessonNavItem] = []
     href_map: dict[str, tuple[Module, Lesson]] = {}
+    by_module: dict[str, list[LessonNavItem]] = {}
+    module_by_id: dict[str, Module] = {}
+    lesson_by_key: dict[tuple[str, str], Lesson] = {}
 
     for module in spec.modules:
+        module_by_id.setdefault(module.id, module)
+        module_items = by_module.setdefault(module.id, [])
+
         for lesson in module.lessons:
             filename = f"{module.id}-{lesson.id}-{slugify(lesson.title)}.qmd"
             href = f"lessons/{filename}"
@@ -154,9 +105,167 @@ def build_course_nav(spec: CourseSpec) -> CourseNav:
                 href=href,
             )
             flat.append(item)
+            module_items.append(item)
             href_map[href] = (module, lesson)
+            lesson_by_key.setdefault((module.id, lesson.id), lesson)
+
+    prev_by_href: dict[str, Optional[LessonNavItem]] = {}
+    next_by_href: dict[str, Optional[LessonNavItem]] = {}
+    for i, item in enumerate(flat):
+        prev_by_href[item.href] = flat[i - 1] if i > 0 else None
+        next_by_href[item.href] = flat[i + 1] if i < (len(flat) - 1) else None
+
+    return CourseNav(
+        modules=spec.modules,
+        flat_lessons=flat,
+        href_to_module_lesson=href_map,
+        lessons_by_module=by_module,
+        module_by_id=module_by_id,
+        lesson_by_key=lesson_by_key,
+        prev_by_href=prev_by_href,
+        next_by_href=next_by_href,
+    )
+
+
+LessonJob = tuple[LessonNavItem, Module, Lesson, Optional[LessonNavItem], Optional[LessonNavItem]]
+JobsBackend = Literal["thread", "process"]
+
+
+def _lesson_jobs(nav: CourseNav) -> list[LessonJob]:
+    """Lesson pages in nav order, each with its prev/next neighbours."""
+    out: list[LessonJob] = []
+    for item in nav.flat_lessons:
+        module, lesson = nav.href_to_module_lesson[item.href]
+        out.append((item, module, lesson, nav.prev_by_href[item.href], nav.next_by_href[item.href]))
+    return out
 
-    return CourseNav(modules=spec.modules, flat_lessons=flat, href_to_module_lesson=href_map)
+
+def _write_lesson(
+    template: Template,
+    spec: CourseSpec,
+    nav: CourseNav,
+    out_dir: Path,
+    job: LessonJob,
+) -> str:
+    item, module, lesson, prev_item, next_item = job
+
+    # IMPORTANT:
+    # - `current` now includes lesson_display_label + lesson_nav_title
+    # - We still pass `module` and `lesson` to avoid breaking existing templates.
+    write_text(
+        out_dir / item.href,
+        template.render(
+            spec=spec,
+            nav=nav,
+            module=module,
+            lesson=lesson,
+            current=item,
+            prev_item=prev_item,
+            next_item=next_item,
+        ),
+    )
+    return item.href
+
+
+# Per-process state for the "process" backend (set once by the pool initializer).
+_WORKER: dict[str, Any] = {}
+
+
+def _init_lesson_worker(spec: CourseSpec, templates_dir: Path, out_dir: Path) -> None:
+    nav = build_course_nav(spec)
+    _WORKER.update(
+        spec=spec,
+        nav=nav,
+        out_dir=out_dir,
+        template=get_env(templates_dir).get_template("lesson.qmd.j2"),
+        jobs={job[0].href: job for job in _lesson_jobs(nav)},
+    )
+
+
+def _write_lesson_in_worker(href: str) -> str:
+    w = _WORKER
+    return _write_lesson(w["template"], w["spec"], w["nav"], w["out_dir"], w["jobs"][href])
+
+
+def _write_lessons(
+    todo: list[LessonJob],
+    *,
+    spec: CourseSpec,
+    nav: CourseNav,
+    env: Environment,
+    out_dir: Path,
+    templates_dir: Path,
+    jobs: int,
+    backend: JobsBackend,
+) -> None:
+    """
+    Render and write lesson pages, serially or through a worker pool.
+
+    Errors are deterministic: whichever backend is used, the exception raised is
+    the one from the first failing lesson in nav order (as in the serial path).
+    """
+    if backend not in ("thread", "process"):
+        raise ValueError(f"Unknown jobs backend: {backend!r} (expected 'thread' or 'process')")
+
+    workers = min(max(1, jobs), len(todo))
+    if workers <= 1:
+        template = env.get_template("lesson.qmd.j2")
+        for job in todo:
+            _write_lesson(template, spec, nav, out_dir, job)
+        return
+
+    pool: Executor
+    if backend == "process":
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_lesson_worker,
+            initargs=(spec, Path(templates_dir), out_dir),
+        )
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    try:
+        if backend == "process":
+            futures = [pool.submit(_write_lesson_in_worker, job[0].href) for job in todo]
+        else:
+            template = env.get_template("lesson.qmd.j2")
+            futures = [pool.submit(_write_lesson, template, spec, nav, out_dir, job) for job in todo]
+
+        # Collect in nav order so the first failure reported is deterministic.
+        for fut in futures:
+            fut.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _template_sha256(env: Environment, name: str) -> str:
+    source, _, _ = env.loader.get_source(env, name)  # type: ignore[union-attr]
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _nav_slice(nav: CourseNav) -> dict:
+    """Navigation facts shared by the project-level pages (sidebar, indexes)."""
+    return {
+        "modules": [{"id": m.id, "title": m.title} for m in nav.modules],
+        "lessons": nav.flat_lessons,
+    }
+
+
+def _orphaned_lessons(out_dir: Path, expected: set[str], previous: dict[str, str]) -> list[str]:
+    """
+    Lesson pages on disk (or recorded by the previous build) that the current
+    nav no longer produces.
+    """
+    orphans = {rel for rel in previous if rel.startswith("lessons/") and rel not in expected}
+
+    lessons_dir = out_dir / "lessons"
+    if lessons_dir.is_dir():
+        for p in lessons_dir.glob("*.qmd"):
+            rel = f"lessons/{p.name}"
+            if rel not in expected:
+                orphans.add(rel)
+
+    return sorted(rel for rel in orphans if (out_dir / rel).is_file())
 
 
 def build_quarto_project(
@@ -165,6 +274,9 @@ def build_quarto_project(
     templates_dir: Path,
     *,
     preflight_pdf: bool = False,
+    incremental: bool = False,
+    jobs: int = 1,
+    jobs_backend: JobsBackend = "thread",
 ) -> Path:
     """
     Build a multi-page Quarto website project for a course.
@@ -175,6 +287,16 @@ def build_quarto_project(
         templates_dir: Directory containing Jinja templates.
         preflight_pdf: If True, run a PDF toolchain preflight check and fail fast
                        with a friendly TinyTeX instruction if PDF is unavailable.
+        incremental: If True, keep the existing project directory and only rewrite
+                     outputs whose input fingerprint changed since the last build
+                     (recorded in the build-state file). Unchanged files keep their
+                     mtimes, so Quarto's own change detection still works.
+                     Orphaned lesson pages are deleted.
+        jobs: Number of workers used to render and write lesson pages. 1 keeps
+              the serial path; output is byte-identical either way.
+        jobs_backend: "thread" (shared template environment; best for I/O) or
+                      "process" (each worker compiles templates once; best when
+                      template rendering is CPU-bound).
 
     Returns:
         Path to the built Quarto project directory.
@@ -185,49 +307,84 @@ def build_quarto_project(
         _require_quarto()
 
     out_dir = out_root / spec.id
-    ensure_empty_dir(out_dir)
 
-    env = get_env(templates_dir)
-    nav = build_course_nav(spec)
-
-    # Core project files
-    write_text(out_dir / "_quarto.yml", env.get_template("_quarto.yml.j2").render(spec=spec, nav=nav))
-    write_text(out_dir / "index.qmd", env.get_template("index.qmd.j2").render(spec=spec, nav=nav))
+    state = load_build_state(out_dir) if incremental else None
+    if incremental:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        ensure_empty_dir(out_dir)
 
-    # Lessons index page (so "Lessons" is a real destination)
-    # This template should create links to each lesson using item.href (already includes "lessons/...")
-    write_text(
-        out_dir / "lessons" / "index.qmd",
-        env.get_template("lessons_index.qmd.j2").render(spec=spec, nav=nav),
-    )
+    previous: dict[str, str] = dict(state["outputs"]) if state else {}
+    pending: list[str] = list(state.get("pending_render") or []) if state else []
 
-    # Lesson pages + prev/next links
-    lesson_template = env.get_template("lesson.qmd.j2")
+    env = get_env(templates_dir)
+    nav = build_course_nav(spec)
+    meta = spec_meta(spec)
 
-    # Map href -> index so we can compute prev/next reliably
-    href_to_idx = {item.href: i for i, item in enumerate(nav.flat_lessons)}
+    outputs: dict[str, str] = {}
+    written: list[str] = []
 
-    for item in nav.flat_lessons:
-        i = href_to_idx[item.href]
-        prev_item = nav.flat_lessons[i - 1] if i > 0 else None
-        next_item = nav.flat_lessons[i + 1] if i < (len(nav.flat_lessons) - 1) else None
+    def is_current(rel: str, fp: str) -> bool:
+        outputs[rel] = fp
+        return previous.get(rel) == fp and (out_dir / rel).is_file()
 
-        module, lesson = nav.href_to_module_lesson[item.href]
+    # Core project files
+    nav_slice = _nav_slice(nav)
+    for rel, tpl_name in (
+        ("_quarto.yml", "_quarto.yml.j2"),
+        ("index.qmd", "index.qmd.j2"),
+        # Lessons index page (so "Lessons" is a real destination)
+        # This template should create links to each lesson using item.href (already includes "lessons/...")
+        ("lessons/index.qmd", "lessons_index.qmd.j2"),
+    ):
+        fp = fingerprint(_template_sha256(env, tpl_name), meta, nav_slice)
+        if not is_current(rel, fp):
+            write_text(out_dir / rel, env.get_template(tpl_name).render(spec=spec, nav=nav))
+            written.append(rel)
 
-        # IMPORTANT:
-        # - `current` now includes lesson_display_label + lesson_nav_title
-        # - We still pass `module` and `lesson` to avoid breaking existing templates.
-        write_text(
-            out_dir / item.href,
-            lesson_template.render(
-                spec=spec,
-                nav=nav,
-                module=module,
-                lesson=lesson,
-                current=item,
-                prev_item=prev_item,
-                next_item=next_item,
-            ),
+    # Lesson pages + prev/next links
+    lesson_tpl_sha = _template_sha256(env, "lesson.qmd.j2")
+    jobs_todo: list[LessonJob] = []
+
+    for job in _lesson_jobs(nav):
+        item, module, lesson, prev_item, next_item = job
+
+        # The fingerprint covers exactly what a lesson page depends on:
+        # course-level spec slice, module heading, lesson, template and nav neighbours.
+        fp = fingerprint(
+            lesson_tpl_sha,
+            meta,
+            {"id": module.id, "title": module.title},
+            lesson,
+            item,
+            prev_item,
+            next_item,
         )
+        if not is_current(item.href, fp):
+            jobs_todo.append(job)
+
+    _write_lessons(
+        jobs_todo,
+        spec=spec,
+        nav=nav,
+        env=env,
+        out_dir=out_dir,
+        templates_dir=templates_dir,
+        jobs=jobs,
+        backend=jobs_backend,
+    )
+    written.extend(job[0].href for job in jobs_todo)
+
+    removed = _orphaned_lessons(out_dir, set(outputs), previous) if incremental else []
+    for rel in removed:
+        (out_dir / rel).unlink()
+
+    write_build_state(
+        out_dir,
+        outputs=outputs,
+        written=written,
+        removed=removed,
+        pending_render=[p for p in pending + written if p in outputs],
+    )
 
     return out_dir
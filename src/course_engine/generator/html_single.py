@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from ..model import CourseSpec
-from ..utils.fileops import ensure_empty_dir, write_text
+from ..utils.fileops import ensure_empty_dir, write_stream, write_text
 from .build import build_course_nav  # reuse your canonical nav model
 from .templates import get_env
 
@@ -20,6 +20,8 @@ def build_html_single_project(spec: CourseSpec, out_root: Path, templates_dir: P
     nav = build_course_nav(spec)
 
     write_text(out_dir / "_quarto.yml", env.get_template("_handout_quarto.yml.j2").render(spec=spec, nav=nav))
-    write_text(out_dir / "index.qmd", env.get_template("handout_index.qmd.j2").render(spec=spec, nav=nav))
+    # The handout holds the whole course: stream it to disk instead of rendering
+    # one giant string (keeps memory flat for very large handbooks / PDFs).
+    write_stream(out_dir / "index.qmd", env.get_template("handout_index.qmd.j2").generate(spec=spec, nav=nav))
 
     return out_dir
@@ -1,87 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 import subprocess
 from typing import Optional
-import shutil
-import tempfile
 
-# Cache PDF preflight result per process to avoid re-checking repeatedly.
-_PDF_PREFLIGHT_OK: Optional[bool] = None
-
-
-def _require_quarto() -> None:
-    """Fail fast if Quarto is not installed."""
-    if shutil.which("quarto") is None:
-        raise RuntimeError(
-            "Quarto not found.\n\n"
-            "Install Quarto and ensure `quarto` is on PATH.\n"
-            "Quarto: https://quarto.org/"
-        )
-
-
-def _require_pdf_toolchain() -> None:
-    """
-    Fail fast if PDF rendering is not available.
-
-    We avoid parsing `quarto check` output (can vary across versions) and instead
-    perform a minimal Quarto->PDF smoke test in a temporary directory.
-    """
-    global _PDF_PREFLIGHT_OK
-
-    if _PDF_PREFLIGHT_OK is True:
-        return
-
-    _require_quarto()
-
-    with tempfile.TemporaryDirectory(prefix="course-engine-pdf-check-") as td:
-        tdir = Path(td)
-
-        # Minimal QMD
-        (tdir / "index.qmd").write_text(
-            "# PDF preflight\n\nIf you can read this, PDF rendering works.\n",
-            encoding="utf-8",
-        )
-
-        # Minimal Quarto config forcing PDF format
-        (tdir / "_quarto.yml").write_text(
-            "project:\n"
-            "  type: default\n"
-            "\n"
-            "format:\n"
-            "  pdf:\n"
-            "    toc: false\n"
-            "execute:\n"
-            "  echo: false\n",
-            encoding="utf-8",
-        )
-
-        # Attempt render
-        cmd = ["quarto", "render", str(tdir)]
-        completed = subprocess.run(cmd, capture_output=True, text=True)
-
-        if completed.returncode != 0:
-            _PDF_PREFLIGHT_OK = False
-
-            stderr = (completed.stderr or "").strip()
-            stdout = (completed.stdout or "").strip()
-            details = stderr if stderr else stdout
-
-            msg = (
-                "PDF output requires a LaTeX toolchain.\n\n"
-                "Recommended fix (one-time):\n"
-                "  quarto install tinytex\n\n"
-                "Then retry your command.\n"
-            )
-
-            # Provide a short tail of diagnostic output (helpful, not overwhelming)
-            if details:
-                tail = "\n".join(details.splitlines()[-25:])
-                msg += "\n---\nQuarto/LaTeX details (tail):\n" + tail + "\n"
-
-            raise RuntimeError(msg)
-
-    _PDF_PREFLIGHT_OK = True
+from ..utils.build_state import clear_pending_render, load_build_state
+from ..utils.preflight import require_pdf_toolchain as _require_pdf_toolchain
+from ..utils.preflight import require_quarto as _require_quarto
 
 
 def render_quarto(
@@ -151,3 +78,205 @@ def render_quarto(
             ) from e
 
         raise RuntimeError(f"Quarto render failed with exit code {e.returncode}.") from e
+
+
+def changed_render_inputs(project_dir: Path) -> Optional[list[str]]:
+    """
+    Inputs that need rendering since the last render, from the build state.
+
+    Returns:
+        A (possibly empty) list of `.qmd` paths relative to project_dir, or None
+        when only a full render is safe: no build state, or `_quarto.yml`
+        changed (site-wide navigation/config).
+
+    Index and lesson pages whose navigation changed are already included:
+    the build rewrites them (and records them as pending) whenever their nav
+    inputs change.
+    """
+    state = load_build_state(Path(project_dir))
+    if state is None:
+        return None
+
+    pending = list(state.get("pending_render") or [])
+    if "_quarto.yml" in pending:
+        return None
+
+    return sorted(p for p in pending if p.endswith(".qmd"))
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """Outcome of one `quarto render <file>` invocation."""
+
+    input_file: str  # relative to the project dir
+    returncode: int
+    stdout: str
+    stderr: str
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+@dataclass(frozen=True)
+class RenderShard:
+    """One worker's share of a parallel render (files rendered in order)."""
+
+    index: int
+    results: list[RenderResult]
+
+    @property
+    def stdout(self) -> str:
+        return "".join(f"--- {r.input_file}\n{r.stdout}" for r in self.results if r.stdout)
+
+    @property
+    def stderr(self) -> str:
+        return "".join(f"--- {r.input_file}\n{r.stderr}" for r in self.results if r.stderr)
+
+
+class RenderFailed(RuntimeError):
+    """Raised by a parallel render when one or more inputs failed to render."""
+
+    def __init__(self, shards: list[RenderShard]):
+        self.shards = shards
+        self.results = [r for shard in shards for r in shard.results]
+        self.failures = sorted((r for r in self.results if not r.ok), key=lambda r: r.input_file)
+
+        lines = [f"Quarto render failed for {len(self.failures)} of {len(self.results)} input(s):"]
+        for r in self.failures:
+            details = (r.stderr or r.stdout).strip()
+            tail = "\n".join(details.splitlines()[-10:]) if details else ""
+            lines.append(f"\n- {r.input_file} (exit code {r.returncode})")
+            if tail:
+                lines.append(tail)
+        super().__init__("\n".join(lines))
+
+
+def project_render_inputs(project_dir: Path) -> list[str]:
+    """
+    All `.qmd` inputs of a Quarto project, relative to project_dir, sorted.
+
+    Mirrors Quarto's own input rules: files and directories starting with
+    `_` or `.` (e.g. `_site/`, `.quarto/`, `_freeze/`) are not inputs.
+    """
+    project_dir = Path(project_dir)
+    out: list[str] = []
+    for p in sorted(project_dir.rglob("*.qmd")):
+        rel = p.relative_to(project_dir)
+        if any(part.startswith(("_", ".")) for part in rel.parts):
+            continue
+        out.append(rel.as_posix())
+    return out
+
+
+def _render_one(project_dir: Path, rel: str, to: Optional[str]) -> RenderResult:
+    # Rendering a file inside the project keeps Quarto's project context (_quarto.yml).
+    cmd = ["quarto", "render", str(project_dir / rel)]
+    if to:
+        cmd.extend(["--to", to])
+
+    try:
+        completed = subprocess.run(cmd, text=True, capture_output=True)
+    except FileNotFoundError as e:
+        return RenderResult(input_file=rel, returncode=127, stdout="", stderr=str(e))
+
+    return RenderResult(
+        input_file=rel,
+        returncode=completed.returncode,
+        stdout=completed.stdout or "",
+        stderr=completed.stderr or "",
+    )
+
+
+def _render_shard(project_dir: Path, index: int, files: list[str], to: Optional[str]) -> RenderShard:
+    return RenderShard(index=index, results=[_render_one(project_dir, rel, to) for rel in files])
+
+
+def render_quarto_parallel(
+    project_dir: Path,
+    *,
+    jobs: int,
+    inputs: Optional[list[str]] = None,
+    to: Optional[str] = None,
+) -> list[RenderShard]:
+    """
+    Render project inputs with up to `jobs` concurrent `quarto render <file>` processes.
+
+    Inputs are sharded round-robin across workers; each worker renders its files
+    in order. Every file is attempted, output is captured per file/shard, and all
+    failures are reported together via RenderFailed.
+
+    Args:
+        project_dir: Path to the Quarto project folder (contains _quarto.yml).
+        jobs: Number of concurrent Quarto processes.
+        inputs: Inputs relative to project_dir (default: all project inputs).
+        to: Optional output format override.
+
+    Note:
+        Per-file renders skip work Quarto only does for whole-project renders;
+        use a serial full render for the final release build if needed.
+    """
+    project_dir = Path(project_dir)
+
+    if to == "pdf":
+        _require_pdf_toolchain()
+    else:
+        _require_quarto()
+
+    files = project_render_inputs(project_dir) if inputs is None else list(inputs)
+    n = max(1, min(jobs, len(files)))
+    shard_files = [files[i::n] for i in range(n)]
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [
+            pool.submit(_render_shard, project_dir, i, fs, to) for i, fs in enumerate(shard_files)
+        ]
+        shards = [f.result() for f in futures]
+
+    if any(not r.ok for shard in shards for r in shard.results):
+        raise RenderFailed(shards)
+
+    return shards
+
+
+def render_quarto_changed(
+    project_dir: Path,
+    *,
+    to: Optional[str] = None,
+    jobs: int = 1,
+) -> Optional[list[str]]:
+    """
+    Render only the inputs the build rewrote since the last render.
+
+    Falls back to a full project render when changed_render_inputs() says so.
+    With jobs > 1, inputs are rendered through render_quarto_parallel().
+
+    Returns:
+        The inputs rendered (relative to project_dir), or None if a full
+        render was performed.
+    """
+    project_dir = Path(project_dir)
+    inputs = changed_render_inputs(project_dir)
+
+    if inputs is None:
+        if jobs > 1:
+            render_quarto_parallel(project_dir, jobs=jobs, to=to)
+        else:
+            render_quarto(project_dir, to=to)
+        clear_pending_render(project_dir)
+        return None
+
+    if jobs > 1 and inputs:
+        try:
+            render_quarto_parallel(project_dir, jobs=jobs, inputs=inputs, to=to)
+        except RenderFailed as e:
+            clear_pending_render(project_dir, [r.input_file for r in e.results if r.ok])
+            raise
+        clear_pending_render(project_dir, inputs)
+        return inputs
+
+    for rel in inputs:
+        render_quarto(project_dir, input_file=rel, to=to)
+        clear_pending_render(project_dir, [rel])
+
+    return inputs
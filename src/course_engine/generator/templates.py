@@ -1,10 +1,94 @@
 from __future__ import annotations
+
+import hashlib
+import os
+import threading
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Optional
+
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
+
+from ..utils.cache import cache_subdir
+
+# Process-wide registry: (resolved templates dir, template-file fingerprint) -> Environment.
+# A template edit changes the fingerprint, so callers never see stale compiled templates.
+_ENV_REGISTRY: dict[tuple[str, str], Environment] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def templates_fingerprint(templates_dir: Path) -> str:
+    """
+    SHA256 over the relative path, mtime, size and inode of every file in templates_dir.
+
+    Only stat data (from os.scandir) is used, so calling this per page stays cheap;
+    template contents are never read here.
+    """
+    h = hashlib.sha256()
+
+    def _walk(d: str, prefix: str) -> None:
+        try:
+            with os.scandir(d) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        for e in entries:
+            if e.is_dir():
+                _walk(e.path, f"{prefix}{e.name}/")
+            elif e.is_file():
+                st = e.stat()
+                h.update(f"{prefix}{e.name}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_ino}\0".encode("utf-8"))
+
+    _walk(str(templates_dir), "")
+    return h.hexdigest()
+
+
+def _bytecode_cache() -> Optional[BytecodeCache]:
+    d = cache_subdir("jinja-bytecode")
+    return FileSystemBytecodeCache(directory=str(d)) if d is not None else None
+
 
 def get_env(templates_dir: Path) -> Environment:
-    return Environment(
-        loader=FileSystemLoader(str(templates_dir)),
-        autoescape=select_autoescape(enabled_extensions=()),
-        keep_trailing_newline=True,
-    )
+    """
+    Return the shared Jinja environment for templates_dir.
+
+    Environments are cached per process and keyed by the resolved directory plus
+    a hash of its template files. Compiled templates are also persisted in an
+    on-disk bytecode cache (see utils.cache), so new processes skip compilation.
+    """
+    resolved = Path(templates_dir).resolve()
+    key = (str(resolved), templates_fingerprint(resolved))
+
+    with _REGISTRY_LOCK:
+        env = _ENV_REGISTRY.get(key)
+        if env is None:
+            # Drop environments for older versions of the same directory.
+            for stale in [k for k in _ENV_REGISTRY if k[0] == key[0]]:
+                del _ENV_REGISTRY[stale]
+
+            env = Environment(
+                loader=FileSystemLoader(str(resolved)),
+                autoescape=select_autoescape(enabled_extensions=()),
+                keep_trailing_newline=True,
+                bytecode_cache=_bytecode_cache(),
+            )
+            _ENV_REGISTRY[key] = env
+
+    return env
+
+
+def precompile_templates(templates_dir: Path) -> int:
+    """
+    Compile every template in templates_dir (warming the in-process registry and
+    the on-disk bytecode cache). Returns the number of templates compiled.
+    """
+    env = get_env(templates_dir)
+    names = env.list_templates()
+    for name in names:
+        env.get_template(name)
+    return len(names)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ..model import CourseSpec, DiscoveredLessons, IncludedFile
+from ..plugins import BuildContext, load_plugins
+from ..schema import ValidatedCourse, read_course_source, validate_course_root
+from ..utils.build_state import load_build_state
+from ..utils.course_context import CourseContext
+from ..utils.fileops import track_writes
+from ..utils.lesson_sources import LessonSource
+from ..utils import yaml_io
+from ..utils.manifest import update_manifest_after_render, write_manifest
+from .build import build_quarto_project
+from .render import render_quarto_changed
+
+
+@dataclass
+class CycleResult:
+    """What one watch cycle did (for CLI reporting and tests)."""
+
+    changed: list[str] = field(default_factory=list)
+    reparsed: bool = False
+    sources_read: int = 0
+    written: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    rendered: Optional[list[str]] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class WatchSession:
+    """
+    Incremental build (and optional render) state kept in memory across watch cycles.
+
+    Between cycles the session keeps:
+      - the validated course.yml (skipped when its bytes hash is unchanged; an
+        edited `include:` file is re-expanded without re-parsing course.yml)
+      - every lesson source (re-read only when its path changed or its
+        mtime/size moved)
+    so each cycle only pays for the inputs that actually changed. Output is
+    written through the incremental Quarto build, so only affected pages are
+    rewritten and (with render=True) re-rendered.
+    """
+
+    def __init__(
+        self,
+        course_yml: Path,
+        *,
+        out_root: Path,
+        templates_dir: Path,
+        render: bool = False,
+        to: Optional[str] = None,
+        jobs: int = 1,
+    ) -> None:
+        self.course_yml = Path(os.path.abspath(course_yml))
+        self.out_root = Path(out_root)
+        self.templates_dir = Path(templates_dir)
+        self.render = render
+        self.to = to
+        self.jobs = jobs
+
+        self.spec: Optional[CourseSpec] = None
+        self._course_sha: Optional[str] = None
+        self._course: Optional[ValidatedCourse] = None
+        self._raw: Any = None
+        self._raw_bytes = b""
+        self._includes: list[IncludedFile] = []
+        self._discovered: list[DiscoveredLessons] = []
+        self._sources: Dict[Path, tuple[tuple[int, int], LessonSource]] = {}
+        self._reads = 0
+        # to_spec prefetches sources from a thread pool.
+        self._lock = threading.Lock()
+
+    def watched_files(self) -> list[Path]:
+        """course.yml, its `include:` files and every resolved lesson `source:` path of the current spec."""
+        files = [self.course_yml]
+        files.extend(Path(os.path.abspath(i.resolved_path)) for i in self._includes)
+        if self.spec is not None:
+            for m in self.spec.modules:
+                for lesson in m.lessons:
+                    if lesson.source_resolved_path:
+                        files.append(Path(os.path.abspath(lesson.source_resolved_path)))
+        return files
+
+    def watched_dirs(self) -> list[Path]:
+        """Lesson directories expanded via `discover:` (new or removed files change the course)."""
+        return list(dict.fromkeys(Path(d.resolved_dir) for d in self._discovered))
+
+    def _read_source(self, base_dir: Path, source: str) -> LessonSource:
+        src = Path(source)
+        path = Path(os.path.abspath(src if src.is_absolute() else base_dir / src))
+        try:
+            st = path.stat()
+            key: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+
+        with self._lock:
+            cached = self._sources.get(path)
+        if cached is not None and key is not None and cached[0] == key:
+            return cached[1]
+
+        result = read_course_source(base_dir, source)
+        with self._lock:
+            self._reads += 1
+            if key is not None:
+                self._sources[path] = (key, result)
+        return result
+
+    def _load_root(self, *, reexpand: bool = False) -> bool:
+        raw = self.course_yml.read_bytes()
+        sha = hashlib.sha256(raw).hexdigest()
+        course_same = self._course is not None and sha == self._course_sha
+        if course_same and not reexpand:
+            return False
+
+        # An edited include or discovered directory only needs re-expansion, not a course.yml re-parse.
+        data: Any = self._raw if course_same else yaml_io.safe_load(raw)
+        course = validate_course_root(data, base_dir=self.course_yml.parent, read_source=self._read_source)
+        self._course = course
+        self._includes = course.includes
+        self._discovered = course.discovered
+        self._course_sha = sha
+        self._raw = data
+        self._raw_bytes = raw
+        return True
+
+    def _to_spec(self) -> CourseSpec:
+        assert self._course is not None
+        return self._course.to_spec()
+
+    def run_cycle(self, changed: Optional[set[Path]] = None) -> CycleResult:
+        """
+        Rebuild for a set of changed paths (None = initial cycle: treat everything as changed).
+
+        Errors (bad YAML, missing source, failed render) are captured in the result and
+        the previous good state is kept, so the next save can recover.
+        """
+        started = time.perf_counter()
+        result = CycleResult(changed=sorted(str(p) for p in (changed or [])))
+        self._reads = 0
+
+        try:
+            for p in changed or ():
+                self._sources.pop(Path(os.path.abspath(p)), None)
+
+            changed_abs = {Path(os.path.abspath(p)) for p in changed or ()}
+            includes_changed = any(Path(os.path.abspath(i.resolved_path)) in changed_abs for i in self._includes)
+            # Discovered titles come from the files' headings, so any change in the directory re-expands.
+            dirs = set(self.watched_dirs())
+            discovered_changed = any(p.parent in dirs for p in changed_abs)
+            if changed is None or self.course_yml in changed_abs or includes_changed or discovered_changed:
+                result.reparsed = self._load_root(reexpand=includes_changed or discovered_changed)
+
+            spec = self._to_spec()
+            result.sources_read = self._reads
+
+            ctx = BuildContext()
+            plugins = load_plugins()
+            for plg in plugins:
+                plg.pre_build(spec, ctx)
+
+            with track_writes() as writes:
+                out_dir = build_quarto_project(
+                    spec,
+                    out_root=self.out_root,
+                    templates_dir=self.templates_dir,
+                    incremental=True,
+                )
+
+            for plg in plugins:
+                plg.post_build(spec, ctx, out_dir)
+
+            self.spec = spec
+            course_ctx = CourseContext.from_parsed(self.course_yml, self._raw_bytes, self._raw, spec)
+
+            state = load_build_state(out_dir) or {}
+            result.written = list(state.get("written") or [])
+            result.removed = list(state.get("removed") or [])
+
+            if result.written or result.removed or changed is None:
+                write_manifest(
+                    spec=spec,
+                    out_dir=out_dir,
+                    output_format="quarto",
+                    source_course_yml=self.course_yml,
+                    include_hashes=True,
+                    context=course_ctx,
+                    writes=writes,
+                )
+
+            if self.render:
+                result.rendered = render_quarto_changed(out_dir, to=self.to, jobs=self.jobs)
+                if result.rendered is None or result.rendered:
+                    update_manifest_after_render(out_dir, to=self.to, inputs=result.rendered)
+        except Exception as e:  # noqa: BLE001 (intentional: keep watching after a bad edit)
+            result.error = f"{type(e).__name__}: {e}"
+
+        result.seconds = round(time.perf_counter() - started, 4)
+        return result
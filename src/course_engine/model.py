@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
 
@@ -13,7 +14,7 @@ ContentBlockType = Literal["markdown", "callout", "quiz", "reflection", "submiss
 SignalSeverity = Literal["info", "warning"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signal:
     """
     v1.13: Absence signal (governance object)
@@ -64,7 +65,7 @@ class Signal:
 SignalAction = Literal["ignore", "info", "warn", "error"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalsPolicy:
     """
     v1.13+: Policy rules for interpreting governance signals.
@@ -90,7 +91,7 @@ class SignalsPolicy:
 # v1.12+ design intent (model layer)
 # -------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DesignIntentAIPosition:
     """
     Optional, descriptive AI positioning (informational only).
@@ -100,7 +101,7 @@ class DesignIntentAIPosition:
     learning_activities: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DesignIntentFrameworkReference:
     name: str
     version: Optional[str] = None
@@ -108,7 +109,7 @@ class DesignIntentFrameworkReference:
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DesignIntentPolicyContext:
     title: str
     scope: Optional[str] = None
@@ -116,14 +117,14 @@ class DesignIntentPolicyContext:
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DesignIntentReview:
     last_reviewed: Optional[str] = None
     review_cycle: Optional[str] = None
     reflection_prompt: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DesignIntent:
     """
     v1.12+: Design intent is a governance object:
@@ -143,7 +144,7 @@ class DesignIntent:
 # v1.13+: AI scoping (governance layer)
 # -------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AIScoping:
     """
     v1.13+: Structural AI scoping metadata (informational only).
@@ -165,14 +166,39 @@ class AIScoping:
 # course content structures
 # -------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadingItem:
     title: str
     url: Optional[str] = None
     required: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class SourceBody:
+    """
+    Lesson source file behind a markdown block: path, size and hash of the raw file.
+    With metadata-only spec loading (validate_course_dict(..., lazy_bodies=True)) the
+    block body is None and the text is read here on first access.
+    """
+    path: str  # resolved path
+    bytes: int  # raw file size
+    sha256: str  # raw file hash (same value as Lesson.source_sha256)
+
+    _text: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            from .utils.lesson_sources import read_lesson_source
+
+            src = read_lesson_source(Path(self.path))
+            if src.sha256 != self.sha256:
+                raise ValueError(f"Lesson source changed since the course was loaded: {self.path}")
+            object.__setattr__(self, "_text", src.text)
+        return self._text  # type: ignore[return-value]
+
+
+@dataclass(frozen=True, slots=True)
 class ContentBlock:
     type: ContentBlockType
 
@@ -190,8 +216,18 @@ class ContentBlock:
     answer: Optional[int] = None  # 0-based index into options
     solution: Optional[str] = None  # optional explanation (render-only)
 
+    # Lesson source file for source-backed lessons (body is None when loaded lazily)
+    body_source: Optional[SourceBody] = None
+
+    @property
+    def body_text(self) -> Optional[str]:
+        """The block body, reading a lazily loaded lesson source if needed."""
+        if self.body is None and self.body_source is not None:
+            return self.body_source.text
+        return self.body
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Lesson:
     id: str
     title: str
@@ -213,7 +249,7 @@ class Lesson:
     source_resolved_path: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Module:
     id: str
     title: str
@@ -224,7 +260,7 @@ class Module:
 # capability + framework metadata
 # -------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CapabilityDomainMapping:
     """Informational mapping for a single capability domain (v1.1)."""
     label: Optional[str] = None
@@ -233,7 +269,7 @@ class CapabilityDomainMapping:
     evidence: List[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CapabilityMapping:
     """Top-level, non-enforced capability mapping metadata (v1.1)."""
     framework: Optional[str] = None
@@ -241,7 +277,7 @@ class CapabilityMapping:
     domains: Dict[str, CapabilityDomainMapping] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FrameworkAlignment:
     """
     Declared framework alignment metadata (v1.6).
@@ -253,11 +289,32 @@ class FrameworkAlignment:
     notes: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class IncludedFile:
+    """Provenance of a file pulled into structure.modules via `include:`."""
+    path: str  # as declared
+    resolved_path: str
+    sha256: str
+    bytes: int
+    kind: Literal["modules", "lessons"]
+    module_id: Optional[str] = None  # owning module for lesson includes
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveredLessons:
+    """Provenance of a module's lessons found on disk via `discover:`."""
+    path: str  # as declared
+    resolved_dir: str
+    pattern: str
+    files: List[str]  # matching file names, in lesson order
+    module_id: Optional[str] = None
+
+
 # -------------------------
 # top-level course spec
 # -------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CourseSpec:
     id: str
     title: str
@@ -287,3 +344,9 @@ class CourseSpec:
     capability_mapping: CapabilityMapping | None = None
 
     modules: List[Module] = field(default_factory=list)
+
+    # Files merged in via `include:` (provenance only)
+    includes: List[IncludedFile] = field(default_factory=list)
+
+    # Lesson directories expanded via `discover:` (provenance only)
+    discovered: List[DiscoveredLessons] = field(default_factory=list)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-import hashlib
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Callable, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, ValidationError, model_validator
 
@@ -15,43 +17,96 @@ from .model import (
     FrameworkAlignment,
     Lesson,
     Module,
+    IncludedFile,
+    DiscoveredLessons,
     ReadingItem,
+    SourceBody,
     DesignIntent,
     DesignIntentAIPosition,
     DesignIntentFrameworkReference,
     DesignIntentPolicyContext,
     DesignIntentReview,
 )
+from .utils.discovery import expand_discovered_lessons
+from .utils.includes import expand_includes
+from .utils.lesson_sources import LessonSource, first_heading, read_lesson_source
 
 Audience = Literal["learner", "instructor"]
 BlockType = Literal["markdown", "callout", "quiz", "reflection", "submission"]
 
 
-def _sha256_text(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+def _interned(values: List[str]) -> List[str]:
+    # Tags, prerequisites and domains repeat across thousands of lessons in large
+    # courses; keep one string object per distinct value.
+    return [sys.intern(v) for v in values]
 
 
 def _infer_title_from_md(md: str) -> Optional[str]:
-    for line in md.splitlines():
-        line = line.strip()
-        if line.startswith("# "):
-            title = line[2:].strip()
-            return title if title else None
-    return None
+    return first_heading(md)[1]
 
 
-def _read_lesson_source(base_dir: Path, source: str) -> tuple[str, str, str]:
+def read_course_source(base_dir: Path, source: str, *, keep_text: bool = True) -> LessonSource:
+    """The default SourceReader: read a lesson `source:` path relative to base_dir."""
     src = Path(source)
     resolved = src if src.is_absolute() else (base_dir / src)
 
     try:
-        md = resolved.read_text(encoding="utf-8")
+        return read_lesson_source(resolved, keep_text=keep_text)
     except FileNotFoundError as e:
         raise ValueError(f"Lesson source file not found: {resolved}") from e
     except Exception as e:
         raise ValueError(f"Failed to read lesson source file: {resolved} ({e})") from e
 
-    return md, _sha256_text(md), str(resolved)
+
+def _scan_lesson_source(base_dir: Path, source: str) -> LessonSource:
+    # Metadata-only read (lazy_bodies): hash, size, heading; the text is not kept.
+    return read_course_source(base_dir, source, keep_text=False)
+
+
+# (base_dir, source) -> LessonSource; see read_course_source.
+SourceReader = Callable[[Path, str], LessonSource]
+
+# Bounded concurrency for lesson source prefetch (reads are I/O-bound; on network
+# home directories each one is a round-trip).
+SOURCE_PREFETCH_WORKERS = 16
+
+
+class _SourcePrefetch:
+    """
+    Reads lesson sources concurrently ahead of spec assembly.
+
+    get() returns (or raises) exactly what read_source would have for that source,
+    so callers consume results in declaration order and errors surface at the
+    same point as a serial read.
+    """
+
+    def __init__(self, base_dir: Path, sources: List[str], read_source: SourceReader) -> None:
+        self._base_dir = base_dir
+        self._read = read_source
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[str, Future] = {}
+
+        unique = list(dict.fromkeys(sources))
+        if len(unique) < 2:
+            return
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(SOURCE_PREFETCH_WORKERS, len(unique)),
+            thread_name_prefix="course-engine-source",
+        )
+        for src in unique:
+            self._futures[src] = self._pool.submit(read_source, base_dir, src)
+
+    def get(self, source: str) -> LessonSource:
+        fut = self._futures.get(source)
+        if fut is None:
+            return self._read(self._base_dir, source)
+        return fut.result()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
 
 
 class ReadingItemModel(BaseModel):
@@ -129,6 +184,28 @@ class LessonModel(BaseModel):
         return self
 
 
+class LessonFrontMatterModel(BaseModel):
+    """Lesson metadata from a source file's front matter; course.yml values take precedence."""
+    title: Optional[str] = None
+    display_label: Optional[str] = None
+    duration: Optional[int] = Field(default=None, ge=1)
+    tags: list[str] = Field(default_factory=list)
+    prerequisites: list[str] = Field(default_factory=list)
+
+
+def _front_matter(src: LessonSource) -> Optional[LessonFrontMatterModel]:
+    if src.front_matter is None:
+        return None
+    try:
+        return LessonFrontMatterModel.model_validate(src.front_matter)
+    except ValidationError as e:
+        raise ValueError(f"Invalid front matter in lesson source {src.resolved_path}: {e}") from e
+
+
+def _stripped(value: Optional[str]) -> Optional[str]:
+    return value.strip() if value and value.strip() else None
+
+
 class ModuleModel(BaseModel):
     id: str = Field(pattern=r"^[a-z0-9][a-z0-9-]*$")
     title: str = Field(min_length=1)
@@ -227,112 +304,170 @@ class RootModel(BaseModel):
     outputs: OutputsModel = Field(default_factory=OutputsModel)
     structure: dict = Field(default_factory=dict)
 
-    def to_spec(self, *, base_dir: Optional[Path] = None) -> CourseSpec:
+    def to_spec(
+        self,
+        *,
+        base_dir: Optional[Path] = None,
+        read_source: Optional[SourceReader] = None,
+        lazy_bodies: bool = False,
+        includes: Optional[List[IncludedFile]] = None,
+        discovered: Optional[List[DiscoveredLessons]] = None,
+    ) -> CourseSpec:
+        """
+        Build the CourseSpec. With lazy_bodies, lesson sources are streamed for their
+        metadata only and blocks carry a SourceBody instead of the text (read_source
+        is not used).
+        """
         base_dir = base_dir or Path.cwd()
+        read_source = read_source or read_course_source
 
         modules_raw = self.structure.get("modules", [])
         modules: list[Module] = []
 
+        # Validate module shapes first so every declared source can be prefetched.
+        # Stop at the first invalid module (the serial loop never got past it) and
+        # raise its error only after earlier modules have been assembled, keeping
+        # the first-error order identical.
+        module_models: list[ModuleModel] = []
+        module_error: Optional[Exception] = None
         for m in modules_raw:
-            mm = ModuleModel.model_validate(m)
-
-            lessons: list[Lesson] = []
-            for lm in mm.lessons:
-                lesson_title = (lm.title.strip() if lm.title and lm.title.strip() else None)
-                source_sha256: Optional[str] = None
-                source_resolved: Optional[str] = None
-                source_path: Optional[str] = lm.source
-
-                if lm.source:
-                    md, h, resolved = _read_lesson_source(base_dir, lm.source)
-                    source_sha256 = h
-                    source_resolved = resolved
-
-                    if not lesson_title:
-                        inferred = _infer_title_from_md(md)
-                        if inferred:
-                            lesson_title = inferred
-
-                    if not lesson_title:
-                        raise ValueError(
-                            f"Lesson '{lm.id}' has 'source' but no title could be inferred. "
-                            f"Add 'title' in course.yml or include a '# Heading' in the source file."
-                        )
-
-                    ContentBlockModel(type="markdown", body=md).validate_semantics()
-                    blocks = [
-                        ContentBlock(
-                            type="markdown",
-                            audience="learner",
-                            body=md,
-                            title=None,
-                            style=None,
-                            prompt=None,
-                            options=[],
-                            answer=None,
-                            solution=None,
-                        )
-                    ]
-
-                elif lm.content_blocks:
-                    for b in lm.content_blocks:
-                        b.validate_semantics()
-
-                    blocks = [
-                        ContentBlock(
-                            type=b.type,
-                            audience=b.audience,
-                            body=b.body,
-                            title=b.title,
-                            style=b.style,
-                            prompt=b.prompt,
-                            options=list(b.options),
-                            answer=b.answer,
-                            solution=b.solution,
-                        )
-                        for b in lm.content_blocks
-                    ]
-
-                    lesson_title = lesson_title or lm.title  # type: ignore[assignment]
-
-                else:
-                    placeholder = "Content pending."
-                    ContentBlockModel(type="markdown", body=placeholder).validate_semantics()
-                    blocks = [
-                        ContentBlock(
-                            type="markdown",
-                            audience="learner",
-                            body=placeholder,
-                            title=None,
-                            style=None,
-                            prompt=None,
-                            options=[],
-                            answer=None,
-                            solution=None,
+            try:
+                module_models.append(ModuleModel.model_validate(m))
+            except Exception as e:
+                module_error = e
+                break
+
+        prefetch = _SourcePrefetch(
+            base_dir,
+            [lm.source for mm in module_models for lm in mm.lessons if lm.source],
+            _scan_lesson_source if lazy_bodies else read_source,
+        )
+        try:
+            for mm in module_models:
+                lessons: list[Lesson] = []
+                for lm in mm.lessons:
+                    lesson_title = _stripped(lm.title)
+                    display_label = _stripped(lm.display_label)
+                    duration = lm.duration
+                    tags = lm.tags
+                    prerequisites = lm.prerequisites
+                    source_sha256: Optional[str] = None
+                    source_resolved: Optional[str] = None
+                    source_path: Optional[str] = lm.source
+
+                    if lm.source:
+                        src = prefetch.get(lm.source)
+                        md = src.text
+                        source_sha256 = src.sha256
+                        source_resolved = src.resolved_path
+
+                        fm = _front_matter(src)
+                        if fm is not None:
+                            lesson_title = lesson_title or _stripped(fm.title)
+                            display_label = display_label or _stripped(fm.display_label)
+                            duration = duration if duration is not None else fm.duration
+                            # An explicit list in course.yml (even []) wins over front matter.
+                            if "tags" not in lm.model_fields_set:
+                                tags = fm.tags
+                            if "prerequisites" not in lm.model_fields_set:
+                                prerequisites = fm.prerequisites
+
+                        if not lesson_title:
+                            inferred = _infer_title_from_md(md) if md is not None else src.heading
+                            if inferred:
+                                lesson_title = inferred
+
+                        if not lesson_title:
+                            raise ValueError(
+                                f"Lesson '{lm.id}' has 'source' but no title could be inferred. "
+                                f"Add 'title' in course.yml or front matter, or include a '# Heading' in the source file."
+                            )
+
+                        if md is not None:
+                            ContentBlockModel(type="markdown", body=md).validate_semantics()
+                        elif src.blank:
+                            raise ValueError("markdown block requires non-empty 'body'")
+                        blocks = [
+                            ContentBlock(
+                                type="markdown",
+                                audience="learner",
+                                body=md,
+                                title=None,
+                                style=None,
+                                prompt=None,
+                                options=[],
+                                answer=None,
+                                solution=None,
+                                body_source=SourceBody(
+                                    path=src.resolved_path, bytes=src.bytes, sha256=src.sha256
+                                ),
+                            )
+                        ]
+
+                    elif lm.content_blocks:
+                        for b in lm.content_blocks:
+                            b.validate_semantics()
+
+                        blocks = [
+                            ContentBlock(
+                                type=sys.intern(b.type),
+                                audience=sys.intern(b.audience),
+                                body=b.body,
+                                title=b.title,
+                                style=sys.intern(b.style) if b.style is not None else None,
+                                prompt=b.prompt,
+                                options=list(b.options),
+                                answer=b.answer,
+                                solution=b.solution,
+                            )
+                            for b in lm.content_blocks
+                        ]
+
+                        lesson_title = lesson_title or lm.title  # type: ignore[assignment]
+
+                    else:
+                        placeholder = "Content pending."
+                        ContentBlockModel(type="markdown", body=placeholder).validate_semantics()
+                        blocks = [
+                            ContentBlock(
+                                type="markdown",
+                                audience="learner",
+                                body=placeholder,
+                                title=None,
+                                style=None,
+                                prompt=None,
+                                options=[],
+                                answer=None,
+                                solution=None,
+                            )
+                        ]
+                        lesson_title = lesson_title or lm.title  # type: ignore[assignment]
+
+                    readings = [ReadingItem(title=r.title, url=r.url, required=r.required) for r in lm.readings]
+
+                    lessons.append(
+                        Lesson(
+                            id=lm.id,
+                            title=lesson_title,  # type: ignore[arg-type]
+                            display_label=display_label,
+                            learning_objectives=list(lm.learning_objectives),
+                            content_blocks=blocks,
+                            duration=duration,
+                            tags=_interned(tags),
+                            prerequisites=_interned(prerequisites),
+                            readings=readings,
+                            source=source_path,
+                            source_sha256=source_sha256,
+                            source_resolved_path=source_resolved,
                         )
-                    ]
-                    lesson_title = lesson_title or lm.title  # type: ignore[assignment]
-
-                readings = [ReadingItem(title=r.title, url=r.url, required=r.required) for r in lm.readings]
-
-                lessons.append(
-                    Lesson(
-                        id=lm.id,
-                        title=lesson_title,  # type: ignore[arg-type]
-                        display_label=(lm.display_label.strip() if lm.display_label and lm.display_label.strip() else None),
-                        learning_objectives=list(lm.learning_objectives),
-                        content_blocks=blocks,
-                        duration=lm.duration,
-                        tags=list(lm.tags),
-                        prerequisites=list(lm.prerequisites),
-                        readings=readings,
-                        source=source_path,
-                        source_sha256=source_sha256,
-                        source_resolved_path=source_resolved,
                     )
-                )
 
-            modules.append(Module(id=mm.id, title=mm.title, lessons=lessons))
+                modules.append(Module(id=mm.id, title=mm.title, lessons=lessons))
+
+            if module_error is not None:
+                raise module_error
+        finally:
+            prefetch.close()
 
         capability_mapping = None
         if self.capability_mapping is not None:
@@ -343,7 +478,7 @@ class RootModel(BaseModel):
                     k: CapabilityDomainMapping(
                         label=v.label,
                         intent=v.intent,
-                        coverage=list(v.coverage),
+                        coverage=_interned(v.coverage),
                         evidence=list(v.evidence),
                     )
                     for k, v in self.capability_mapping.domains.items()
@@ -352,7 +487,7 @@ class RootModel(BaseModel):
 
         fw = FrameworkAlignment(
             framework_name=self.framework_alignment.framework_name,
-            domains=list(self.framework_alignment.domains),
+            domains=_interned(self.framework_alignment.domains),
             mapping_mode=self.framework_alignment.mapping_mode or "informational",
             notes=self.framework_alignment.notes,
         )
@@ -421,7 +556,7 @@ class RootModel(BaseModel):
             version=self.course.version,
             language=self.course.language,
             framework_name=self.framework_alignment.framework_name,
-            domains=list(self.framework_alignment.domains),
+            domains=_interned(self.framework_alignment.domains),
             formats=self.outputs.formats,
             theme=self.outputs.theme,
             toc=self.outputs.toc,
@@ -430,6 +565,8 @@ class RootModel(BaseModel):
             framework_alignment=fw,
             capability_mapping=capability_mapping,
             modules=modules,
+            includes=list(includes or []),
+            discovered=list(discovered or []),
         )
 
 
@@ -486,13 +623,67 @@ Expected:
         raise ValueError("structure.modules must be a list (it may be empty).")
 
 
-def validate_course_dict(data: dict, *, source_course_yml: Optional[Path] = None) -> CourseSpec:
+@dataclass(frozen=True)
+class ValidatedCourse:
+    """
+    A course dict validated up to spec assembly: the RootModel plus the include and
+    discovery provenance expanded into it. to_spec() reads the lesson sources and can
+    be called again after they change (watch mode) without re-validating course.yml.
+    """
+
+    root: RootModel
+    base_dir: Optional[Path] = None
+    read_source: Optional[SourceReader] = None
+    includes: List[IncludedFile] = field(default_factory=list)
+    discovered: List[DiscoveredLessons] = field(default_factory=list)
+
+    def to_spec(self, *, lazy_bodies: bool = False) -> CourseSpec:
+        try:
+            return self.root.to_spec(
+                base_dir=self.base_dir,
+                read_source=self.read_source,
+                lazy_bodies=lazy_bodies,
+                includes=self.includes,
+                discovered=self.discovered,
+            )
+        except ValidationError as e:
+            raise ValueError(str(e)) from e
+
+
+def validate_course_root(
+    data: dict,
+    *,
+    base_dir: Optional[Path] = None,
+    read_source: Optional[SourceReader] = None,
+) -> ValidatedCourse:
+    """
+    Preflight a parsed course.yml, expand its `include:` and `discover:` entries
+    (relative to base_dir, default the working directory) and validate the result.
+    read_source is kept for to_spec(). Raises ValueError.
+    """
     try:
         _preflight_course_dict(data)
+        data, includes = expand_includes(data, base_dir or Path.cwd())
+        data, discovered = expand_discovered_lessons(data, base_dir or Path.cwd())
         root = RootModel.model_validate(data)
-        base_dir = source_course_yml.parent if source_course_yml is not None else None
-        return root.to_spec(base_dir=base_dir)
     except ValidationError as e:
         raise ValueError(str(e)) from e
-    except ValueError as e:
-        raise ValueError(str(e)) from e
+    return ValidatedCourse(
+        root=root,
+        base_dir=base_dir,
+        read_source=read_source,
+        includes=includes,
+        discovered=discovered,
+    )
+
+
+def validate_course_dict(
+    data: dict,
+    *,
+    source_course_yml: Optional[Path] = None,
+    read_source: Optional[SourceReader] = None,
+    lazy_bodies: bool = False,
+) -> CourseSpec:
+    base_dir = source_course_yml.parent if source_course_yml is not None else None
+    course = validate_course_root(data, base_dir=base_dir, read_source=read_source)
+    return course.to_spec(lazy_bodies=lazy_bodies)
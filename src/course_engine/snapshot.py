@@ -44,12 +44,11 @@ def _load_json(path: Path) -> Dict[str, Any]:
 
 def _load_course_yml(path: Path) -> Dict[str, Any]:
     try:
-        import yaml  # type: ignore
+        from .utils import yaml_io
     except ImportError as exc:
         raise RuntimeError("PyYAML is required to load course.yml") from exc
 
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return yaml_io.safe_load(path.read_bytes()) or {}
 
 
 def _presence(obj: Dict[str, Any], key: str) -> bool:
@@ -0,0 +1,123 @@
+# src/course_engine/utils/build_state.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .. import __version__
+
+# Persistent record of what the last build wrote (lives inside the output dir).
+BUILD_STATE_FILENAME = ".course-engine-build.json"
+BUILD_STATE_VERSION = "1"
+
+
+def _to_plain(obj: Any) -> Any:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return obj
+
+
+def fingerprint(*parts: Any) -> str:
+    """
+    Stable SHA256 fingerprint of the inputs that produce one output file.
+
+    Parts may be dataclasses, dicts, lists or scalars; they are serialised as
+    canonical JSON (sorted keys) so the fingerprint is independent of dict order.
+    """
+    payload = [_to_plain(p) for p in parts]
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def spec_meta(spec: Any) -> Dict[str, Any]:
+    """
+    Course-level slice of a CourseSpec (everything except the module tree and
+    include provenance).
+    """
+    return {f.name: _to_plain(getattr(spec, f.name)) for f in fields(spec) if f.name not in ("modules", "includes", "discovered")}
+
+
+def load_build_state(out_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load the build state for out_dir.
+
+    Returns None if there is no usable state (missing, unreadable, written by a
+    different engine version, or a different state format); callers then fall
+    back to a full rebuild.
+    """
+    p = Path(out_dir) / BUILD_STATE_FILENAME
+    if not p.is_file():
+        return None
+
+    try:
+        data = json.loads(p.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    if data.get("state_version") != BUILD_STATE_VERSION:
+        return None
+    if data.get("engine_version") != __version__:
+        return None
+    if not isinstance(data.get("outputs"), dict):
+        return None
+
+    return data
+
+
+def write_build_state(
+    out_dir: Path,
+    *,
+    outputs: Dict[str, str],
+    written: list[str],
+    removed: list[str],
+    pending_render: list[str],
+) -> Path:
+    """
+    Persist the build state for out_dir.
+
+    - outputs: output path (relative to out_dir) -> input fingerprint
+    - written/removed: what this build changed on disk
+    - pending_render: outputs written since the last render (accumulates across builds)
+    """
+    state = {
+        "state_version": BUILD_STATE_VERSION,
+        "engine_version": __version__,
+        "outputs": dict(sorted(outputs.items())),
+        "written": sorted(written),
+        "removed": sorted(removed),
+        "pending_render": sorted(set(pending_render)),
+    }
+
+    p = Path(out_dir) / BUILD_STATE_FILENAME
+    p.write_text(json.dumps(state, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return p
+
+
+def clear_pending_render(out_dir: Path, rendered: Optional[list[str]] = None) -> None:
+    """
+    Record that outputs were rendered: drop them from `pending_render`.
+
+    rendered=None means a full project render (clears everything). No-op if
+    there is no usable build state.
+    """
+    state = load_build_state(out_dir)
+    if state is None:
+        return
+
+    pending = list(state.get("pending_render") or [])
+    done = set(rendered or [])
+    remaining = [] if rendered is None else [p for p in pending if p not in done]
+
+    write_build_state(
+        out_dir,
+        outputs=state["outputs"],
+        written=list(state.get("written") or []),
+        removed=list(state.get("removed") or []),
+        pending_render=remaining,
+    )
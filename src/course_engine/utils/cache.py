@@ -0,0 +1,58 @@
+# src/course_engine/utils/cache.py
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+CACHE_DIR_ENV = "COURSE_ENGINE_CACHE_DIR"
+NO_CACHE_ENV = "COURSE_ENGINE_NO_CACHE"
+
+
+def cache_disabled() -> bool:
+    """True if on-disk caching has been switched off via COURSE_ENGINE_NO_CACHE."""
+    return os.getenv(NO_CACHE_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def user_cache_dir() -> Path:
+    """
+    Per-user cache root for course-engine.
+
+    Resolution order:
+      1. COURSE_ENGINE_CACHE_DIR (explicit override; useful for CI caches)
+      2. platform convention:
+         - Windows: %LOCALAPPDATA%/course-engine/Cache
+         - macOS:   ~/Library/Caches/course-engine
+         - other:   $XDG_CACHE_HOME/course-engine (default ~/.cache/course-engine)
+    """
+    override = os.getenv(CACHE_DIR_ENV, "").strip()
+    if override:
+        return Path(override).expanduser()
+
+    if sys.platform.startswith("win"):
+        base = os.getenv("LOCALAPPDATA") or str(Path.home() / "AppData" / "Local")
+        return Path(base) / "course-engine" / "Cache"
+
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "course-engine"
+
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "course-engine"
+
+
+def cache_subdir(name: str) -> Optional[Path]:
+    """
+    Return (and create) a named cache subdirectory, or None if caching is
+    disabled or the directory cannot be created. Callers treat None as "no cache".
+    """
+    if cache_disabled():
+        return None
+
+    p = user_cache_dir() / name
+    try:
+        p.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return p
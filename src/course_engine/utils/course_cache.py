@@ -0,0 +1,273 @@
+# src/course_engine/utils/course_cache.py
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from .. import __version__
+from .cache import cache_subdir
+from .discovery import listing_unchanged
+from .lesson_sources import sha256_file
+
+# Parsed + validated course.yml results, keyed by content (see _entry_key).
+COURSE_CACHE_SUBDIR = "courses"
+COURSE_CACHE_FORMAT = "1"
+COURSE_CACHE_MAX_MB_ENV = "COURSE_ENGINE_COURSE_CACHE_MAX_MB"
+COURSE_CACHE_MAX_MB = 256
+
+
+@dataclass
+class CourseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def summary(self) -> str:
+        return f"parsed-course cache: {self.hits} hit(s), {self.misses} miss(es)"
+
+
+# Per-process counters (surfaced by the CLI in verbose mode).
+STATS = CourseCacheStats()
+
+# Every module the course loader runs, relative to the package: a change to any of
+# them (parsing, front matter, includes, discovery) can change the validated spec.
+FINGERPRINT_MODULES = (
+    "schema.py",
+    "model.py",
+    "utils/yaml_io.py",
+    "utils/lesson_sources.py",
+    "utils/includes.py",
+    "utils/discovery.py",
+)
+
+_CODE_FINGERPRINT: Optional[str] = None
+
+
+def _code_fingerprint() -> str:
+    """
+    Hash of the loader modules (FINGERPRINT_MODULES). Editable installs can change
+    that code without bumping the version; this keeps stale pickles out.
+    """
+    global _CODE_FINGERPRINT
+    if _CODE_FINGERPRINT is None:
+        pkg = Path(__file__).resolve().parents[1]
+        h = hashlib.sha256()
+        for name in FINGERPRINT_MODULES:
+            try:
+                h.update((pkg / name).read_bytes())
+            except OSError:
+                h.update(name.encode("utf-8"))
+        _CODE_FINGERPRINT = h.hexdigest()
+    return _CODE_FINGERPRINT
+
+
+def _entry_key(course_yml: Path, data_bytes: bytes, *, lazy: bool = False) -> str:
+    # The absolute path matters: lesson sources resolve relative to course.yml.
+    # Lazy (metadata-only) specs are a separate entry: they must never reach a renderer.
+    h = hashlib.sha256()
+    for part in (
+        COURSE_CACHE_FORMAT,
+        __version__,
+        _code_fingerprint(),
+        "lazy" if lazy else "full",
+        os.path.abspath(course_yml),
+        hashlib.sha256(data_bytes).hexdigest(),
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _lesson_sources(spec: Any) -> list[tuple[str, str]]:
+    # Every file the spec was built from besides course.yml: includes + lesson sources.
+    out: list[tuple[str, str]] = [
+        (str(inc.resolved_path), str(inc.sha256)) for inc in getattr(spec, "includes", []) or []
+    ]
+    for m in getattr(spec, "modules", []) or []:
+        for lesson in getattr(m, "lessons", []) or []:
+            resolved = getattr(lesson, "source_resolved_path", None)
+            sha = getattr(lesson, "source_sha256", None)
+            if resolved and sha:
+                out.append((str(resolved), str(sha)))
+    return out
+
+
+def _sources_unchanged(sources: list[tuple[str, str]]) -> bool:
+    # Lesson.source_sha256 is the raw file hash (utils.lesson_sources.read_lesson_source).
+    for resolved, sha in sources:
+        try:
+            if sha256_file(Path(resolved)) != sha:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _max_bytes() -> int:
+    raw = os.getenv(COURSE_CACHE_MAX_MB_ENV, "").strip()
+    try:
+        mb = float(raw) if raw else float(COURSE_CACHE_MAX_MB)
+    except ValueError:
+        mb = float(COURSE_CACHE_MAX_MB)
+    return int(mb * 1024 * 1024)
+
+
+def _read_entry(p: Path) -> Optional[dict]:
+    try:
+        with p.open("rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Corrupt or incompatible entry: drop it.
+        p.unlink(missing_ok=True)
+        return None
+
+    if not isinstance(entry, dict) or not _sources_unchanged(entry.get("sources") or []):
+        return None
+    # A discovered lesson directory that gained or lost files changes the course.
+    if not all(listing_unchanged(d) for d in getattr(entry.get("spec"), "discovered", None) or []):
+        return None
+
+    try:
+        os.utime(p)  # LRU: mtime is the last-used time
+    except OSError:
+        pass
+    return entry
+
+
+def lookup(course_yml: Path, data_bytes: bytes, *, lazy: bool = False) -> Optional[tuple[Any, Any]]:
+    """
+    Return (raw course dict, validated CourseSpec) for these course.yml bytes if a
+    cached entry exists and every lesson source it read still has the same hash.
+    Returns None on a miss (or when caching is disabled).
+
+    lazy=True looks up lazy-bodies entries only: a full entry (as stored by build)
+    carries every lesson body, which metadata-only callers must not load.
+    """
+    d = cache_subdir(COURSE_CACHE_SUBDIR)
+    if d is None:
+        STATS.misses += 1
+        return None
+
+    entry = _read_entry(d / f"{_entry_key(course_yml, data_bytes, lazy=lazy)}.pickle")
+    if entry is not None:
+        STATS.hits += 1
+        return entry["raw"], entry["spec"]
+
+    STATS.misses += 1
+    return None
+
+
+def store(course_yml: Path, data_bytes: bytes, raw: Any, spec: Any, *, lazy: bool = False) -> None:
+    """
+    Cache a successfully validated course (best effort; failures are ignored).
+    Pass lazy=True for specs built with lazy_bodies.
+    """
+    d = cache_subdir(COURSE_CACHE_SUBDIR)
+    if d is None:
+        return
+
+    entry = {"raw": raw, "spec": spec, "sources": _lesson_sources(spec)}
+    p = d / f"{_entry_key(course_yml, data_bytes, lazy=lazy)}.pickle"
+    if not _write_entry(p, entry):
+        return
+
+    STATS.stores += 1
+    _evict(d, keep=p)
+
+
+def _fragment_path(d: Path, data_bytes: bytes) -> Path:
+    # Parsed included YAML files depend on their bytes only (no path, no sources).
+    h = hashlib.sha256()
+    for part in (COURSE_CACHE_FORMAT, __version__, "fragment", hashlib.sha256(data_bytes).hexdigest()):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return d / f"fragment-{h.hexdigest()}.pickle"
+
+
+def lookup_fragment(data_bytes: bytes) -> Optional[tuple[Any]]:
+    """
+    Parsed YAML for an included file with these bytes, as a 1-tuple (the document
+    itself may be None), or None on a miss. Not counted in STATS.
+    """
+    d = cache_subdir(COURSE_CACHE_SUBDIR)
+    if d is None:
+        return None
+    p = _fragment_path(d, data_bytes)
+    try:
+        with p.open("rb") as f:
+            entry = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        p.unlink(missing_ok=True)
+        return None
+    if not isinstance(entry, dict) or "parsed" not in entry:
+        return None
+    try:
+        os.utime(p)
+    except OSError:
+        pass
+    return (entry["parsed"],)
+
+
+def store_fragment(data_bytes: bytes, parsed: Any) -> None:
+    """Cache the parse of an included file (best effort; shares the course cache budget)."""
+    d = cache_subdir(COURSE_CACHE_SUBDIR)
+    if d is None:
+        return
+    p = _fragment_path(d, data_bytes)
+    if _write_entry(p, {"parsed": parsed}):
+        _evict(d, keep=p)
+
+
+def _write_entry(p: Path, entry: dict) -> bool:
+    """
+    Pickle entry to p via a temp file. An entry larger than the whole size budget is
+    dropped instead (eviction never removes the entry just written).
+    """
+    tmp = p.with_name(f"{p.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        if tmp.stat().st_size > _max_bytes():
+            tmp.unlink()
+            return False
+        tmp.replace(p)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _evict(d: Path, *, keep: Path) -> None:
+    """Delete least-recently-used entries until the cache fits its size budget."""
+    entries = []
+    total = 0
+    for p in d.glob("*.pickle"):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, p))
+        total += st.st_size
+
+    budget = _max_bytes()
+    for _mtime, size, p in sorted(entries):
+        if total <= budget:
+            break
+        if p == keep:
+            continue
+        try:
+            p.unlink()
+        except OSError:
+            continue
+        total -= size
+        STATS.evictions += 1
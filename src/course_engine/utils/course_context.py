@@ -0,0 +1,88 @@
+# src/course_engine/utils/course_context.py
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..model import CourseSpec
+from ..schema import validate_course_dict
+from . import course_cache, yaml_io
+from .reporting import build_governance_self_audit
+from .signals import compute_signals
+
+
+@dataclass
+class CourseContext:
+    """
+    Everything derived from one course.yml during a build, parsed/computed once.
+
+    Stages (CLI printout, manifest, plugins) take values from here instead of
+    re-reading the file or recomputing signals and the governance audit.
+    """
+
+    course_yml: Path
+    raw: Any
+    data_sha256: str
+    spec: CourseSpec
+    from_cache: bool = False
+
+    _signals: Optional[List[Dict[str, Any]]] = field(default=None, init=False, repr=False)
+    _audit: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_parsed(
+        cls,
+        course_yml: Path,
+        data_bytes: bytes,
+        raw: Any,
+        spec: CourseSpec,
+        *,
+        from_cache: bool = False,
+    ) -> "CourseContext":
+        return cls(
+            course_yml=Path(course_yml),
+            raw=raw,
+            data_sha256=hashlib.sha256(data_bytes).hexdigest(),
+            spec=spec,
+            from_cache=from_cache,
+        )
+
+    @classmethod
+    def load(cls, course_yml: Path) -> "CourseContext":
+        """
+        Read, parse and validate course_yml (through the parsed-course cache).
+
+        Raises the underlying YAML error or ValueError (invalid course) unchanged.
+        """
+        course_yml = Path(course_yml)
+        data_bytes = course_yml.read_bytes()
+
+        cached = course_cache.lookup(course_yml, data_bytes)
+        if cached is not None:
+            raw, spec = cached
+            return cls.from_parsed(course_yml, data_bytes, raw, spec, from_cache=True)
+
+        raw = yaml_io.safe_load(data_bytes)
+        spec = validate_course_dict(raw, source_course_yml=course_yml)
+        course_cache.store(course_yml, data_bytes, raw, spec)
+        return cls.from_parsed(course_yml, data_bytes, raw, spec)
+
+    @property
+    def signals(self) -> List[Dict[str, Any]]:
+        """Absence signals as dicts (computed once; [] if computation fails)."""
+        if self._signals is None:
+            try:
+                self._signals = [s.to_dict() for s in compute_signals(self.spec)]
+            except Exception:
+                self._signals = []
+        return self._signals
+
+    @property
+    def audit(self) -> Dict[str, Any]:
+        """Governance self-audit (computed once)."""
+        if self._audit is None:
+            self._audit = build_governance_self_audit(self.spec)
+        return self._audit
@@ -0,0 +1,254 @@
+# src/course_engine/utils/discovery.py
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..model import DiscoveredLessons
+from .cache import cache_subdir
+from .lesson_sources import SOURCE_SCAN_RACY_WINDOW_NS, read_front_matter, read_lesson_source
+
+# A module lessons entry `{discover: <dir>}` or `{discover: <dir>/<pattern>}` becomes one
+# `source:` lesson per matching file, ordered by file name. Only the file name part may
+# contain wildcards; the default pattern is DEFAULT_PATTERN.
+DISCOVER_KEY = "discover"
+DEFAULT_PATTERN = "*.md"
+
+DISCOVERY_CACHE_SUBDIR = "discovery"
+DISCOVERY_CACHE_FORMAT = 4
+
+_WILDCARDS = re.compile(r"[*?\[]")
+
+
+def _discover_ref(entry: Any) -> Optional[str]:
+    if isinstance(entry, dict) and DISCOVER_KEY in entry:
+        ref = entry[DISCOVER_KEY]
+        if len(entry) != 1 or not isinstance(ref, str) or not ref.strip():
+            raise ValueError(f"A discover entry must be exactly {{{DISCOVER_KEY}: <dir or pattern>}}; got: {entry!r}")
+        return ref
+    return None
+
+
+def _split_ref(base_dir: Path, ref: str) -> tuple[str, Path, str]:
+    """(declared dir, resolved dir, file name pattern)."""
+    declared = ref.rstrip("/")
+    pattern = DEFAULT_PATTERN
+    head, _, tail = declared.rpartition("/")
+    if _WILDCARDS.search(tail):
+        declared, pattern = head or ".", tail
+    if _WILDCARDS.search(declared):
+        raise ValueError(f"Only the file name part of a discover pattern may contain wildcards: {ref}")
+
+    src = Path(declared)
+    return declared, (src if src.is_absolute() else base_dir / src), pattern
+
+
+def lesson_id_from_name(name: str) -> str:
+    """Lesson id for a discovered file: its lower-cased stem with other characters as '-'."""
+    return re.sub(r"[^a-z0-9]+", "-", Path(name).stem.lower()).strip("-")
+
+
+class DirectoryScanCache:
+    """
+    Cached listing of one directory plus the title of its files (front matter title,
+    else the first '# ' heading).
+
+    The listing is reused while the directory's (mtime_ns, inode) is unchanged; a title
+    while the file's (mtime_ns, size, inode) is. As for lesson sources, nothing modified
+    within SOURCE_SCAN_RACY_WINDOW_NS of the scan is reused later: a change in the same
+    mtime tick would keep the stamp. State is kept in a small JSON file in the user
+    cache (best effort; without a cache dir everything is rescanned).
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(os.path.abspath(directory))
+        self._path: Optional[Path] = None
+        d = cache_subdir(DISCOVERY_CACHE_SUBDIR)
+        if d is not None:
+            key = hashlib.sha256(str(self.directory).encode("utf-8")).hexdigest()
+            self._path = d / f"{key}.json"
+        self._state = self._load()
+        self._dirty = False
+        self.titles_read = 0
+
+    def _load(self) -> Dict[str, Any]:
+        if self._path is None:
+            return {}
+        try:
+            state = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(state, dict) or state.get("format") != DISCOVERY_CACHE_FORMAT:
+            return {}
+        return state
+
+    def names(self) -> List[str]:
+        """Sorted names of the regular files in the directory."""
+        try:
+            st = os.stat(self.directory)
+        except FileNotFoundError as e:
+            raise ValueError(f"Lesson directory not found: {self.directory}") from e
+        stamp = [st.st_mtime_ns, st.st_ino]
+
+        if self._state.get("dir_stamp") == stamp and isinstance(self._state.get("names"), list):
+            return list(self._state["names"])
+
+        started_ns = time.time_ns()
+        with os.scandir(self.directory) as it:
+            names = sorted(e.name for e in it if e.is_file())
+        if st.st_mtime_ns > started_ns - SOURCE_SCAN_RACY_WINDOW_NS:
+            stamp = None  # recently changed: list again next time
+        self._state.update(format=DISCOVERY_CACHE_FORMAT, dir_stamp=stamp, names=names)
+        self._dirty = True
+        return names
+
+    def title(self, name: str) -> Optional[str]:
+        p = self.directory / name
+        st = p.stat()
+        files: Dict[str, Any] = self._state.setdefault("files", {})
+        stamp = [st.st_mtime_ns, st.st_size, st.st_ino]
+        cached = files.get(name)
+        if isinstance(cached, list) and cached[:3] == stamp:
+            return cached[3]
+        started_ns = time.time_ns()
+
+        # A front matter title only needs the file head.
+        meta = read_front_matter(p) or {}
+        title = meta.get("title")
+        if isinstance(title, str) and title.strip():
+            title = title.strip()
+        else:
+            title = read_lesson_source(p, keep_text=False).heading
+        if st.st_mtime_ns <= started_ns - SOURCE_SCAN_RACY_WINDOW_NS:
+            files[name] = [*stamp, title]
+        else:
+            files.pop(name, None)
+        self._dirty = True
+        self.titles_read += 1
+        return title
+
+    def save(self) -> None:
+        if self._path is None or not self._dirty:
+            return
+        # Forget files that are gone so the state does not grow without bound.
+        names = set(self._state.get("names") or [])
+        files = self._state.get("files") or {}
+        self._state["files"] = {k: v for k, v in files.items() if k in names}
+        tmp = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(self._state, sort_keys=True), encoding="utf-8")
+            tmp.replace(self._path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self._dirty = False
+
+
+def matching_names(names: List[str], pattern: str) -> List[str]:
+    return [n for n in names if fnmatch.fnmatchcase(n, pattern)]
+
+
+def _discover(
+    base_dir: Path,
+    ref: str,
+    module_id: Optional[str],
+    scans: Dict[Path, DirectoryScanCache],
+) -> tuple[List[Dict[str, Any]], DiscoveredLessons]:
+    declared, directory, pattern = _split_ref(base_dir, ref)
+    key = Path(os.path.abspath(directory))
+    scan = scans.get(key)
+    if scan is None:
+        scan = scans[key] = DirectoryScanCache(directory)
+
+    names = matching_names(scan.names(), pattern)
+    if not names:
+        raise ValueError(f"No lesson files match '{pattern}' in {directory}")
+
+    lessons: List[Dict[str, Any]] = []
+    seen: Dict[str, str] = {}
+    for name in names:
+        lesson_id = lesson_id_from_name(name)
+        if not lesson_id:
+            raise ValueError(f"Cannot derive a lesson id from file name: {directory / name}")
+        if lesson_id in seen:
+            raise ValueError(
+                f"Discovered files '{seen[lesson_id]}' and '{name}' in {directory} map to the same lesson id '{lesson_id}'"
+            )
+        seen[lesson_id] = name
+
+        lesson: Dict[str, Any] = {"id": lesson_id, "source": f"{declared}/{name}" if declared != "." else name}
+        title = scan.title(name)
+        if title:
+            lesson["title"] = title
+        lessons.append(lesson)
+
+    return lessons, DiscoveredLessons(
+        path=ref,
+        resolved_dir=str(key),
+        pattern=pattern,
+        files=names,
+        module_id=module_id,
+    )
+
+
+def expand_discovered_lessons(data: Any, base_dir: Path) -> tuple[Any, List[DiscoveredLessons]]:
+    """
+    Replace discover entries in each module's lessons with the lessons found on disk.
+    Returns (expanded data, discover entries in declaration order). The input is not modified; data
+    without discover entries is returned as-is.
+    """
+    if not isinstance(data, dict):
+        return data, []
+    structure = data.get("structure")
+    modules = structure.get("modules") if isinstance(structure, dict) else None
+    if not isinstance(modules, list):
+        return data, []
+
+    scans: Dict[Path, DirectoryScanCache] = {}
+    discovered: List[DiscoveredLessons] = []
+    new_modules: List[Any] = []
+    try:
+        for m in modules:
+            lessons = m.get("lessons") if isinstance(m, dict) else None
+            if not isinstance(lessons, list) or not any(_discover_ref(x) is not None for x in lessons):
+                new_modules.append(m)
+                continue
+            module_id = m.get("id") if isinstance(m.get("id"), str) else None
+            new_lessons: List[Any] = []
+            for lesson in lessons:
+                ref = _discover_ref(lesson)
+                if ref is None:
+                    new_lessons.append(lesson)
+                else:
+                    found, record = _discover(base_dir, ref, module_id, scans)
+                    new_lessons.extend(found)
+                    discovered.append(record)
+            new_modules.append({**m, "lessons": new_lessons})
+    finally:
+        for scan in scans.values():
+            scan.save()
+
+    if not discovered:
+        return data, []
+
+    expanded = dict(data)
+    expanded["structure"] = {**structure, "modules": new_modules}
+    return expanded, discovered
+
+
+def listing_unchanged(record: DiscoveredLessons) -> bool:
+    """True when the directory still holds exactly the files a discover entry found."""
+    try:
+        scan = DirectoryScanCache(Path(record.resolved_dir))
+        names = matching_names(scan.names(), record.pattern)
+        scan.save()
+    except (OSError, ValueError):
+        return False
+    return names == list(record.files)
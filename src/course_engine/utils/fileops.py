@@ -1,6 +1,98 @@
 from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+import hashlib
+import os
 import shutil
+import threading
+
+# Write buffer for streamed outputs: large enough to batch small template
+# fragments, small enough to keep memory flat for very large documents.
+STREAM_BUFFER_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class WrittenFile:
+    """Size and SHA-256 of a file as written here, with its stat right after the write."""
+    path: str
+    bytes: int
+    sha256: str
+    mtime_ns: int
+    dev: int
+    ino: int
+
+
+class WriteTracker:
+    """
+    Records every file written through write_text/write_stream while active (see
+    track_writes), so the manifest can take their digests without reading them back.
+
+    Records are keyed by (device, inode), so they survive a rename of the output
+    folder; lookup() only returns one while size and mtime still match the write.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[tuple[int, int], WrittenFile] = {}
+        self._lock = threading.Lock()
+
+    def add(self, record: WrittenFile) -> None:
+        with self._lock:
+            self._records[(record.dev, record.ino)] = record
+
+    def lookup(self, st: os.stat_result) -> Optional[WrittenFile]:
+        record = self._records.get((st.st_dev, st.st_ino))
+        if record is None or record.bytes != st.st_size or record.mtime_ns != st.st_mtime_ns:
+            return None
+        return record
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+_ACTIVE: list[WriteTracker] = []
+_ACTIVE_LOCK = threading.Lock()
+
+
+@contextmanager
+def track_writes() -> Iterator[WriteTracker]:
+    """
+    Record the files written in this block (from any thread of this process; the
+    "process" jobs backend writes in other processes, which are not recorded).
+    """
+    tracker = WriteTracker()
+    with _ACTIVE_LOCK:
+        _ACTIVE.append(tracker)
+    try:
+        yield tracker
+    finally:
+        with _ACTIVE_LOCK:
+            _ACTIVE.remove(tracker)
+
+
+def _encode(text: str) -> bytes:
+    # The bytes text mode would write (universal newlines on output).
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+def _record(path: Path, size: int, digest: str) -> None:
+    with _ACTIVE_LOCK:
+        trackers = list(_ACTIVE)
+    st = path.stat()
+    record = WrittenFile(
+        path=str(path),
+        bytes=size,
+        sha256=digest,
+        mtime_ns=st.st_mtime_ns,
+        dev=st.st_dev,
+        ino=st.st_ino,
+    )
+    for tracker in trackers:
+        tracker.add(record)
+
 
 def ensure_empty_dir(path: Path) -> None:
     if path.exists():
@@ -9,4 +101,27 @@ def ensure_empty_dir(path: Path) -> None:
 
 def write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    data = _encode(content)
+    path.write_bytes(data)
+    if _ACTIVE:
+        _record(path, len(data), hashlib.sha256(data).hexdigest())
+
+def write_stream(path: Path, chunks: Iterable[str]) -> None:
+    """
+    Write text chunks (e.g. Jinja `Template.generate()`) straight to disk.
+
+    Produces the same bytes as write_text("".join(chunks)) without ever holding
+    the whole document in memory.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    h = hashlib.sha256() if _ACTIVE else None
+    size = 0
+    with path.open("wb", buffering=STREAM_BUFFER_BYTES) as f:
+        for chunk in chunks:
+            data = _encode(chunk)
+            f.write(data)
+            if h is not None:
+                h.update(data)
+                size += len(data)
+    if h is not None:
+        _record(path, size, h.hexdigest())
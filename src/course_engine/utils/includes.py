@@ -0,0 +1,154 @@
+# src/course_engine/utils/includes.py
+
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..model import IncludedFile
+from . import course_cache, yaml_io
+
+# An entry `{include: path}` in structure.modules (a module mapping or a list of
+# modules) or in a module's lessons (a lesson mapping or a list of lessons). Paths
+# resolve against the course.yml folder, like lesson `source:` paths.
+INCLUDE_KEY = "include"
+
+# Bounded concurrency for reading + parsing included files.
+INCLUDE_PARSE_WORKERS = 8
+
+
+def _include_ref(entry: Any) -> Optional[str]:
+    if isinstance(entry, dict) and INCLUDE_KEY in entry:
+        ref = entry[INCLUDE_KEY]
+        if len(entry) != 1 or not isinstance(ref, str) or not ref.strip():
+            raise ValueError(f"An include entry must be exactly {{{INCLUDE_KEY}: <path>}}; got: {entry!r}")
+        return ref
+    return None
+
+
+def _resolve(base_dir: Path, ref: str) -> Path:
+    src = Path(ref)
+    return src if src.is_absolute() else (base_dir / src)
+
+
+def _load_include(resolved: Path) -> tuple[int, str, Any]:
+    """(bytes, sha256, parsed YAML) for one included file; parses are cached by content hash."""
+    try:
+        data_bytes = resolved.read_bytes()
+    except FileNotFoundError as e:
+        raise ValueError(f"Included file not found: {resolved}") from e
+    except OSError as e:
+        raise ValueError(f"Failed to read included file: {resolved} ({e})") from e
+
+    sha = hashlib.sha256(data_bytes).hexdigest()
+    cached = course_cache.lookup_fragment(data_bytes)
+    if cached is not None:
+        return len(data_bytes), sha, cached[0]
+
+    try:
+        parsed = yaml_io.safe_load(data_bytes)
+    except Exception as e:
+        raise ValueError(f"Failed to parse included file {resolved}: {e}") from e
+    course_cache.store_fragment(data_bytes, parsed)
+    return len(data_bytes), sha, parsed
+
+
+def _load_all(base_dir: Path, refs: List[str]) -> Dict[str, tuple[int, str, Any]]:
+    """Load every distinct ref concurrently; the first failing ref in declaration order raises."""
+    unique = list(dict.fromkeys(refs))
+    if len(unique) < 2:
+        return {ref: _load_include(_resolve(base_dir, ref)) for ref in unique}
+
+    with ThreadPoolExecutor(
+        max_workers=min(INCLUDE_PARSE_WORKERS, len(unique)),
+        thread_name_prefix="course-engine-include",
+    ) as pool:
+        futures = {ref: pool.submit(_load_include, _resolve(base_dir, ref)) for ref in unique}
+        return {ref: futures[ref].result() for ref in unique}
+
+
+def _as_items(parsed: Any, *, what: str, resolved: Path) -> List[Any]:
+    items = parsed if isinstance(parsed, list) else [parsed]
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError(f"Included file must contain a {what} mapping or a list of them: {resolved}")
+        if _include_ref(item) is not None:
+            raise ValueError(f"Nested include is not supported: {resolved}")
+    return items
+
+
+def expand_includes(data: Any, base_dir: Path) -> tuple[Any, List[IncludedFile]]:
+    """
+    Replace include entries in structure.modules (and in each module's lessons) with
+    the content of the referenced files. Returns (expanded data, included files in
+    declaration order). The input is not modified; data without includes is
+    returned as-is.
+    """
+    if not isinstance(data, dict):
+        return data, []
+    structure = data.get("structure")
+    modules = structure.get("modules") if isinstance(structure, dict) else None
+    if not isinstance(modules, list):
+        return data, []
+
+    included: List[IncludedFile] = []
+
+    def _record(ref: str, loaded: tuple[int, str, Any], kind: str, module_id: Optional[str]) -> None:
+        size, sha, _ = loaded
+        included.append(
+            IncludedFile(
+                path=ref,
+                resolved_path=str(_resolve(base_dir, ref)),
+                sha256=sha,
+                bytes=size,
+                kind=kind,  # type: ignore[arg-type]
+                module_id=module_id,
+            )
+        )
+
+    # Pass 1: module includes.
+    module_refs = [ref for ref in (_include_ref(m) for m in modules) if ref is not None]
+    loaded = _load_all(base_dir, module_refs)
+    expanded_modules: List[Any] = []
+    for m in modules:
+        ref = _include_ref(m)
+        if ref is None:
+            expanded_modules.append(m)
+            continue
+        _record(ref, loaded[ref], "modules", None)
+        expanded_modules.extend(_as_items(loaded[ref][2], what="module", resolved=_resolve(base_dir, ref)))
+
+    # Pass 2: lesson includes (in course.yml modules and in included module files).
+    lesson_refs = [
+        ref
+        for m in expanded_modules
+        if isinstance(m, dict) and isinstance(m.get("lessons"), list)
+        for ref in (_include_ref(lesson) for lesson in m["lessons"])
+        if ref is not None
+    ]
+    if not included and not lesson_refs:
+        return data, []
+
+    loaded = _load_all(base_dir, lesson_refs)
+    final_modules: List[Any] = []
+    for m in expanded_modules:
+        lessons = m.get("lessons") if isinstance(m, dict) else None
+        if not isinstance(lessons, list) or not any(_include_ref(x) is not None for x in lessons):
+            final_modules.append(m)
+            continue
+        module_id = m.get("id") if isinstance(m.get("id"), str) else None
+        new_lessons: List[Any] = []
+        for lesson in lessons:
+            ref = _include_ref(lesson)
+            if ref is None:
+                new_lessons.append(lesson)
+                continue
+            _record(ref, loaded[ref], "lessons", module_id)
+            new_lessons.extend(_as_items(loaded[ref][2], what="lesson", resolved=_resolve(base_dir, ref)))
+        final_modules.append({**m, "lessons": new_lessons})
+
+    expanded = dict(data)
+    expanded["structure"] = {**structure, "modules": final_modules}
+    return expanded, included
@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import codecs
+import functools
 import hashlib
+import io
+import json
+import mmap
+import os
+import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from . import yaml_io
+from .cache import cache_subdir
 
 
 def sha256_text(s: str) -> str:
@@ -16,14 +27,303 @@ def sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
 
-def infer_title_from_md(md: str) -> Optional[str]:
-    for line in md.splitlines():
-        line = line.strip()
-        if line.startswith("# "):
-            return line[2:].strip()
+# Bytes per read for metadata-only reads (read_lesson_source(keep_text=False)).
+SOURCE_CHUNK_BYTES = 1 << 20
+
+# Sources at least this large are memory-mapped: hashed and decoded straight from the
+# mapping, so the raw bytes never become a second Python object next to the text.
+SOURCE_MMAP_MIN_BYTES = 1 << 20
+
+# A source may open with a YAML front matter block ('---' ... '---' or '...') that sets
+# lesson metadata (FRONT_MATTER_KEYS). The block must close within the first
+# FRONT_MATTER_MAX_BYTES, so it is found from the file head alone. A block holding only
+# FRONT_MATTER_KEYS is removed from the lesson body; one with other keys as well (e.g.
+# Quarto `format:` options) still provides its recognised keys but stays in the body, so
+# it reaches the rendered page as before front matter support. A block that is not a
+# YAML mapping is left in the body and provides nothing.
+FRONT_MATTER_KEYS = ("title", "display_label", "duration", "tags", "prerequisites")
+FRONT_MATTER_MAX_BYTES = 64 * 1024
+
+_FRONT_MATTER_OPEN = re.compile(rb"---[ \t]*\r?\n")
+_FRONT_MATTER_CLOSE = re.compile(rb"^(?:---|\.\.\.)[ \t]*(?:\r?\n|\Z)", re.M)
+
+# Metadata-only reads are cached per file, keyed by (mtime_ns, size, inode), so a warm
+# explain never opens unchanged sources. As for the manifest inventory, a file modified
+# within SOURCE_SCAN_RACY_WINDOW_NS of the scan is not cached: a same-size edit in the
+# same mtime tick would otherwise keep its old hash. At most SOURCE_SCAN_CACHE_MAX_ENTRIES
+# files are kept; the least recently written are pruned first.
+SOURCE_SCAN_CACHE_SUBDIR = "sources"
+SOURCE_SCAN_CACHE_FORMAT = 2
+SOURCE_SCAN_RACY_WINDOW_NS = 2_000_000_000
+SOURCE_SCAN_CACHE_MAX_ENTRIES = 4096
+
+# Characters per slice when looking for the first heading in decoded text.
+_HEADING_SCAN_CHARS = 1 << 16
+
+
+@dataclass(frozen=True, slots=True)
+class LessonSource:
+    """
+    One read of a lesson source file, shared by schema, explain and manifest code.
+
+    bytes/sha256 describe the raw file. text is the decoded markdown with universal
+    newlines (as open(..., "r") would give) without the front matter block; it is None
+    for metadata-only reads, which fill heading (first '# ' title, see first_heading) and
+    blank instead. front_matter holds the recognised front matter keys, if any.
+    """
+    resolved_path: str
+    bytes: int
+    sha256: str
+    text: Optional[str] = None
+    heading: Optional[str] = None
+    blank: bool = False
+    front_matter: Optional[Dict[str, Any]] = None
+
+
+def _translate_newlines(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _first_heading_line(md: str) -> Optional[str]:
+    # Lines are split slice by slice (cut after a '\n', so they are the same lines as
+    # md.splitlines()) and the scan stops at the first heading.
+    start, n = 0, len(md)
+    while start < n:
+        end = md.find("\n", start + _HEADING_SCAN_CHARS)
+        end = n if end == -1 else end + 1
+        for line in md[start:end].splitlines():
+            line = line.strip()
+            if line.startswith("# "):
+                return line[2:].strip()
+        start = end
     return None
 
 
+def first_heading(md: str) -> tuple[bool, Optional[str]]:
+    """(found, title) for the first '# ' line; that line decides even when its title is empty."""
+    title = _first_heading_line(md)
+    if title is None:
+        return False, None
+    return True, (title if title else None)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_front_matter(block: bytes) -> Optional[tuple[Dict[str, Any], bool]]:
+    # (recognised keys, whether the block holds nothing else), or None if not a mapping.
+    try:
+        doc = yaml_io.safe_load(block)
+    except Exception:
+        return None
+    if doc is None:
+        doc = {}
+    if not isinstance(doc, dict):
+        return None
+    meta = {k: doc[k] for k in FRONT_MATTER_KEYS if k in doc}
+    return meta, len(meta) == len(doc)
+
+
+def split_front_matter(head: bytes, *, at_eof: bool) -> tuple[Optional[Dict[str, Any]], int]:
+    """
+    (recognised front matter keys, body offset) for the first bytes of a source;
+    (None, 0) when it has no front matter. The offset is 0 when the block also holds
+    other keys (it stays in the body). at_eof says whether head is the whole file.
+    """
+    opened = _FRONT_MATTER_OPEN.match(head)
+    if opened is None:
+        return None, 0
+    closed = _FRONT_MATTER_CLOSE.search(head, opened.end())
+    if closed is None or (closed.end() == len(head) and not at_eof and not head.endswith(b"\n")):
+        return None, 0
+    parsed = _parse_front_matter(head[opened.end():closed.start()])
+    if parsed is None:
+        return None, 0
+    meta, only_known = parsed
+    return dict(meta), (closed.end() if only_known else 0)
+
+
+def read_front_matter(path: Path) -> Optional[Dict[str, Any]]:
+    """Recognised front matter keys of a source, reading only its head."""
+    with Path(path).open("rb") as f:
+        head = f.read(FRONT_MATTER_MAX_BYTES)
+    return split_front_matter(head, at_eof=len(head) < FRONT_MATTER_MAX_BYTES)[0]
+
+
+def _scan_lesson_source(path: Path) -> LessonSource:
+    h = hashlib.sha256()
+    size = 0
+    blank = True
+    found = False
+    heading: Optional[str] = None
+    pending = ""
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+
+    def _feed(data: bytes, final: bool) -> None:
+        nonlocal blank, found, heading, pending
+        chunk = decoder.decode(data, final=final)
+        if blank and chunk.strip():
+            blank = False
+        if not found:
+            # Only complete lines are scanned; the tail waits for the next chunk.
+            pending += chunk
+            cut = len(pending) if final else pending.rfind("\n") + 1
+            if cut:
+                found, heading = first_heading(pending[:cut])
+                pending = pending[cut:]
+
+    with path.open("rb") as f:
+        head = f.read(FRONT_MATTER_MAX_BYTES)
+        front_matter, offset = split_front_matter(head, at_eof=len(head) < FRONT_MATTER_MAX_BYTES)
+        h.update(head)
+        size += len(head)
+        for i in range(offset, len(head), SOURCE_CHUNK_BYTES):
+            _feed(head[i : i + SOURCE_CHUNK_BYTES], False)
+        while True:
+            data = f.read(SOURCE_CHUNK_BYTES)
+            h.update(data)
+            size += len(data)
+            _feed(data, not data)
+            if not data:
+                break
+
+    return LessonSource(
+        resolved_path=str(path),
+        bytes=size,
+        sha256=h.hexdigest(),
+        heading=heading,
+        blank=blank,
+        front_matter=front_matter,
+    )
+
+
+def _scan_cache_file(path: Path) -> Optional[Path]:
+    d = cache_subdir(SOURCE_SCAN_CACHE_SUBDIR)
+    if d is None:
+        return None
+    return d / f"{hashlib.sha256(os.path.abspath(path).encode('utf-8')).hexdigest()}.json"
+
+
+def _scan_lesson_source_cached(path: Path) -> LessonSource:
+    st = path.stat()
+    stamp = [st.st_mtime_ns, st.st_size, st.st_ino]
+    cache_file = _scan_cache_file(path)
+    if cache_file is not None:
+        try:
+            entry = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entry = None
+        if isinstance(entry, dict) and entry.get("format") == SOURCE_SCAN_CACHE_FORMAT and entry.get("stamp") == stamp:
+            return LessonSource(
+                resolved_path=str(path),
+                bytes=entry["bytes"],
+                sha256=entry["sha256"],
+                heading=entry["heading"],
+                blank=entry["blank"],
+                front_matter=entry["front_matter"],
+            )
+
+    started_ns = time.time_ns()
+    src = _scan_lesson_source(path)
+    if cache_file is None or st.st_mtime_ns > started_ns - SOURCE_SCAN_RACY_WINDOW_NS:
+        return src  # recently modified: a same-size edit could keep this stamp
+    try:
+        st = path.stat()
+        if [st.st_mtime_ns, st.st_size, st.st_ino] != stamp:
+            return src  # changed while it was read; do not cache
+        payload = json.dumps(
+            {
+                "format": SOURCE_SCAN_CACHE_FORMAT,
+                "stamp": stamp,
+                "bytes": src.bytes,
+                "sha256": src.sha256,
+                "heading": src.heading,
+                "blank": src.blank,
+                "front_matter": src.front_matter,
+            }
+        )
+    except (OSError, TypeError, ValueError):
+        return src  # e.g. front matter values JSON cannot hold (dates): just not cached
+
+    is_new = not cache_file.exists()
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(payload, encoding="utf-8")
+        tmp.replace(cache_file)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return src
+    if is_new:
+        _prune_scan_cache(cache_file.parent)
+    return src
+
+
+def _prune_scan_cache(d: Path) -> None:
+    entries = []
+    try:
+        with os.scandir(d) as it:
+            for e in it:
+                if e.name.endswith(".json"):
+                    try:
+                        entries.append((e.stat().st_mtime_ns, e.path))
+                    except OSError:
+                        continue
+    except OSError:
+        return
+    excess = len(entries) - SOURCE_SCAN_CACHE_MAX_ENTRIES
+    for _mtime, p in sorted(entries)[: max(excess, 0)]:
+        try:
+            os.unlink(p)
+        except OSError:
+            continue
+
+
+def read_lesson_source(path: Path, *, keep_text: bool = True) -> LessonSource:
+    """
+    Read a lesson source once: the raw bytes are hashed and decoded a single time
+    (large files through mmap). With keep_text=False the file is streamed in chunks
+    and only metadata is kept (cached per file by stat, see SOURCE_SCAN_CACHE_SUBDIR).
+    Raises OSError / UnicodeDecodeError.
+    """
+    path = Path(path)
+    if not keep_text:
+        return _scan_lesson_source_cached(path)
+
+    with path.open("rb") as f:
+        st_size = os.fstat(f.fileno()).st_size
+        if st_size and st_size >= SOURCE_MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                digest = hashlib.sha256(mm).hexdigest()
+                front_matter, offset = split_front_matter(mm[:FRONT_MATTER_MAX_BYTES], at_eof=size <= FRONT_MATTER_MAX_BYTES)
+                with memoryview(mm) as view:
+                    text = str(view[offset:], "utf-8")
+                has_cr = mm.find(b"\r", offset) != -1
+        else:
+            data = f.read()
+            size = len(data)
+            digest = hashlib.sha256(data).hexdigest()
+            front_matter, offset = split_front_matter(data[:FRONT_MATTER_MAX_BYTES], at_eof=size <= FRONT_MATTER_MAX_BYTES)
+            text = (data[offset:] if offset else data).decode("utf-8")
+            has_cr = data.find(b"\r", offset) != -1
+            del data
+
+    if has_cr:
+        text = _translate_newlines(text)
+    return LessonSource(resolved_path=str(path), bytes=size, sha256=digest, text=text, front_matter=front_matter)
+
+
+def sha256_file(path: Path) -> str:
+    """SHA-256 of a file's raw bytes, read in chunks."""
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(SOURCE_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def infer_title_from_md(md: str) -> Optional[str]:
+    return _first_heading_line(md)
+
+
 def normalise_path_str(p: str) -> str:
     """
     Deterministic normalisation:
@@ -63,10 +363,13 @@ def resolve_source_path(course_yml_path: Path, source: str) -> Path:
     return src if src.is_absolute() else (course_root / src)
 
 
-def load_lesson_source(course_yml_path: Path, source: str) -> LessonSourceResult:
+def load_lesson_source(course_yml_path: Path, source: str, *, read_markdown: bool = True) -> LessonSourceResult:
     """
     Load a lesson markdown source file referenced by a content block `source:`.
 
+    With read_markdown=False the file is streamed (see read_lesson_source) and
+    `markdown` is None, so provenance-only callers use constant memory.
+
     Returns a LessonSourceResult that never raises (unless arguments are invalid types).
     """
     declared = source
@@ -85,16 +388,15 @@ def load_lesson_source(course_yml_path: Path, source: str) -> LessonSourceResult
         )
 
     try:
-        b = resolved.read_bytes()
-        md = b.decode("utf-8")
+        src = read_lesson_source(resolved, keep_text=read_markdown)
         return LessonSourceResult(
             declared_path=declared,
             resolved_path=str(resolved),
             resolved_path_normalised=normalise_path_str(str(resolved)),
             exists=True,
-            bytes=len(b),
-            hash_sha256=sha256_bytes(b),
-            markdown=md,
+            bytes=src.bytes,
+            hash_sha256=src.sha256,
+            markdown=src.text,
             error=None,
         )
     except Exception as e:
@@ -4,38 +4,66 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import os
 import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
-
-import yaml
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
 try:
     from importlib.metadata import version as pkg_version  # type: ignore
 except Exception:  # pragma: no cover
     pkg_version = None  # type: ignore
 
+from . import yaml_io
+from .build_state import BUILD_STATE_FILENAME
+from .fileops import WriteTracker
 from .signals import compute_signals
 from .reporting import build_governance_self_audit
 
+if TYPE_CHECKING:
+    from .course_context import CourseContext
+
 MANIFEST_VERSION = "1.5.0"
 
+# Bounded concurrency for hashing the output inventory (hashlib releases the GIL
+# while digesting, so threads overlap both I/O and hashing).
+INVENTORY_HASH_WORKERS = 8
 
-def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+# Without hashlib.file_digest (Python < 3.11), files at least this large are hashed
+# from a memory map instead of a chunked read loop.
+INVENTORY_MMAP_MIN_BYTES = 1 << 20
 
+_file_digest = getattr(hashlib, "file_digest", None)
 
-def _safe_relpath(path: Path, start: Path) -> str:
-    try:
-        return str(path.relative_to(start))
-    except Exception:
-        return str(path)
+# Stat cache for incremental inventories (lives inside the output dir, next to
+# manifest.json): relative path -> [size, mtime_ns, inode, sha256]. A file whose
+# stat still matches reuses the recorded digest instead of being read again.
+INVENTORY_CACHE_FILENAME = ".course-engine-inventory.json"
+INVENTORY_CACHE_VERSION = "1"
+
+# Files modified this shortly before the inventory started are not recorded: a
+# same-size rewrite within one timestamp tick would otherwise go unnoticed.
+INVENTORY_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
 
 
 def _sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
+        if _file_digest is not None:
+            return _file_digest(f, "sha256").hexdigest()
+        size = os.fstat(f.fileno()).st_size
+        if size and size >= INVENTORY_MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        h = hashlib.sha256()
         while True:
             chunk = f.read(chunk_size)
             if not chunk:
@@ -48,10 +76,90 @@ def _sha256_text(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
-def _iter_files(out_dir: Path) -> Iterable[Path]:
-    for p in sorted(out_dir.rglob("*")):
-        if p.is_file():
-            yield p
+@dataclass(frozen=True)
+class InventoryExcludes:
+    """
+    What the manifest file inventory leaves out: directories (any path component,
+    pruned before descent), file names and file suffixes.
+    """
+    dirs: frozenset[str] = frozenset({".quarto"})
+    files: frozenset[str] = frozenset(
+        {"manifest.json", ".DS_Store", ".gitignore", BUILD_STATE_FILENAME, INVENTORY_CACHE_FILENAME}
+    )
+    suffixes: frozenset[str] = frozenset({".log", ".aux", ".out"})
+
+    def excludes_file(self, name: str) -> bool:
+        # A path component matching `dirs` excludes a file too (as the directory check does).
+        return name in self.dirs or name in self.files or _suffix(name) in self.suffixes
+
+
+DEFAULT_INVENTORY_EXCLUDES = InventoryExcludes()
+
+# Quarto project outputs also carry Quarto's execution cache (`_freeze/`), which is
+# render state rather than course content.
+QUARTO_INVENTORY_EXCLUDES = replace(DEFAULT_INVENTORY_EXCLUDES, dirs=DEFAULT_INVENTORY_EXCLUDES.dirs | {"_freeze"})
+
+# Per output format (manifest output.format) inventory rules; formats not listed use
+# DEFAULT_INVENTORY_EXCLUDES.
+INVENTORY_EXCLUDES: Dict[str, InventoryExcludes] = {
+    "quarto": QUARTO_INVENTORY_EXCLUDES,
+    "html-single": QUARTO_INVENTORY_EXCLUDES,
+    "pdf": QUARTO_INVENTORY_EXCLUDES,
+}
+
+
+def inventory_excludes(output_format: Optional[str]) -> InventoryExcludes:
+    if output_format is None:
+        return DEFAULT_INVENTORY_EXCLUDES
+    return INVENTORY_EXCLUDES.get(output_format, DEFAULT_INVENTORY_EXCLUDES)
+
+
+def _suffix(name: str) -> str:
+    # Same as PurePath(name).suffix, without building a path.
+    i = name.rfind(".")
+    return name[i:] if 0 < i < len(name) - 1 else ""
+
+
+def _walk_files(
+    out_dir: Path,
+    excludes: InventoryExcludes = DEFAULT_INVENTORY_EXCLUDES,
+) -> Iterator[tuple[str, Path, Optional[os.stat_result]]]:
+    """
+    (relative path, path, stat) for every non-excluded file under out_dir, in the
+    order of sorted(out_dir.rglob("*")): entries are sorted per directory and
+    subdirectories are walked depth-first. Excluded directories are never entered;
+    symlinked directories are not followed (as rglob). stat is the DirEntry's (None
+    if it failed).
+    """
+
+    def _walk(d: str, prefix: str) -> Iterator[tuple[str, Path, Optional[os.stat_result]]]:
+        try:
+            with os.scandir(d) as it:
+                entries = sorted(it, key=lambda e: os.path.normcase(e.name))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if entry.name not in excludes.dirs:
+                    yield from _walk(entry.path, prefix + entry.name + os.sep)
+                continue
+            try:
+                is_file = entry.is_file()
+            except OSError:
+                continue
+            if not is_file or excludes.excludes_file(entry.name):
+                continue
+            try:
+                st: Optional[os.stat_result] = entry.stat()
+            except OSError:
+                st = None
+            yield prefix + entry.name, Path(entry.path), st
+
+    yield from _walk(str(out_dir), "")
 
 
 def get_course_engine_version(default: str = "unknown") -> str:
@@ -63,20 +171,32 @@ def get_course_engine_version(default: str = "unknown") -> str:
         return default
 
 
-def _should_exclude(rel_path: str) -> bool:
-    p = Path(rel_path)
+def _load_inventory_cache(out_dir: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads((out_dir / INVENTORY_CACHE_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INVENTORY_CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_inventory_cache(out_dir: Path, files: Dict[str, Any]) -> None:
+    p = out_dir / INVENTORY_CACHE_FILENAME
+    tmp = p.with_name(f"{p.name}.tmp")
+    try:
+        tmp.write_text(
+            json.dumps({"version": INVENTORY_CACHE_VERSION, "files": files}, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        tmp.replace(p)
+    except OSError:
+        tmp.unlink(missing_ok=True)
 
-    EXCLUDE_DIRS = {".quarto"}
-    EXCLUDE_FILES = {"manifest.json", ".DS_Store", ".gitignore"}
-    EXCLUDE_SUFFIXES = {".log", ".aux", ".out"}
 
-    if any(part in EXCLUDE_DIRS for part in p.parts):
-        return True
-    if p.name in EXCLUDE_FILES:
-        return True
-    if p.suffix in EXCLUDE_SUFFIXES:
-        return True
-    return False
+def _stamp(st: os.stat_result) -> list[int]:
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
 
 
 def build_file_inventory(
@@ -84,34 +204,87 @@ def build_file_inventory(
     *,
     include_hashes: bool = True,
     include_sizes: bool = True,
+    stat_cache: bool = False,
+    rehash: bool = False,
+    output_format: Optional[str] = None,
+    excludes: Optional[InventoryExcludes] = None,
+    writes: Optional[WriteTracker] = None,
 ) -> list[dict[str, Any]]:
+    """
+    Inventory of the files in out_dir, sorted by path. Files are left out per
+    excludes (default: the rules for output_format, see inventory_excludes).
+
+    Files recorded by writes (utils.fileops.track_writes) and not changed since
+    take the digest computed while they were written instead of being read back.
+
+    With stat_cache, digests of files whose (size, mtime_ns, inode) are unchanged
+    since the last such inventory are reused from INVENTORY_CACHE_FILENAME and only
+    new or modified files are read; rehash ignores the recorded digests (a full
+    pass) and records fresh ones.
+    """
     out_dir = Path(out_dir)
+    started_ns = time.time_ns()
     files: list[dict[str, Any]] = []
+    paths: list[Path] = []
+    stats: list[Optional[os.stat_result]] = []
 
-    for file_path in _iter_files(out_dir):
-        rel = _safe_relpath(file_path, out_dir)
-        if _should_exclude(rel):
-            continue
-
+    for rel, file_path, st in _walk_files(out_dir, excludes or inventory_excludes(output_format)):
         entry: Dict[str, Any] = {"path": rel}
 
-        if include_sizes:
-            try:
-                entry["bytes"] = file_path.stat().st_size
-            except Exception:
-                pass
-
-        if include_hashes:
-            try:
-                entry["sha256"] = _sha256_file(file_path)
-            except Exception:
-                entry["sha256"] = None
+        if include_sizes and st is not None:
+            entry["bytes"] = st.st_size
 
         files.append(entry)
-
+        paths.append(file_path)
+        stats.append(st)
+
+    if not include_hashes:
+        return files
+
+    previous = _load_inventory_cache(out_dir) if stat_cache and not rehash else {}
+    todo: list[int] = []
+    for i, (entry, st) in enumerate(zip(files, stats)):
+        written = writes.lookup(st) if writes is not None and st is not None else None
+        known = previous.get(entry["path"])
+        if written is not None:
+            entry["sha256"] = written.sha256
+        elif st is not None and isinstance(known, list) and len(known) == 4 and known[:3] == _stamp(st):
+            entry["sha256"] = known[3]
+        else:
+            todo.append(i)
+    for i, digest in zip(todo, _hash_files([paths[i] for i in todo])):
+        files[i]["sha256"] = digest
+
+    if not stat_cache:
+        return files
+
+    recorded: Dict[str, Any] = {}
+    for entry, st in zip(files, stats):
+        if st is None or entry["sha256"] is None or st.st_mtime_ns > started_ns - INVENTORY_RACY_WINDOW_NS:
+            continue
+        recorded[entry["path"]] = [*_stamp(st), entry["sha256"]]
+    _save_inventory_cache(out_dir, recorded)
     return files
 
 
+def _sha256_file_or_none(path: Path) -> Optional[str]:
+    try:
+        return _sha256_file(path)
+    except Exception:
+        return None
+
+
+def _hash_files(paths: list[Path]) -> list[Optional[str]]:
+    """SHA-256 per path (None when unreadable), in input order; hashed concurrently."""
+    if len(paths) < 2:
+        return [_sha256_file_or_none(p) for p in paths]
+    with ThreadPoolExecutor(
+        max_workers=min(INVENTORY_HASH_WORKERS, len(paths)),
+        thread_name_prefix="course-engine-hash",
+    ) as pool:
+        return list(pool.map(_sha256_file_or_none, paths))
+
+
 def _to_plain_dict(obj: Any) -> Optional[Dict[str, Any]]:
     if obj is None:
         return None
@@ -249,7 +422,30 @@ def _lesson_sources_for_manifest(spec: Any) -> Optional[Dict[str, Any]]:
     }
 
 
-def _design_intent_for_manifest(source_course_yml: Optional[Path]) -> Optional[Dict[str, Any]]:
+def _includes_for_manifest(spec: Any) -> Optional[Dict[str, Any]]:
+    files = [
+        {
+            "path": inc.path,
+            "resolved_path": inc.resolved_path,
+            "kind": inc.kind,
+            "module_id": inc.module_id,
+            "bytes": inc.bytes,
+            "sha256": inc.sha256,
+        }
+        for inc in getattr(spec, "includes", None) or []
+    ]
+    if not files:
+        return None
+
+    return {
+        "count": len(files),
+        "files": files,
+        "status": "informational (not enforced)",
+    }
+
+
+def _raw_course_for_manifest(source_course_yml: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Parse course.yml once for the raw-YAML manifest blocks (None if unavailable)."""
     if not source_course_yml:
         return None
 
@@ -258,10 +454,14 @@ def _design_intent_for_manifest(source_course_yml: Optional[Path]) -> Optional[D
         return None
 
     try:
-        raw = yaml.safe_load(p.read_text(encoding="utf-8"))
+        _, raw = yaml_io.load_file(p)
     except Exception:
         return None
 
+    return raw if isinstance(raw, dict) else None
+
+
+def _design_intent_for_manifest(raw: Any) -> Optional[Dict[str, Any]]:
     if not isinstance(raw, dict):
         return None
 
@@ -284,25 +484,13 @@ def _design_intent_for_manifest(source_course_yml: Optional[Path]) -> Optional[D
     return block
 
 
-def _ai_scoping_for_manifest(source_course_yml: Optional[Path]) -> Optional[Dict[str, Any]]:
+def _ai_scoping_for_manifest(raw: Any) -> Optional[Dict[str, Any]]:
     """
     v1.13+ / manifest v1.5.0:
     Record AI scoping (presence + stable hash) from canonical course.yml.
 
     This is structural metadata only (no interpretation, no enforcement).
     """
-    if not source_course_yml:
-        return None
-
-    p = Path(source_course_yml)
-    if not p.exists():
-        return None
-
-    try:
-        raw = yaml.safe_load(p.read_text(encoding="utf-8"))
-    except Exception:
-        return None
-
     if not isinstance(raw, dict):
         return None
 
@@ -341,8 +529,19 @@ def build_manifest(
     source_course_yml: Optional[Path] = None,
     include_hashes: bool = True,
     include_sizes: bool = True,
+    context: Optional["CourseContext"] = None,
+    writes: Optional[WriteTracker] = None,
 ) -> Dict[str, Any]:
+    """
+    Build the manifest dict for out_dir.
+
+    With a CourseContext, the raw course.yml, signals and governance audit come from
+    it; otherwise course.yml is parsed (once) and signals/audit are computed here.
+    With writes (the tracker the build ran under), files the build wrote are not
+    read back to hash them.
+    """
     out_dir = Path(out_dir)
+    raw = context.raw if context is not None else _raw_course_for_manifest(source_course_yml)
 
     course_id = getattr(spec, "id", None) or getattr(getattr(spec, "course", None), "id", None)
     course_title = getattr(spec, "title", None) or getattr(getattr(spec, "course", None), "title", None)
@@ -362,15 +561,21 @@ def build_manifest(
         "input": {"course_yml": str(source_course_yml) if source_course_yml else None},
         "course": spec_meta,
         "output": {"format": output_format, "out_dir": str(out_dir)},
-        "signals": _signals_for_manifest(spec),
-        "files": build_file_inventory(out_dir, include_hashes=include_hashes, include_sizes=include_sizes),
+        "signals": context.signals if context is not None else _signals_for_manifest(spec),
+        "files": build_file_inventory(
+            out_dir,
+            include_hashes=include_hashes,
+            include_sizes=include_sizes,
+            output_format=output_format,
+            writes=writes,
+        ),
     }
 
-    design_intent = _design_intent_for_manifest(source_course_yml)
+    design_intent = _design_intent_for_manifest(raw)
     if design_intent is not None:
         manifest["design_intent"] = design_intent
 
-    ai_scoping = _ai_scoping_for_manifest(source_course_yml)
+    ai_scoping = _ai_scoping_for_manifest(raw)
     if ai_scoping is not None:
         manifest["ai_scoping"] = ai_scoping
 
@@ -386,8 +591,14 @@ def build_manifest(
     if lesson_sources is not None:
         manifest["lesson_sources"] = lesson_sources
 
+    includes = _includes_for_manifest(spec)
+    if includes is not None:
+        manifest["includes"] = includes
+
     # v1.13+ / manifest v1.5.0: Governance Self-Audit
-    manifest["governance_audit"] = build_governance_self_audit(spec)
+    manifest["governance_audit"] = (
+        context.audit if context is not None else build_governance_self_audit(spec)
+    )
 
     return manifest
 
@@ -399,6 +610,8 @@ def write_manifest(
     output_format: str,
     source_course_yml: Optional[Path] = None,
     include_hashes: bool = True,
+    context: Optional["CourseContext"] = None,
+    writes: Optional[WriteTracker] = None,
 ) -> Path:
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -410,6 +623,8 @@ def write_manifest(
         source_course_yml=source_course_yml,
         include_hashes=include_hashes,
         include_sizes=True,
+        context=context,
+        writes=writes,
     )
 
     manifest_path = out_dir / "manifest.json"
@@ -443,12 +658,24 @@ def load_manifest(out_dir: Path) -> Dict[str, Any]:
     return data
 
 
+def _manifest_output_format(manifest: Dict[str, Any]) -> Optional[str]:
+    output = manifest.get("output")
+    fmt = output.get("format") if isinstance(output, dict) else None
+    return fmt if isinstance(fmt, str) else None
+
+
 def refresh_manifest(
     out_dir: Path,
     *,
     include_hashes: bool = True,
     include_sizes: bool = True,
+    rehash: bool = False,
 ) -> Path:
+    """
+    Rewrite the manifest inventory for out_dir. Digests of files unchanged since the
+    last refresh/render are reused (see build_file_inventory); rehash=True reads
+    every file again.
+    """
     out_dir = Path(out_dir)
     manifest_path = out_dir / "manifest.json"
     if not manifest_path.exists():
@@ -469,7 +696,14 @@ def refresh_manifest(
         }
     )
 
-    manifest["files"] = build_file_inventory(out_dir, include_hashes=include_hashes, include_sizes=include_sizes)
+    manifest["files"] = build_file_inventory(
+        out_dir,
+        include_hashes=include_hashes,
+        include_sizes=include_sizes,
+        stat_cache=True,
+        rehash=rehash,
+        output_format=_manifest_output_format(manifest),
+    )
 
     manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
     return manifest_path
@@ -480,8 +714,14 @@ def update_manifest_after_render(
     *,
     to: Optional[str] = None,
     input_file: Optional[str] = None,
+    inputs: Optional[list[str]] = None,
     include_hashes: bool = True,
+    rehash: bool = False,
 ) -> Path:
+    """
+    Record a render in the manifest and re-inventory out_dir, reusing digests of
+    files unchanged since the last inventory (rehash=True reads every file again).
+    """
     out_dir = Path(out_dir)
     manifest_path = out_dir / "manifest.json"
     if not manifest_path.exists():
@@ -494,9 +734,19 @@ def update_manifest_after_render(
         "to": to,
         "input_file": input_file,
     }
+    # Partial (changed-only) renders record exactly which inputs were rendered.
+    if inputs is not None:
+        manifest["render"]["inputs"] = list(inputs)
     manifest["manifest_version"] = MANIFEST_VERSION
 
-    manifest["files"] = build_file_inventory(out_dir, include_hashes=include_hashes, include_sizes=True)
+    manifest["files"] = build_file_inventory(
+        out_dir,
+        include_hashes=include_hashes,
+        include_sizes=True,
+        stat_cache=True,
+        rehash=rehash,
+        output_format=_manifest_output_format(manifest),
+    )
 
     manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
     return manifest_path
@@ -9,12 +9,12 @@ from types import ModuleType
 from typing import Any, Dict, List, Optional, Union
 
 # YAML is optional at import time, but required for .yml/.yaml policies.
-yaml: ModuleType | None
+yaml_io: ModuleType | None
 try:
-    import yaml as _yaml  # type: ignore
-    yaml = _yaml
+    from . import yaml_io as _yaml_io
+    yaml_io = _yaml_io
 except Exception:  # pragma: no cover
-    yaml = None
+    yaml_io = None
 
 
 PolicyDict = Dict[str, Any]
@@ -65,9 +65,9 @@ def load_policy_file(path: Union[str, Path]) -> PolicyDict:
 
     suffix = p.suffix.lower()
     if suffix in {".yml", ".yaml"}:
-        if yaml is None:
+        if yaml_io is None:
             raise ValueError("YAML policy files require PyYAML. Install with: pip install pyyaml")
-        data = yaml.safe_load(p.read_text(encoding="utf-8"))
+        _, data = yaml_io.load_file(p)
     elif suffix == ".json":
         data = json.loads(p.read_text(encoding="utf-8"))
     else:
@@ -174,9 +174,9 @@ def _load_preset_policy(name: str) -> PolicyDict:
 
 def _load_policy_from_text(text: str, *, suffix: str) -> PolicyDict:
     if suffix in {".yml", ".yaml"}:
-        if yaml is None:
+        if yaml_io is None:
             raise ValueError("YAML support requires PyYAML.")
-        data = yaml.safe_load(text)
+        data = yaml_io.safe_load(text)
     else:
         data = json.loads(text)
 
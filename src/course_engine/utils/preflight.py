@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import os
 import platform
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .cache import cache_subdir
+
 
 class PrereqError(RuntimeError):
     """Raised when an external prerequisite is missing."""
@@ -19,6 +24,19 @@ class PrereqError(RuntimeError):
 # Cache PDF preflight result per process to avoid re-checking repeatedly.
 _PDF_PREFLIGHT_OK: Optional[bool] = None
 
+# Successful PDF preflights are also cached on disk (each CLI call is a new process).
+PDF_PREFLIGHT_CACHE_FILE = "pdf-toolchain.json"
+PDF_PREFLIGHT_TTL_ENV = "COURSE_ENGINE_PREFLIGHT_TTL"
+PDF_PREFLIGHT_TTL_SECONDS = 24 * 60 * 60
+
+# LaTeX engines/tools whose presence and mtime identify the TeX installation.
+_TEX_BINARIES = ("xelatex", "lualatex", "pdflatex", "tlmgr")
+_TINYTEX_DIRS = (
+    Path.home() / ".TinyTeX",
+    Path.home() / "Library" / "TinyTeX",
+    Path(os.getenv("APPDATA") or Path.home()) / "TinyTeX",
+)
+
 
 def has_quarto() -> bool:
     """Return True if Quarto is available on PATH."""
@@ -44,19 +62,86 @@ def require_quarto() -> None:
         )
 
 
-def require_pdf_toolchain() -> None:
-    """
-    Ensure PDF rendering works by doing a tiny Quarto->PDF smoke test.
+def _mtime_ns(path: Optional[str | Path]) -> Optional[int]:
+    if not path:
+        return None
+    try:
+        return Path(path).resolve().stat().st_mtime_ns
+    except OSError:
+        return None
 
-    This avoids fragile parsing of `quarto check` output.
+
+def _pdf_toolchain_key() -> Dict[str, Any]:
     """
-    global _PDF_PREFLIGHT_OK
+    Identity of the PDF toolchain: Quarto path/version and TeX binaries/installs
+    with their mtimes. Any upgrade or reinstall changes the key.
+    """
+    quarto_path = get_quarto_path()
+    tex: Dict[str, Any] = {}
+    for name in _TEX_BINARIES:
+        p = shutil.which(name)
+        tex[name] = {"path": p, "mtime_ns": _mtime_ns(p)}
+
+    tinytex = {str(d): _mtime_ns(d) for d in _TINYTEX_DIRS if d.exists()}
+
+    return {
+        "quarto": {
+            "path": quarto_path,
+            "version": get_quarto_version(),
+            "mtime_ns": _mtime_ns(quarto_path),
+        },
+        "tex": tex,
+        "tinytex": tinytex,
+    }
+
+
+def _pdf_preflight_ttl() -> float:
+    raw = os.getenv(PDF_PREFLIGHT_TTL_ENV, "").strip()
+    try:
+        return float(raw) if raw else float(PDF_PREFLIGHT_TTL_SECONDS)
+    except ValueError:
+        return float(PDF_PREFLIGHT_TTL_SECONDS)
+
+
+def _pdf_cache_path() -> Optional[Path]:
+    d = cache_subdir("preflight")
+    return d / PDF_PREFLIGHT_CACHE_FILE if d is not None else None
+
+
+def _pdf_cache_hit(key: Dict[str, Any]) -> bool:
+    p = _pdf_cache_path()
+    if p is None or not p.is_file():
+        return False
+    try:
+        data = json.loads(p.read_text(encoding="utf-8"))
+    except Exception:
+        return False
+    if not isinstance(data, dict) or data.get("key") != key or data.get("ok") is not True:
+        return False
+
+    checked_at = data.get("checked_at")
+    if not isinstance(checked_at, (int, float)):
+        return False
+    return (time.time() - checked_at) < _pdf_preflight_ttl()
 
-    if _PDF_PREFLIGHT_OK is True:
+
+def _pdf_cache_store(key: Dict[str, Any]) -> None:
+    p = _pdf_cache_path()
+    if p is None:
         return
+    try:
+        tmp = p.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"key": key, "ok": True, "checked_at": time.time()}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+        tmp.replace(p)
+    except OSError:
+        pass
 
-    require_quarto()
 
+def _pdf_smoke_test() -> None:
+    """Run a tiny Quarto->PDF render; raise PrereqError if it fails."""
     with tempfile.TemporaryDirectory(prefix="course-engine-pdf-check-") as td:
         tdir = Path(td)
 
@@ -85,8 +170,6 @@ def require_pdf_toolchain() -> None:
         completed = subprocess.run(cmd, capture_output=True, text=True)
 
         if completed.returncode != 0:
-            _PDF_PREFLIGHT_OK = False
-
             stderr = (completed.stderr or "").strip()
             stdout = (completed.stdout or "").strip()
 
@@ -104,7 +187,44 @@ def require_pdf_toolchain() -> None:
 
             raise PrereqError(msg)
 
+
+def require_pdf_toolchain(*, refresh: bool = False) -> str:
+    """
+    Ensure PDF rendering works by doing a tiny Quarto->PDF smoke test.
+
+    This avoids fragile parsing of `quarto check` output.
+
+    Successful results are cached per process and on disk (keyed by the Quarto
+    path/version and TeX binaries/mtimes, valid for COURSE_ENGINE_PREFLIGHT_TTL
+    seconds, default 24h). Failures are never cached.
+
+    Args:
+        refresh: Ignore both caches and re-run the smoke test.
+
+    Returns:
+        "process-cache", "disk-cache" or "checked" (how readiness was established).
+    """
+    global _PDF_PREFLIGHT_OK
+
+    if _PDF_PREFLIGHT_OK is True and not refresh:
+        return "process-cache"
+
+    require_quarto()
+
+    key = _pdf_toolchain_key()
+    if not refresh and _pdf_cache_hit(key):
+        _PDF_PREFLIGHT_OK = True
+        return "disk-cache"
+
+    try:
+        _pdf_smoke_test()
+    except PrereqError:
+        _PDF_PREFLIGHT_OK = False
+        raise
+
     _PDF_PREFLIGHT_OK = True
+    _pdf_cache_store(key)
+    return "checked"
 
 
 def _run_version_cmd(cmd: list[str]) -> Optional[str]:
@@ -217,10 +337,13 @@ def get_preflight_exit_code(
         return 1
 
 
-def build_preflight_report() -> Dict[str, Any]:
+def build_preflight_report(*, refresh: bool = False) -> Dict[str, Any]:
     """
     Machine-readable preflight report (facts only).
     Designed for: course-engine check --json / --format json
+
+    Args:
+        refresh: Re-run the PDF smoke test even if a cached result is valid.
     """
     now = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
@@ -234,10 +357,11 @@ def build_preflight_report() -> Dict[str, Any]:
 
     pdf_ready = False
     pdf_error: Optional[str] = None
+    pdf_source: Optional[str] = None
 
     if quarto_present:
         try:
-            require_pdf_toolchain()
+            pdf_source = require_pdf_toolchain(refresh=refresh)
             pdf_ready = True
         except PrereqError as e:
             pdf_ready = False
@@ -272,6 +396,8 @@ def build_preflight_report() -> Dict[str, Any]:
         "pdf": {
             "ready": pdf_ready,
             "error": pdf_error,
+            # v1.22+: "checked" | "disk-cache" | "process-cache" (null when not evaluated/failed)
+            "source": pdf_source,
         },
         "filesystem": {
             "temp_write": _temp_write_check(),
@@ -141,6 +141,8 @@ def report_to_text(report: Dict[str, Any], *, verbose: bool = False) -> str:
     else:
         lines.append("- Tip: run with --verbose to see declared coverage/evidence lists.")
 
+    return "\n".join(lines) + "\n"
+
 def build_governance_self_audit(spec: Any) -> Dict[str, Any]:
     """
     Assess the completeness of governance declarations (AI Scoping, Design Intent).
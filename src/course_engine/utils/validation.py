@@ -7,10 +7,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
-
 from course_engine.model import Signal, SignalAction, SignalSeverity, SignalsPolicy
 
+from . import yaml_io
+
 
 DEFAULT_PROFILE: Dict[str, Any] = {
     "rules": {
@@ -112,7 +112,8 @@ def load_profile(profile_path: Optional[str]) -> Dict[str, Any]:
     if not p.exists():
         raise FileNotFoundError(f"Profile not found: {p}")
 
-    data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    _, data = yaml_io.load_file(p)
+    data = data or {}
 
     # Shallow merge: user profile overrides defaults
     merged = dict(DEFAULT_PROFILE)
@@ -0,0 +1,282 @@
+# src/course_engine/utils/watcher.py
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Protocol
+
+# inotify(7) constants (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class Watcher(Protocol):
+    """
+    Reports which watched paths changed.
+
+    set_paths may be called again to change the watched set; changes to paths that
+    stay watched are still reported by the next poll, even if they happened before it.
+    """
+
+    def set_paths(self, files: Iterable[Path], dirs: Iterable[Path]) -> None: ...
+
+    def poll(self, timeout: float) -> set[Path]: ...
+
+    def close(self) -> None: ...
+
+
+class _WatchSet:
+    """Watched files plus directory trees (all paths absolute)."""
+
+    def __init__(self) -> None:
+        self.files: set[Path] = set()
+        self.dirs: set[Path] = set()
+
+    def update(self, files: Iterable[Path], dirs: Iterable[Path]) -> "_WatchSet":
+        """Replace the watched paths; returns the previous set."""
+        previous = _WatchSet()
+        previous.files, previous.dirs = self.files, self.dirs
+        self.files = {Path(os.path.abspath(p)) for p in files}
+        self.dirs = {Path(os.path.abspath(d)) for d in dirs}
+        return previous
+
+    def contains(self, path: Path) -> bool:
+        if path in self.files:
+            return True
+        return any(d == path or d in path.parents for d in self.dirs)
+
+
+def _stat_key(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class PollingWatcher:
+    """Portable fallback: compares (mtime_ns, size) snapshots."""
+
+    def __init__(self, interval: float = 0.5) -> None:
+        self.interval = interval
+        self._watch = _WatchSet()
+        self._snapshot: Dict[Path, Optional[tuple[int, int]]] = {}
+
+    def _scan(self) -> Dict[Path, Optional[tuple[int, int]]]:
+        snap: Dict[Path, Optional[tuple[int, int]]] = {p: _stat_key(p) for p in self._watch.files}
+        for d in self._watch.dirs:
+            if not d.is_dir():
+                continue
+            for p in d.rglob("*"):
+                if p.is_file():
+                    snap[p] = _stat_key(p)
+        return snap
+
+    def set_paths(self, files: Iterable[Path], dirs: Iterable[Path]) -> None:
+        previous = self._watch.update(files, dirs)
+        # Paths that were already watched keep their baseline, so an edit made since the
+        # last poll is still reported; only newly watched paths get a fresh one.
+        snap: Dict[Path, Optional[tuple[int, int]]] = {}
+        for p, key in self._scan().items():
+            if p in self._snapshot:
+                snap[p] = self._snapshot[p]
+            elif not previous.contains(p):
+                snap[p] = key
+        for p, key in self._snapshot.items():
+            if p not in snap and self._watch.contains(p):
+                snap[p] = key  # deleted since the last poll: reported next time
+        self._snapshot = snap
+
+    def poll(self, timeout: float) -> set[Path]:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            current = self._scan()
+            changed = {
+                p
+                for p in set(current) | set(self._snapshot)
+                if current.get(p) != self._snapshot.get(p)
+            }
+            self._snapshot = current
+            if changed:
+                return changed
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        self._snapshot = {}
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not all(hasattr(libc, n) for n in ("inotify_init1", "inotify_add_watch", "inotify_rm_watch")):
+        return None
+    return libc
+
+
+class InotifyWatcher:
+    """
+    Linux inotify watcher (via ctypes; no third-party dependency).
+
+    Watches the parent directory of each file (editors often save by atomic
+    rename, which replaces the inode) and every directory of the watched trees.
+    """
+
+    def __init__(self, libc: ctypes.CDLL) -> None:
+        self._libc = libc
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._fd = fd
+        self._watch = _WatchSet()
+        self._wds: Dict[int, Path] = {}
+
+    def _add_dir(self, d: Path) -> None:
+        if d in self._wds.values() or not d.is_dir():
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(d)), _WATCH_MASK)
+        if wd >= 0:
+            self._wds[wd] = d
+
+    def set_paths(self, files: Iterable[Path], dirs: Iterable[Path]) -> None:
+        # Watches that stay wanted are kept (events queued on them are not lost); only
+        # the difference is added or removed.
+        self._watch.update(files, dirs)
+        wanted = {f.parent for f in self._watch.files}
+        for d in self._watch.dirs:
+            wanted.add(d)
+            if d.is_dir():
+                wanted.update(sub for sub in d.rglob("*") if sub.is_dir())
+
+        for wd, d in list(self._wds.items()):
+            if d not in wanted:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._wds[wd]
+        for d in sorted(wanted):
+            self._add_dir(d)
+
+    def _read_events(self) -> set[Path]:
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except OSError as e:
+            if e.errno == errno.EAGAIN:
+                return set()
+            raise
+
+        changed: set[Path] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buf[offset : offset + name_len].rstrip(b"\0")
+            offset += name_len
+
+            if mask & _IN_Q_OVERFLOW:
+                # Kernel queue overflowed: treat everything as changed.
+                changed |= set(self._watch.files) | set(self._watch.dirs)
+                continue
+            if mask & _IN_IGNORED:
+                self._wds.pop(wd, None)
+                continue
+
+            base = self._wds.get(wd)
+            if base is None:
+                continue
+            path = base / os.fsdecode(raw_name) if raw_name else base
+
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                if self._watch.contains(path):
+                    self._add_dir(path)
+            if self._watch.contains(path):
+                changed.add(path)
+        return changed
+
+    def poll(self, timeout: float) -> set[Path]:
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed = self._read_events()
+            if changed or time.monotonic() >= deadline:
+                return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(*, force_polling: bool = False, interval: float = 0.5) -> Watcher:
+    """Return an inotify watcher where available, else a polling watcher."""
+    if not force_polling:
+        libc = _load_libc()
+        if libc is not None:
+            try:
+                return InotifyWatcher(libc)
+            except OSError:
+                pass
+    return PollingWatcher(interval=interval)
+
+
+def wait_for_changes(watcher: Watcher, *, debounce: float, timeout: Optional[float] = None) -> set[Path]:
+    """
+    Block until something changes, then keep collecting until `debounce` seconds
+    pass without further events (coalescing editor save bursts).
+
+    Returns the changed paths, or an empty set if `timeout` expires first.
+    """
+    first = watcher.poll(timeout if timeout is not None else 3600.0)
+    while not first and timeout is None:
+        first = watcher.poll(3600.0)
+    if not first:
+        return set()
+
+    changed = set(first)
+    while True:
+        more = watcher.poll(debounce)
+        if not more:
+            return changed
+        changed |= more
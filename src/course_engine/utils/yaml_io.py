@@ -0,0 +1,39 @@
+# src/course_engine/utils/yaml_io.py
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+# LibYAML-backed loader when PyYAML was built with it; the pure-Python SafeLoader
+# otherwise. Both construct the same safe YAML 1.1 tag set, so documents load to the
+# same Python objects; only speed differs.
+PURE_YAML_ENV = "COURSE_ENGINE_PURE_YAML"
+LIBYAML_AVAILABLE: bool = hasattr(yaml, "CSafeLoader")
+_FAST_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_loader() -> Any:
+    """The SafeLoader class in use (set COURSE_ENGINE_PURE_YAML=1 to force pure Python)."""
+    if os.getenv(PURE_YAML_ENV, "").strip():
+        return yaml.SafeLoader
+    return _FAST_LOADER
+
+
+def safe_load(data: Union[str, bytes]) -> Any:
+    """
+    Drop-in replacement for yaml.safe_load. Bytes are decoded as strict UTF-8 first,
+    matching how course.yml has always been read (UnicodeDecodeError is not masked).
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = bytes(data).decode("utf-8")
+    return yaml.load(data, Loader=safe_loader())
+
+
+def load_file(path: Union[str, Path]) -> tuple[bytes, Any]:
+    """Read a YAML file once and return (raw bytes, parsed document)."""
+    data_bytes = Path(path).read_bytes()
+    return data_bytes, safe_load(data_bytes)
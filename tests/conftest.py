@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_user_cache(tmp_path_factory):
+    """Keep on-disk caches (templates, preflight, parsed courses) out of the real user cache."""
+    old = os.environ.get("COURSE_ENGINE_CACHE_DIR")
+    os.environ["COURSE_ENGINE_CACHE_DIR"] = str(tmp_path_factory.mktemp("course-engine-cache"))
+    yield
+    if old is None:
+        os.environ.pop("COURSE_ENGINE_CACHE_DIR", None)
+    else:
+        os.environ["COURSE_ENGINE_CACHE_DIR"] = old
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from benchmarks.model_memory import DEFAULT_MAX_BYTES_PER_BLOCK, measure_block_overhead
+from benchmarks.run import SCENARIOS, format_results, run_benchmarks
+from benchmarks.synth import SynthConfig, generate_course
+from course_engine.generator import build as build_mod
+from course_engine.schema import validate_course_dict
+
+
+def test_synthetic_course_is_valid(tmp_path: Path):
+    cfg = SynthConfig(modules=2, lessons_per_module=3, source_fraction=0.5, capability_domains=3)
+    course_yml = generate_course(tmp_path, cfg)
+    spec = validate_course_dict(yaml.safe_load(course_yml.read_text(encoding="utf-8")), source_course_yml=course_yml)
+
+    lessons = [lesson for m in spec.modules for lesson in m.lessons]
+    assert len(lessons) == cfg.lessons
+    assert sum(1 for lesson in lessons if lesson.source) == 3
+    assert len(spec.capability_mapping.domains) == 3
+
+
+@pytest.mark.smoke
+def test_every_scenario_runs(tmp_path: Path):
+    guard = build_mod._require_quarto
+    payload = run_benchmarks(
+        [SynthConfig(modules=1, lessons_per_module=2), SynthConfig(modules=2, lessons_per_module=2)],
+        scenarios=list(SCENARIOS),
+        repeat=1,
+        workdir=tmp_path,
+    )
+
+    assert build_mod._require_quarto is guard
+    assert {r["scenario"] for r in payload["results"]} == set(SCENARIOS)
+    assert all(r["best_s"] >= 0 and r["peak_bytes"] > 0 for r in payload["results"])
+    assert "scaling" in format_results(payload)
+
+
+def test_model_memory_within_budget():
+    result = measure_block_overhead(2000)
+
+    assert result["blocks"] == 2000
+    assert 0 < result["bytes_per_block"] <= DEFAULT_MAX_BYTES_PER_BLOCK
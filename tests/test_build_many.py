@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from course_engine.cli import app
+from course_engine.generator import build as build_mod
+from course_engine.generator.batch import build_many, discover_course_files, read_course_list
+
+runner = CliRunner()
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+@pytest.fixture(autouse=True)
+def _no_quarto_required(monkeypatch):
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+
+
+def _write_course(path: Path, course_id: str) -> Path:
+    data = {
+        "course": {"id": course_id, "title": course_id.title(), "version": "0.1.0", "language": "en-GB"},
+        "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+        "structure": {
+            "modules": [
+                {
+                    "id": "m1",
+                    "title": "Module 1",
+                    "lessons": [
+                        {"id": "l1", "title": "Lesson 1", "content_blocks": [{"type": "markdown", "body": "Hi"}]}
+                    ],
+                }
+            ]
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return path
+
+
+def _portfolio(root: Path) -> list[Path]:
+    good_a = _write_course(root / "a" / "course.yml", "course-a")
+    bad = root / "b" / "course.yml"
+    bad.parent.mkdir(parents=True)
+    bad.write_text("course: [not, a, mapping\n", encoding="utf-8")
+    good_c = _write_course(root / "c" / "nested" / "course.yml", "course-c")
+    _write_course(root / ".hidden" / "course.yml", "hidden")
+    _write_course(root / "_drafts" / "course.yml", "draft")
+    return [good_a, bad, good_c]
+
+
+def test_discover_skips_hidden_and_underscore_dirs(tmp_path: Path):
+    expected = _portfolio(tmp_path)
+    assert discover_course_files(tmp_path) == expected
+
+
+def test_read_course_list_resolves_relative_to_list_file(tmp_path: Path):
+    lst = tmp_path / "courses.txt"
+    lst.write_text("# portfolio\n\na/course.yml\n/abs/course.yml\n", encoding="utf-8")
+    assert read_course_list(lst) == [tmp_path / "a" / "course.yml", Path("/abs/course.yml")]
+
+
+# Markdown needs no Quarto guard, so the process pool works under any start method.
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_failure_is_isolated_and_order_kept(tmp_path: Path, jobs: int):
+    files = _portfolio(tmp_path / "src")
+    results = build_many(
+        files,
+        out_root=tmp_path / "dist",
+        templates_dir=TEMPLATES_DIR,
+        output_format="markdown",
+        jobs=jobs,
+    )
+
+    assert [r.course_yml for r in results] == [str(p) for p in files]
+    assert [r.status for r in results] == ["ok", "error", "ok"]
+    assert results[1].course_id is None and results[1].error
+    for r in (results[0], results[2]):
+        assert (Path(r.out_dir) / "course.md").is_file()
+        assert Path(r.manifest).is_file()
+
+
+def test_existing_output_requires_overwrite(tmp_path: Path):
+    files = [_write_course(tmp_path / "a" / "course.yml", "course-a")]
+    out = tmp_path / "dist"
+    assert build_many(files, out_root=out, templates_dir=TEMPLATES_DIR)[0].ok
+
+    again = build_many(files, out_root=out, templates_dir=TEMPLATES_DIR)[0]
+    assert again.status == "error" and "already exists" in (again.error or "")
+    assert build_many(files, out_root=out, templates_dir=TEMPLATES_DIR, overwrite=True)[0].ok
+    assert build_many(files, out_root=out, templates_dir=TEMPLATES_DIR, incremental=True)[0].ok
+
+
+def test_cli_prints_summary_and_exits_nonzero_on_failure(tmp_path: Path):
+    _portfolio(tmp_path / "src")
+    summary_path = tmp_path / "summary.json"
+    result = runner.invoke(
+        app,
+        [
+            "build-many",
+            str(tmp_path / "src"),
+            "--out",
+            str(tmp_path / "dist"),
+            "--format",
+            "markdown",
+            "--summary",
+            str(summary_path),
+        ],
+    )
+
+    assert result.exit_code == 1
+    payload = json.loads(summary_path.read_text(encoding="utf-8"))
+    assert payload["batch_summary_version"] == "1"
+    assert (payload["total"], payload["ok"], payload["failed"]) == (3, 2, 1)
+    assert [c["course_id"] for c in payload["courses"]] == ["course-a", None, "course-c"]
+    assert all(isinstance(c["seconds"], float) for c in payload["courses"])
+    assert (tmp_path / "dist" / "course-a-markdown" / "course.md").is_file()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from course_engine import __version__
+from course_engine.cli import app
+from course_engine.explain import explain_course_yml
+from course_engine.schema import validate_course_dict
+from course_engine.utils import course_cache
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(course_cache, "STATS", course_cache.CourseCacheStats())
+
+
+def _project(root: Path) -> Path:
+    (root / "lessons").mkdir(parents=True)
+    (root / "lessons" / "intro.md").write_text("# Intro\n\nHello\n", encoding="utf-8")
+    data = {
+        "course": {"id": "cache-course", "title": "Cache", "version": "0.1.0", "language": "en-GB"},
+        "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+        "structure": {
+            "modules": [
+                {
+                    "id": "m1",
+                    "title": "Module 1",
+                    "lessons": [
+                        {"id": "l1", "source": "lessons/intro.md"},
+                        {"id": "l2", "title": "Inline", "content_blocks": [{"type": "markdown", "body": "x"}]},
+                    ],
+                }
+            ]
+        },
+    }
+    course_yml = root / "course.yml"
+    course_yml.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return course_yml
+
+
+def _validated(course_yml: Path):
+    data_bytes = course_yml.read_bytes()
+    raw = yaml.safe_load(data_bytes.decode("utf-8"))
+    return data_bytes, raw, validate_course_dict(raw, source_course_yml=course_yml)
+
+
+def test_hit_returns_equal_spec_and_source_change_misses(tmp_path: Path):
+    course_yml = _project(tmp_path)
+    data_bytes, raw, spec = _validated(course_yml)
+
+    assert course_cache.lookup(course_yml, data_bytes) is None
+    course_cache.store(course_yml, data_bytes, raw, spec)
+
+    hit = course_cache.lookup(course_yml, data_bytes)
+    assert hit is not None
+    assert hit == (raw, spec)
+
+    (tmp_path / "lessons" / "intro.md").write_text("# Intro\n\nChanged\n", encoding="utf-8")
+    assert course_cache.lookup(course_yml, data_bytes) is None
+    assert (course_cache.STATS.hits, course_cache.STATS.misses) == (1, 2)
+
+
+def test_course_yml_change_misses(tmp_path: Path):
+    course_yml = _project(tmp_path)
+    data_bytes, raw, spec = _validated(course_yml)
+    course_cache.store(course_yml, data_bytes, raw, spec)
+
+    assert course_cache.lookup(course_yml, data_bytes + b"\n# edited\n") is None
+
+
+def test_disabled_cache_never_stores(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COURSE_ENGINE_NO_CACHE", "1")
+    course_yml = _project(tmp_path)
+    data_bytes, raw, spec = _validated(course_yml)
+    course_cache.store(course_yml, data_bytes, raw, spec)
+
+    assert course_cache.lookup(course_yml, data_bytes) is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_lru_eviction_keeps_most_recent(tmp_path: Path, monkeypatch):
+    course_yml = _project(tmp_path)
+    data_bytes, raw, spec = _validated(course_yml)
+
+    course_cache.store(course_yml, data_bytes, raw, spec)
+    (entry,) = (tmp_path / "cache" / course_cache.COURSE_CACHE_SUBDIR).glob("*.pickle")
+    # Room for one entry, not two.
+    monkeypatch.setenv(course_cache.COURSE_CACHE_MAX_MB_ENV, str(entry.stat().st_size * 1.5 / (1024 * 1024)))
+    course_cache.store(course_yml, data_bytes + b"\n", raw, spec)
+
+    entries = list((tmp_path / "cache" / course_cache.COURSE_CACHE_SUBDIR).glob("*.pickle"))
+    assert len(entries) == 1
+    assert course_cache.STATS.evictions == 1
+    assert course_cache.lookup(course_yml, data_bytes + b"\n") is not None
+
+
+def test_entry_larger_than_budget_is_not_stored(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(course_cache.COURSE_CACHE_MAX_MB_ENV, "0")
+    course_yml = _project(tmp_path)
+    data_bytes, raw, spec = _validated(course_yml)
+
+    course_cache.store(course_yml, data_bytes, raw, spec)
+    course_cache.store_fragment(b"a: 1\n", {"a": 1})
+
+    assert list((tmp_path / "cache" / course_cache.COURSE_CACHE_SUBDIR).iterdir()) == []
+    assert course_cache.STATS.stores == 0
+    assert course_cache.lookup(course_yml, data_bytes) is None
+
+
+def test_explain_output_identical_on_hit(tmp_path: Path):
+    course_yml = _project(tmp_path)
+
+    def _explain():
+        payload = explain_course_yml(str(course_yml), __version__, command="test")
+        payload["engine"].pop("built_at_utc", None)
+        return payload
+
+    first = _explain()
+    second = _explain()
+    assert (course_cache.STATS.hits, course_cache.STATS.misses) == (1, 1)
+    assert first == second
+
+
+def test_verbose_cli_reports_hits_and_misses(tmp_path: Path):
+    course_yml = _project(tmp_path)
+
+    first = runner.invoke(app, ["explain", str(course_yml), "--format", "json", "--verbose"])
+    assert first.exit_code == 0
+    assert "0 hit(s), 1 miss(es)" in first.output
+
+    # snapshot only needs the raw mapping and never consults the cache.
+    assert runner.invoke(app, ["snapshot", str(course_yml), "--format", "json"]).exit_code == 0
+    second = runner.invoke(app, ["explain", str(course_yml), "--format", "json", "-v"])
+    assert second.exit_code == 0
+    assert "1 hit(s), 1 miss(es)" in second.output
+
+
+def test_fingerprint_covers_every_loader_module(monkeypatch):
+    pkg = Path(course_cache.__file__).resolve().parents[1]
+    assert all((pkg / name).is_file() for name in course_cache.FINGERPRINT_MODULES)
+
+    monkeypatch.setattr(course_cache, "_CODE_FINGERPRINT", None)
+    before = course_cache._code_fingerprint()
+    monkeypatch.setattr(course_cache, "FINGERPRINT_MODULES", course_cache.FINGERPRINT_MODULES[:-1])
+    monkeypatch.setattr(course_cache, "_CODE_FINGERPRINT", None)
+    assert course_cache._code_fingerprint() != before
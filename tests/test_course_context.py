@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from course_engine.cli import app
+from course_engine.generator import build as build_mod
+from course_engine.utils import course_context as course_context_mod
+from course_engine.utils import manifest as manifest_mod
+from course_engine.utils.course_context import CourseContext
+from course_engine.utils.manifest import build_manifest
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def _course_yml(root: Path) -> Path:
+    data = {
+        "course": {"id": "ctx-course", "title": "Ctx", "version": "0.1.0", "language": "en-GB"},
+        "design_intent": {"summary": "Why this course exists."},
+        "ai_scoping": {"scope_summary": "Drafting only.", "permitted_uses": ["drafting"]},
+        "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+        "structure": {
+            "modules": [
+                {
+                    "id": "m1",
+                    "title": "Module 1",
+                    "lessons": [{"id": "l1", "title": "L1", "content_blocks": [{"type": "markdown", "body": "x"}]}],
+                }
+            ]
+        },
+    }
+    root.mkdir(parents=True, exist_ok=True)
+    p = root / "course.yml"
+    p.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return p
+
+
+def _strip_volatile(m: dict) -> dict:
+    m = dict(m)
+    m.pop("built_at_utc", None)
+    return m
+
+
+def test_manifest_from_context_matches_file_based_manifest(tmp_path: Path):
+    course_yml = _course_yml(tmp_path / "src")
+    ctx = CourseContext.load(course_yml)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    (out_dir / "index.qmd").write_text("x", encoding="utf-8")
+
+    kwargs = dict(spec=ctx.spec, out_dir=out_dir, output_format="quarto", source_course_yml=course_yml)
+    with_ctx = build_manifest(**kwargs, context=ctx)
+    without_ctx = build_manifest(**kwargs)
+
+    assert _strip_volatile(with_ctx) == _strip_volatile(without_ctx)
+    assert with_ctx["design_intent"]["present"] is True
+    assert with_ctx["ai_scoping"]["scope_summary"] == "Drafting only."
+
+
+def test_signals_and_audit_computed_once(tmp_path: Path, monkeypatch):
+    ctx = CourseContext.load(_course_yml(tmp_path))
+    calls = {"audit": 0}
+    real = course_context_mod.build_governance_self_audit
+
+    def counting(spec):
+        calls["audit"] += 1
+        return real(spec)
+
+    monkeypatch.setattr(course_context_mod, "build_governance_self_audit", counting)
+    assert ctx.audit is ctx.audit
+    assert ctx.signals is ctx.signals
+    assert calls["audit"] == 1
+
+
+def test_cli_build_does_not_reparse_course_yml_for_manifest(tmp_path: Path, monkeypatch):
+    course_yml = _course_yml(tmp_path / "src")
+
+    def fail(*_a, **_k):
+        raise AssertionError("course.yml re-parsed during manifest generation")
+
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+    monkeypatch.setattr(manifest_mod, "_raw_course_for_manifest", fail)
+    monkeypatch.setattr(manifest_mod, "build_governance_self_audit", fail)
+    monkeypatch.setattr(manifest_mod, "_signals_for_manifest", fail)
+
+    result = runner.invoke(
+        app, ["build", str(course_yml), "--out", str(tmp_path / "dist"), "--format", "quarto"]
+    )
+    assert result.exit_code == 0, result.output
+
+    manifest = json.loads((tmp_path / "dist" / "ctx-course" / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["design_intent"]["present"] is True
+    assert manifest["governance_audit"]["score"] >= 0
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from course_engine.generator.build import build_course_nav
+from course_engine.schema import validate_course_dict
+
+
+def _spec():
+    return validate_course_dict(
+        {
+            "course": {"id": "nav-course", "title": "Nav", "version": "0.1.0"},
+            "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+            "structure": {
+                "modules": [
+                    {"id": "m1", "title": "One", "lessons": [{"id": "a", "title": "A"}, {"id": "b", "title": "B"}]},
+                    {"id": "m2", "title": "Two", "lessons": [{"id": "a", "title": "Other A"}]},
+                    {"id": "m3", "title": "Empty", "lessons": []},
+                ]
+            },
+        }
+    )
+
+
+def test_nav_indexes_match_flat_lessons():
+    nav = build_course_nav(_spec())
+
+    assert [i.lesson_id for i in nav.lessons_by_module["m1"]] == ["a", "b"]
+    assert [i.lesson_id for i in nav.lessons_by_module["m2"]] == ["a"]
+    assert nav.lessons_by_module["m3"] == []
+
+    assert nav.module_by_id["m2"].title == "Two"
+    assert nav.lesson_by_key[("m1", "a")].title == "A"
+    assert nav.lesson_by_key[("m2", "a")].title == "Other A"
+
+    flat = nav.flat_lessons
+    assert nav.prev_by_href[flat[0].href] is None
+    assert nav.next_by_href[flat[0].href] == flat[1]
+    assert nav.prev_by_href[flat[2].href] == flat[1]
+    assert nav.next_by_href[flat[2].href] is None
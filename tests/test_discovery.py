@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from course_engine.generator import build as build_mod
+from course_engine.generator.watch import WatchSession
+from course_engine.schema import validate_course_dict
+from course_engine.utils import course_cache
+from course_engine.utils import discovery
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+META = {
+    "course": {"id": "disc-course", "title": "Discovery", "version": "0.1.0", "language": "en-GB"},
+    "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(course_cache, "STATS", course_cache.CourseCacheStats())
+
+
+def _project(root: Path, lessons: list, files: dict[str, str]) -> Path:
+    for name, text in files.items():
+        p = root / "lessons" / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(text, encoding="utf-8")
+    course_yml = root / "course.yml"
+    data = {**META, "structure": {"modules": [{"id": "m1", "title": "One", "lessons": lessons}]}}
+    course_yml.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return course_yml
+
+
+def _validate(course_yml: Path):
+    return validate_course_dict(yaml.safe_load(course_yml.read_text(encoding="utf-8")), source_course_yml=course_yml)
+
+
+def test_discovered_lessons_match_the_listed_equivalent(tmp_path: Path):
+    files = {
+        "02-Second Lesson.md": "# Second\n\nbody\n",
+        "01-intro.md": "Preamble\n\n# Intro\n\nbody\n",
+        "notes.txt": "not a lesson\n",
+        "extra/03-nested.md": "# Nested\n",
+    }
+    course_yml = _project(tmp_path, [{"discover": "lessons"}], files)
+    spec = _validate(course_yml)
+
+    listed = _project(
+        tmp_path,
+        [
+            {"id": "01-intro", "source": "lessons/01-intro.md"},
+            {"id": "02-second-lesson", "source": "lessons/02-Second Lesson.md"},
+        ],
+        {},
+    )
+    assert spec.modules == _validate(listed).modules
+    assert [x.title for x in spec.modules[0].lessons] == ["Intro", "Second"]
+
+    (record,) = spec.discovered
+    assert (record.path, record.pattern, record.module_id) == ("lessons", "*.md", "m1")
+    assert record.files == ["01-intro.md", "02-Second Lesson.md"]
+
+
+def test_pattern_and_inline_lessons_keep_declaration_order(tmp_path: Path):
+    files = {"a.md": "# A\n", "b.qmd": "# B\n", "c.md": "# C\n"}
+    inline = {"id": "first", "title": "First", "content_blocks": [{"type": "markdown", "body": "x"}]}
+    course_yml = _project(tmp_path, [inline, {"discover": "lessons/[bc].*"}], files)
+
+    spec = _validate(course_yml)
+    assert [x.id for x in spec.modules[0].lessons] == ["first", "b", "c"]
+
+
+def _age(*paths: Path) -> None:
+    # Older than the racy window, so scans of these paths may be cached.
+    for p in paths:
+        st = p.stat()
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns - 10 * discovery.SOURCE_SCAN_RACY_WINDOW_NS))
+
+
+def test_rescan_reads_only_changed_files(tmp_path: Path, monkeypatch):
+    files = {f"{i:02d}.md": f"# Lesson {i}\n\ntext\n" for i in range(20)}
+    course_yml = _project(tmp_path, [{"discover": "lessons"}], files)
+    lessons_dir = tmp_path / "lessons"
+    _age(lessons_dir, *lessons_dir.iterdir())
+    _validate(course_yml)
+
+    reads: list[Path] = []
+    real = discovery.read_lesson_source
+
+    def _counting(path, **kw):
+        reads.append(Path(path))
+        return real(path, **kw)
+
+    monkeypatch.setattr(discovery, "read_lesson_source", _counting)
+    listings: list[Path] = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(discovery.os, "scandir", lambda p: listings.append(Path(p)) or real_scandir(p))
+
+    _validate(course_yml)
+    assert reads == [] and listings == []
+
+    edited = tmp_path / "lessons" / "07.md"
+    edited.write_text("# Renamed seven\n\nlonger text\n", encoding="utf-8")
+    spec = _validate(course_yml)
+    assert reads == [edited] and listings == []
+    assert spec.modules[0].lessons[7].title == "Renamed seven"
+
+
+def test_changes_within_one_mtime_tick_are_not_missed(tmp_path: Path):
+    course_yml = _project(tmp_path, [{"discover": "lessons"}], {"a.md": "# Old\n"})
+    lessons_dir = tmp_path / "lessons"
+    dir_st, file_st = lessons_dir.stat(), (lessons_dir / "a.md").stat()
+    assert [x.title for x in _validate(course_yml).modules[0].lessons] == ["Old"]
+
+    # Same-size edit and a new file, with the mtimes forced back (a coarse-mtime filesystem).
+    (lessons_dir / "a.md").write_text("# New\n", encoding="utf-8")
+    (lessons_dir / "b.md").write_text("# B\n", encoding="utf-8")
+    os.utime(lessons_dir / "a.md", ns=(file_st.st_atime_ns, file_st.st_mtime_ns))
+    os.utime(lessons_dir, ns=(dir_st.st_atime_ns, dir_st.st_mtime_ns))
+    assert [x.title for x in _validate(course_yml).modules[0].lessons] == ["New", "B"]
+
+
+def test_replaced_file_with_the_same_mtime_and_size_is_read_again(tmp_path: Path):
+    course_yml = _project(tmp_path, [{"discover": "lessons"}], {"a.md": "# Old\n"})
+    a = tmp_path / "lessons" / "a.md"
+    _age(tmp_path / "lessons", a)
+    _validate(course_yml)
+
+    st = a.stat()
+    replacement = tmp_path / "a.tmp"
+    replacement.write_text("# New\n", encoding="utf-8")
+    os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+    keep = tmp_path / "keep.md"
+    os.link(a, keep)  # keep the old inode alive so it cannot be reused
+    os.replace(replacement, a)
+    assert (a.stat().st_mtime_ns, a.stat().st_size) == (st.st_mtime_ns, st.st_size)
+    assert [x.title for x in _validate(course_yml).modules[0].lessons] == ["New"]
+
+
+def test_front_matter_title_needs_only_the_file_head(tmp_path: Path, monkeypatch):
+    course_yml = _project(tmp_path, [{"discover": "lessons"}], {"a.md": "---\ntitle: Front\n---\nNo heading here\n"})
+
+    def _no_scan(path, **kw):
+        raise AssertionError("full read")
+
+    monkeypatch.setattr(discovery, "read_lesson_source", _no_scan)
+    data = yaml.safe_load(course_yml.read_text(encoding="utf-8"))
+    expanded, _ = discovery.expand_discovered_lessons(data, tmp_path)
+    assert expanded["structure"]["modules"][0]["lessons"] == [{"id": "a", "source": "lessons/a.md", "title": "Front"}]
+
+
+def test_course_cache_misses_when_a_discovered_file_is_added(tmp_path: Path):
+    course_yml = _project(tmp_path, [{"discover": "lessons"}], {"a.md": "# A\n"})
+    data_bytes = course_yml.read_bytes()
+    course_cache.store(course_yml, data_bytes, {}, _validate(course_yml))
+    assert course_cache.lookup(course_yml, data_bytes) is not None
+
+    (tmp_path / "lessons" / "b.md").write_text("# B\n", encoding="utf-8")
+    os.utime(tmp_path / "lessons", ns=(0, 10**18))  # no reliance on mtime granularity
+    assert course_cache.lookup(course_yml, data_bytes) is None
+    assert [x.id for x in _validate(course_yml).modules[0].lessons] == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    "entry, files, message",
+    [
+        ({"discover": "missing"}, {}, "Lesson directory not found"),
+        ({"discover": "lessons", "id": "x"}, {"a.md": "# A\n"}, "exactly"),
+        ({"discover": "less*/a.md"}, {"a.md": "# A\n"}, "file name part"),
+        ({"discover": "lessons/*.qmd"}, {"a.md": "# A\n"}, "No lesson files match"),
+        ({"discover": "lessons"}, {"a-b.md": "# A\n", "a_b.md": "# B\n"}, "same lesson id 'a-b'"),
+        ({"discover": "lessons"}, {"untitled.md": "no heading\n"}, "no title"),
+    ],
+)
+def test_discover_errors(tmp_path: Path, entry, files, message):
+    course_yml = _project(tmp_path, [entry], files)
+    with pytest.raises(ValueError, match=message):
+        _validate(course_yml)
+
+
+def test_watch_picks_up_a_new_discovered_file(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+    course_yml = _project(tmp_path / "src", [{"discover": "lessons"}], {"a.md": "# A\n"})
+    session = WatchSession(course_yml, out_root=tmp_path / "out", templates_dir=TEMPLATES_DIR)
+
+    assert session.run_cycle().error is None
+    lessons_dir = tmp_path / "src" / "lessons"
+    assert session.watched_dirs() == [Path(os.path.abspath(lessons_dir))]
+
+    added = lessons_dir / "b.md"
+    added.write_text("# B\n", encoding="utf-8")
+    os.utime(lessons_dir, ns=(0, 10**18))
+    result = session.run_cycle({added})
+    assert result.error is None and result.reparsed
+    assert [x.title for x in session.spec.modules[0].lessons] == ["A", "B"]
@@ -0,0 +1,66 @@
+"""
+Memory-bound check for the streamed single-page handout build.
+
+The course below produces a ~256 MB handout while holding only one 1 MiB body
+string in memory (every lesson shares it). Rendering the handout into a single
+string would need several hundred MB; streaming keeps peak RSS flat.
+
+Runs in a subprocess so the peak RSS reading is not polluted by other tests.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+resource = pytest.importorskip("resource")
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+LESSONS = 256
+RSS_CEILING_MB = 128
+
+SCRIPT = textwrap.dedent(
+    """
+    import resource, sys
+    from pathlib import Path
+
+    from course_engine.generator.html_single import build_html_single_project
+    from course_engine.model import ContentBlock, CourseSpec, Lesson, Module
+
+    body = ("x" * 1023 + "\\n") * 1024  # 1 MiB, shared by every lesson
+    lessons = [
+        Lesson(id=f"l{i}", title=f"Lesson {i}", content_blocks=[ContentBlock(type="markdown", body=body)])
+        for i in range({lessons})
+    ]
+    spec = CourseSpec(
+        id="big", title="Big", subtitle=None, version="1", language="en",
+        framework_name="F", domains=["D"], formats=["html"], theme=None, toc=True,
+        modules=[Module(id="m1", title="M1", lessons=lessons)],
+    )
+    out_dir = build_html_single_project(spec, Path(sys.argv[1]), Path(sys.argv[2]))
+    size = (out_dir / "index.qmd").stat().st_size
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024  # bytes -> KiB
+    print(size, peak)
+    """
+).replace("{lessons}", str(LESSONS))
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="ru_maxrss is POSIX-only")
+def test_handout_build_streams_under_rss_ceiling(tmp_path: Path):
+    completed = subprocess.run(
+        [sys.executable, "-c", SCRIPT, str(tmp_path), str(TEMPLATES_DIR)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    size_bytes, peak_kib = (int(x) for x in completed.stdout.split())
+
+    assert size_bytes > LESSONS * 1024 * 1024
+    assert peak_kib / 1024 < RSS_CEILING_MB, f"peak RSS {peak_kib / 1024:.0f} MB"
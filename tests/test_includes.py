@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from course_engine import __version__
+from course_engine.explain import explain_course_yml
+from course_engine.generator import build as build_mod
+from course_engine.generator.watch import WatchSession
+from course_engine.schema import validate_course_dict, validate_course_root
+from course_engine.utils import course_cache
+from course_engine.utils import includes as includes_mod
+from course_engine.utils.manifest import build_manifest
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+META = {
+    "course": {"id": "inc-course", "title": "Includes", "version": "0.1.0", "language": "en-GB"},
+    "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(course_cache, "STATS", course_cache.CourseCacheStats())
+
+
+def _lesson(lid: str) -> dict:
+    return {"id": lid, "title": lid.upper(), "content_blocks": [{"type": "markdown", "body": f"Body {lid}"}]}
+
+
+def _dump(path: Path, obj) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(obj, sort_keys=False), encoding="utf-8")
+
+
+def _project(root: Path) -> Path:
+    _dump(root / "modules" / "m1.yml", {"id": "m1", "title": "One", "lessons": [_lesson("a")]})
+    _dump(
+        root / "modules" / "more.yml",
+        [
+            {"id": "m2", "title": "Two", "lessons": [_lesson("b"), {"include": "modules/m2-extra.yml"}]},
+            {"id": "m3", "title": "Three", "lessons": [_lesson("c")]},
+        ],
+    )
+    _dump(root / "modules" / "m2-extra.yml", [_lesson("b2"), _lesson("b3")])
+    _dump(root / "modules" / "m4-lesson.yml", _lesson("d2"))
+    course_yml = root / "course.yml"
+    _dump(
+        course_yml,
+        {
+            **META,
+            "structure": {
+                "modules": [
+                    {"include": "modules/m1.yml"},
+                    {"include": "modules/more.yml"},
+                    {"id": "m4", "title": "Four", "lessons": [_lesson("d"), {"include": "modules/m4-lesson.yml"}]},
+                ]
+            },
+        },
+    )
+    return course_yml
+
+
+def _inline_equivalent() -> dict:
+    return {
+        **META,
+        "structure": {
+            "modules": [
+                {"id": "m1", "title": "One", "lessons": [_lesson("a")]},
+                {"id": "m2", "title": "Two", "lessons": [_lesson("b"), _lesson("b2"), _lesson("b3")]},
+                {"id": "m3", "title": "Three", "lessons": [_lesson("c")]},
+                {"id": "m4", "title": "Four", "lessons": [_lesson("d"), _lesson("d2")]},
+            ]
+        },
+    }
+
+
+def _validate(course_yml: Path):
+    return validate_course_dict(yaml.safe_load(course_yml.read_text(encoding="utf-8")), source_course_yml=course_yml)
+
+
+def test_includes_expand_to_the_inline_course_with_provenance(tmp_path: Path):
+    course_yml = _project(tmp_path)
+    raw = yaml.safe_load(course_yml.read_text(encoding="utf-8"))
+    spec = validate_course_dict(raw, source_course_yml=course_yml)
+
+    assert spec.modules == validate_course_dict(_inline_equivalent()).modules
+    assert raw["structure"]["modules"][0] == {"include": "modules/m1.yml"}  # input untouched
+    assert [(i.path, i.kind, i.module_id) for i in spec.includes] == [
+        ("modules/m1.yml", "modules", None),
+        ("modules/more.yml", "modules", None),
+        ("modules/m2-extra.yml", "lessons", "m2"),
+        ("modules/m4-lesson.yml", "lessons", "m4"),
+    ]
+
+    manifest = build_manifest(spec=spec, out_dir=tmp_path, output_format="html", source_course_yml=course_yml)
+    assert manifest["includes"]["count"] == 4
+    assert manifest["includes"]["files"][0]["sha256"] == spec.includes[0].sha256
+
+    payload = explain_course_yml(str(course_yml), __version__, command="test")
+    assert payload["errors"] == []
+    assert payload["sources"]["counts"]["includes"] == 4
+    assert [f["declared_path"] for f in payload["sources"]["includes"]] == [i.path for i in spec.includes]
+
+
+def test_watch_and_validate_share_one_validation_entry_point(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+    course_yml = _project(tmp_path)
+    raw = yaml.safe_load(course_yml.read_text(encoding="utf-8"))
+
+    course = validate_course_root(raw, base_dir=course_yml.parent)
+    assert [i.path for i in course.includes] == [i.path for i in _validate(course_yml).includes]
+    assert course.to_spec() == validate_course_dict(raw, source_course_yml=course_yml)
+
+    calls: list[Path] = []
+    real = validate_course_root
+
+    def _recording(data, **kw):
+        calls.append(kw["base_dir"])
+        return real(data, **kw)
+
+    monkeypatch.setattr("course_engine.generator.watch.validate_course_root", _recording)
+    session = WatchSession(course_yml, out_root=tmp_path / "out", templates_dir=TEMPLATES_DIR)
+    assert session.run_cycle().error is None
+    assert calls == [course_yml.parent]
+    assert session.spec == course.to_spec()
+
+
+def test_only_changed_include_is_reparsed(tmp_path: Path, monkeypatch):
+    course_yml = _project(tmp_path)
+    parsed: list[str] = []
+    real = includes_mod.yaml_io.safe_load
+
+    def _counting(data):
+        doc = real(data)
+        parsed.append(doc["id"] if isinstance(doc, dict) else doc[0]["id"])
+        return doc
+
+    monkeypatch.setattr(includes_mod.yaml_io, "safe_load", _counting)
+
+    _validate(course_yml)
+    assert sorted(parsed) == ["b2", "d2", "m1", "m2"]
+
+    parsed.clear()
+    _dump(tmp_path / "modules" / "m1.yml", {"id": "m1", "title": "One (edited)", "lessons": [_lesson("a")]})
+    spec = _validate(course_yml)
+    assert parsed == ["m1"]
+    assert spec.modules[0].title == "One (edited)"
+
+
+def test_course_cache_misses_when_an_include_changes(tmp_path: Path):
+    course_yml = _project(tmp_path)
+    data_bytes = course_yml.read_bytes()
+    course_cache.store(course_yml, data_bytes, {}, _validate(course_yml))
+    assert course_cache.lookup(course_yml, data_bytes) is not None
+
+    _dump(tmp_path / "modules" / "m4-lesson.yml", _lesson("d3"))
+    assert course_cache.lookup(course_yml, data_bytes) is None
+
+
+@pytest.mark.parametrize(
+    "entry, files, message",
+    [
+        ({"include": "modules/missing.yml"}, {}, "Included file not found"),
+        ({"include": "modules/x.yml", "id": "m9"}, {}, "exactly"),
+        ({"include": "modules/nested.yml"}, {"nested.yml": {"include": "modules/x.yml"}}, "Nested include"),
+        ({"include": "modules/scalar.yml"}, {"scalar.yml": "just text"}, "module mapping"),
+    ],
+)
+def test_include_errors(tmp_path: Path, entry, files, message):
+    for name, obj in files.items():
+        _dump(tmp_path / "modules" / name, obj)
+    data = {**META, "structure": {"modules": [entry]}}
+
+    with pytest.raises(ValueError, match=message):
+        validate_course_dict(data, source_course_yml=tmp_path / "course.yml")
+
+
+def test_watch_rebuilds_when_an_include_changes(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+    course_yml = _project(tmp_path / "src")
+    session = WatchSession(course_yml, out_root=tmp_path / "out", templates_dir=TEMPLATES_DIR)
+
+    first = session.run_cycle()
+    assert first.error is None
+    included = tmp_path / "src" / "modules" / "m4-lesson.yml"
+    assert included.resolve() in {p.resolve() for p in session.watched_files()}
+
+    _dump(included, {**_lesson("d2"), "title": "Renamed"})
+    second = session.run_cycle({included})
+    assert second.error is None and second.reparsed
+    assert session.spec.modules[3].lessons[1].title == "Renamed"
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from course_engine.generator import build as build_mod
+from course_engine.generator.build import build_quarto_project
+from course_engine.schema import validate_course_dict
+from course_engine.utils.build_state import BUILD_STATE_FILENAME
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+@pytest.fixture(autouse=True)
+def _no_quarto_required(monkeypatch):
+    # Generation does not need Quarto; only the fail-fast guard does.
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+
+
+def _course(lessons: list[dict]) -> dict:
+    return {
+        "course": {"id": "inc-course", "title": "Inc", "version": "0.1.0", "language": "en-GB"},
+        "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+        "structure": {"modules": [{"id": "m1", "title": "Module 1", "lessons": lessons}]},
+    }
+
+
+def _lesson(n: int, body: str = "Hello") -> dict:
+    return {"id": f"l{n}", "title": f"Lesson {n}", "content_blocks": [{"type": "markdown", "body": body}]}
+
+
+def _mtimes(out_dir: Path) -> dict[str, int]:
+    return {
+        p.relative_to(out_dir).as_posix(): p.stat().st_mtime_ns
+        for p in out_dir.rglob("*")
+        if p.is_file() and p.name != BUILD_STATE_FILENAME
+    }
+
+
+def _age_all(out_dir: Path) -> None:
+    # Push mtimes into the past so "untouched" is unambiguous on coarse filesystems.
+    for p in out_dir.rglob("*"):
+        if p.is_file():
+            os.utime(p, ns=(1_000_000_000, 1_000_000_000))
+
+
+def test_incremental_rewrites_only_changed_lesson(tmp_path: Path):
+    lessons = [_lesson(1), _lesson(2), _lesson(3)]
+    out_dir = build_quarto_project(validate_course_dict(_course(lessons)), tmp_path, TEMPLATES_DIR)
+    _age_all(out_dir)
+    before = _mtimes(out_dir)
+
+    lessons[1] = _lesson(2, body="Changed")
+    build_quarto_project(validate_course_dict(_course(lessons)), tmp_path, TEMPLATES_DIR, incremental=True)
+    after = _mtimes(out_dir)
+
+    changed = sorted(k for k in after if after[k] != before.get(k))
+    assert changed == ["lessons/m1-l2-lesson-2.qmd"]
+    assert "Changed" in (out_dir / "lessons" / "m1-l2-lesson-2.qmd").read_text(encoding="utf-8")
+
+    state = json.loads((out_dir / BUILD_STATE_FILENAME).read_text(encoding="utf-8"))
+    assert state["written"] == ["lessons/m1-l2-lesson-2.qmd"]
+    assert "lessons/m1-l2-lesson-2.qmd" in state["pending_render"]
+
+
+def test_incremental_output_matches_full_build(tmp_path: Path):
+    lessons = [_lesson(1), _lesson(2), _lesson(3)]
+    full_root = tmp_path / "full"
+    inc_root = tmp_path / "inc"
+
+    build_quarto_project(validate_course_dict(_course(lessons)), inc_root, TEMPLATES_DIR)
+
+    # Remove a lesson: neighbours, indexes and sidebar change; the orphan is deleted.
+    del lessons[1]
+    spec = validate_course_dict(_course(lessons))
+    inc_dir = build_quarto_project(spec, inc_root, TEMPLATES_DIR, incremental=True)
+    full_dir = build_quarto_project(spec, full_root, TEMPLATES_DIR)
+
+    assert not (inc_dir / "lessons" / "m1-l2-lesson-2.qmd").exists()
+    assert _mtimes(inc_dir).keys() == _mtimes(full_dir).keys()
+    for rel in _mtimes(full_dir):
+        assert (inc_dir / rel).read_bytes() == (full_dir / rel).read_bytes()
+
+    state = json.loads((inc_dir / BUILD_STATE_FILENAME).read_text(encoding="utf-8"))
+    assert state["removed"] == ["lessons/m1-l2-lesson-2.qmd"]
+    assert "_quarto.yml" in state["written"]
+
+
+def test_incremental_without_state_keeps_existing_files(tmp_path: Path):
+    spec = validate_course_dict(_course([_lesson(1)]))
+    out_dir = tmp_path / spec.id
+    (out_dir / "_site").mkdir(parents=True)
+    (out_dir / "_site" / "index.html").write_text("rendered", encoding="utf-8")
+
+    build_quarto_project(spec, tmp_path, TEMPLATES_DIR, incremental=True)
+
+    assert (out_dir / "_site" / "index.html").read_text(encoding="utf-8") == "rendered"
+    assert (out_dir / "lessons" / "m1-l1-lesson-1.qmd").exists()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from course_engine import __version__
+from course_engine.utils import lesson_sources
+from course_engine.explain import explain_course_yml
+from course_engine.schema import validate_course_dict
+from course_engine.utils import course_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(course_cache, "STATS", course_cache.CourseCacheStats())
+
+
+def _project(root: Path, sources: dict[str, str]) -> Path:
+    (root / "lessons").mkdir(parents=True)
+    lessons = []
+    for i, (name, text) in enumerate(sources.items(), start=1):
+        (root / "lessons" / name).write_bytes(text.encode("utf-8"))
+        lessons.append({"id": f"l{i}", "source": f"lessons/{name}"})
+    lessons.append({"id": "inline", "title": "Inline", "content_blocks": [{"type": "markdown", "body": "x"}]})
+    data = {
+        "course": {"id": "lazy-course", "title": "Lazy", "version": "0.1.0", "language": "en-GB"},
+        "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+        "structure": {"modules": [{"id": "m1", "title": "Module 1", "lessons": lessons}]},
+    }
+    course_yml = root / "course.yml"
+    course_yml.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return course_yml
+
+
+def _specs(course_yml: Path):
+    raw = yaml.safe_load(course_yml.read_text(encoding="utf-8"))
+    eager = validate_course_dict(raw, source_course_yml=course_yml)
+    lazy = validate_course_dict(raw, source_course_yml=course_yml, lazy_bodies=True)
+    return eager, lazy
+
+
+def test_lazy_spec_matches_eager_metadata(tmp_path: Path, monkeypatch):
+    # Tiny chunks so headings, CRLFs and multi-byte characters straddle reads.
+    monkeypatch.setattr(lesson_sources, "SOURCE_CHUNK_BYTES", 3)
+    course_yml = _project(
+        tmp_path,
+        {
+            "crlf.md": "\r\n\r\n## Sub\r\n# Café title\r\n\r\nBody é\r\n",
+            "late.md": "Intro text\n\n" + "word " * 50 + "\n#  Late heading  \n",
+            "empty-heading.md": "# \n# Not this one\ntext\n",
+        },
+    )
+    eager, lazy = _specs(course_yml)
+
+    e_lessons = eager.modules[0].lessons
+    l_lessons = lazy.modules[0].lessons
+    assert [x.title for x in l_lessons[:2]] == ["Café title", "Late heading"]
+    assert [x.title for x in l_lessons] == [x.title for x in e_lessons]
+
+    for e, lz in zip(e_lessons[:3], l_lessons[:3]):
+        assert lz.source_sha256 == e.source_sha256
+        assert lz.source_resolved_path == e.source_resolved_path
+        block = lz.content_blocks[0]
+        assert block.body is None
+        assert block.body_source == e.content_blocks[0].body_source
+        assert block.body_source.bytes == Path(lz.source_resolved_path).stat().st_size
+        assert block.body_text == e.content_blocks[0].body_text == e.content_blocks[0].body
+
+    assert l_lessons[3].content_blocks == e_lessons[3].content_blocks
+
+
+def test_lazy_empty_source_error_matches_eager(tmp_path: Path):
+    course_yml = _project(tmp_path, {"blank.md": "   \n\n"})
+    raw = yaml.safe_load(course_yml.read_text(encoding="utf-8"))
+    raw["structure"]["modules"][0]["lessons"][0]["title"] = "Blank"
+
+    with pytest.raises(ValueError) as eager_err:
+        validate_course_dict(raw, source_course_yml=course_yml)
+    with pytest.raises(ValueError) as lazy_err:
+        validate_course_dict(raw, source_course_yml=course_yml, lazy_bodies=True)
+    assert "requires non-empty 'body'" in str(lazy_err.value)
+    assert str(lazy_err.value) == str(eager_err.value)
+
+
+def test_source_body_detects_changed_file(tmp_path: Path):
+    course_yml = _project(tmp_path, {"a.md": "# A\n\ntext\n"})
+    _, lazy = _specs(course_yml)
+
+    (tmp_path / "lessons" / "a.md").write_text("# A\n\nchanged\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="changed since"):
+        _ = lazy.modules[0].lessons[0].content_blocks[0].body_text
+
+
+def test_lazy_and_full_cache_entries_never_cross(tmp_path: Path):
+    course_yml = _project(tmp_path, {"a.md": "# A\n\ntext\n", "b.md": "# B\n\nmore\n"})
+    data_bytes = course_yml.read_bytes()
+
+    def _explain():
+        payload = explain_course_yml(str(course_yml), __version__, command="test")
+        payload["engine"].pop("built_at_utc", None)
+        return payload
+
+    # A full entry (as written by build) carries every body: metadata lookups skip it.
+    eager, _ = _specs(course_yml)
+    course_cache.store(course_yml, data_bytes, yaml.safe_load(data_bytes), eager)
+    assert course_cache.lookup(course_yml, data_bytes, lazy=True) is None
+
+    first = _explain()
+    _, spec = course_cache.lookup(course_yml, data_bytes, lazy=True)
+    assert all(block.body is None for lesson in spec.modules[0].lessons[:2] for block in lesson.content_blocks)
+    assert _explain() == first
+    assert (course_cache.STATS.hits, course_cache.STATS.misses) == (2, 2)
+
+    # A renderer-facing lookup never sees the lazy entry either.
+    d = tmp_path / "cache" / course_cache.COURSE_CACHE_SUBDIR
+    (d / f"{course_cache._entry_key(course_yml, data_bytes)}.pickle").unlink()
+    assert course_cache.lookup(course_yml, data_bytes) is None
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from course_engine import __version__
+from course_engine.explain import course as explain_course_mod
+from course_engine.explain import explain_course_yml
+from course_engine.schema import validate_course_dict
+from course_engine.utils import lesson_sources
+from course_engine.utils.lesson_sources import read_lesson_source
+from course_engine.utils.manifest import build_manifest
+
+META = {
+    "course": {"id": "src-course", "title": "Src", "version": "0.1.0", "language": "en-GB"},
+    "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+}
+
+SAMPLES = {
+    "lf.md": "# Title\n\nBody é\n",
+    "crlf.md": "\r\n# Title\r\nBody\r\nmore\r",
+    "mixed.md": "intro\r\n\r# Mixed\nend",
+    "empty.md": "",
+}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_reader_matches_text_mode_and_raw_hash(tmp_path: Path, monkeypatch, name: str):
+    p = tmp_path / name
+    raw = SAMPLES[name].encode("utf-8")
+    p.write_bytes(raw)
+
+    plain = read_lesson_source(p)
+    monkeypatch.setattr(lesson_sources, "SOURCE_MMAP_MIN_BYTES", 1)
+    mapped = read_lesson_source(p)
+    monkeypatch.setattr(lesson_sources, "SOURCE_CHUNK_BYTES", 2)
+    meta = read_lesson_source(p, keep_text=False)
+
+    assert plain == mapped
+    assert plain.text == p.read_text(encoding="utf-8")
+    assert plain.sha256 == meta.sha256 == hashlib.sha256(raw).hexdigest()
+    assert plain.bytes == meta.bytes == len(raw)
+    assert meta.text is None
+    assert meta.heading == lesson_sources.first_heading(plain.text)[1]
+    assert meta.blank == (not plain.text.strip())
+
+
+def test_reader_rejects_invalid_utf8_in_both_modes(tmp_path: Path):
+    p = tmp_path / "bad.md"
+    p.write_bytes(b"# Title\n\xff\n")
+    with pytest.raises(UnicodeDecodeError):
+        read_lesson_source(p)
+    with pytest.raises(UnicodeDecodeError):
+        read_lesson_source(p, keep_text=False)
+
+
+def test_schema_manifest_and_explain_share_one_hash(tmp_path: Path, monkeypatch):
+    (tmp_path / "lessons").mkdir()
+    raw = b"# Intro\r\n\r\nHello\r\n"
+    (tmp_path / "lessons" / "intro.md").write_bytes(raw)
+    data = {
+        **META,
+        "structure": {"modules": [{"id": "m1", "title": "M", "lessons": [{"id": "l1", "source": "lessons/intro.md"}]}]},
+    }
+    course_yml = tmp_path / "course.yml"
+    course_yml.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    expected = hashlib.sha256(raw).hexdigest()
+
+    spec = validate_course_dict(data, source_course_yml=course_yml)
+    lesson = spec.modules[0].lessons[0]
+    assert lesson.source_sha256 == expected
+    assert lesson.content_blocks[0].body == "# Intro\n\nHello\n"
+
+    manifest = build_manifest(spec=spec, out_dir=tmp_path, output_format="html", source_course_yml=course_yml)
+    assert manifest["lesson_sources"]["lessons"][0]["sha256"] == expected
+
+    # Explain takes provenance from the spec and does not read the source again.
+    def _no_reread(*args, **kwargs):
+        raise AssertionError("source re-read")
+
+    monkeypatch.setattr(explain_course_mod, "load_lesson_source", _no_reread)
+    payload = explain_course_yml(str(course_yml), __version__, command="test")
+    assert payload["sources"]["files"][0]["hash_sha256"] == expected
+    assert payload["sources"]["files"][0]["bytes"] == len(raw)
+    block = payload["structure"]["modules"][0]["lessons"][0]["content_blocks"][0]
+    assert block["source"]["hash_sha256"] == expected
+
+
+@pytest.mark.parametrize(
+    "raw, same_as_text_hash",
+    [
+        (b"# Intro\n\nHello\n", True),
+        (b"\xef\xbb\xbf# Intro\n\nHello\n", True),
+        (b"# Intro\r\n\r\nHello\r\n", False),
+        (b"# Intro\r\rHello\r", False),
+    ],
+)
+def test_source_sha256_is_the_raw_file_hash(tmp_path: Path, raw: bytes, same_as_text_hash: bool):
+    # Before the shared reader, source_sha256 hashed the newline-normalised text, so
+    # only sources with CR or CRLF line endings record a different hash than before.
+    p = tmp_path / "lessons" / "intro.md"
+    p.parent.mkdir()
+    p.write_bytes(raw)
+    lessons = [{"id": "l1", "title": "Intro", "source": "lessons/intro.md"}]
+    data = {**META, "structure": {"modules": [{"id": "m1", "title": "M", "lessons": lessons}]}}
+    course_yml = tmp_path / "course.yml"
+    course_yml.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+
+    lesson = validate_course_dict(data, source_course_yml=course_yml).modules[0].lessons[0]
+    text_hash = hashlib.sha256(p.read_text(encoding="utf-8").encode("utf-8")).hexdigest()
+    assert lesson.source_sha256 == hashlib.sha256(raw).hexdigest()
+    assert (lesson.source_sha256 == text_hash) is same_as_text_hash
+
+    payload = explain_course_yml(str(course_yml), __version__, command="test")
+    block = payload["structure"]["modules"][0]["lessons"][0]["content_blocks"][0]["source"]
+    assert (block["hash_sha256"], block["bytes"]) == (lesson.source_sha256, len(raw))
+
+
+FRONT_MATTER = (
+    "---\r\n"
+    "# a YAML comment, not a heading\r\n"
+    "title: From front matter\r\n"
+    "duration: 20\r\n"
+    "tags: [risk, intro]\r\n"
+    "---\r\n"
+    "\r\n# Heading\r\n\r\nBody\r\n"
+)
+
+
+def test_front_matter_is_read_from_the_head_and_kept_out_of_the_body(tmp_path: Path, monkeypatch):
+    p = tmp_path / "fm.md"
+    raw = FRONT_MATTER.encode("utf-8")
+    p.write_bytes(raw)
+    expected = {"title": "From front matter", "duration": 20, "tags": ["risk", "intro"]}
+
+    full = read_lesson_source(p)
+    monkeypatch.setattr(lesson_sources, "SOURCE_MMAP_MIN_BYTES", 1)
+    assert read_lesson_source(p) == full
+    monkeypatch.setattr(lesson_sources, "SOURCE_CHUNK_BYTES", 3)
+    meta = read_lesson_source(p, keep_text=False)
+
+    assert full.text == "\n# Heading\n\nBody\n"
+    assert full.front_matter == meta.front_matter == lesson_sources.read_front_matter(p) == expected
+    assert meta.heading == "Heading"
+    assert full.sha256 == meta.sha256 == hashlib.sha256(raw).hexdigest()
+
+
+def test_front_matter_with_other_keys_stays_in_the_body(tmp_path: Path):
+    text = "---\ntitle: Mixed\ntags: [a]\nformat:\n  html:\n    toc: true\nexecute:\n  echo: false\n---\n\nBody\n"
+    (tmp_path / "lessons").mkdir()
+    p = tmp_path / "lessons" / "mixed.qmd"
+    p.write_text(text, encoding="utf-8")
+
+    full = read_lesson_source(p)
+    meta = read_lesson_source(p, keep_text=False)
+    assert full.text == text
+    assert full.front_matter == meta.front_matter == {"title": "Mixed", "tags": ["a"]}
+
+    data = {
+        **META,
+        "structure": {"modules": [{"id": "m1", "title": "M", "lessons": [{"id": "l1", "source": "lessons/mixed.qmd"}]}]},
+    }
+    course_yml = tmp_path / "course.yml"
+    course_yml.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    lesson = validate_course_dict(data, source_course_yml=course_yml).modules[0].lessons[0]
+    assert (lesson.title, lesson.tags) == ("Mixed", ["a"])
+    assert lesson.content_blocks[0].body == text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "---\n\nSome text\n\n---\n# Title\n",  # horizontal rules, not a mapping
+        "---\ntitle: never closed\n# Title\n",
+        "# Title\n---\ntitle: not at the top\n---\n",
+    ],
+)
+def test_text_without_front_matter_is_unchanged(tmp_path: Path, text: str):
+    p = tmp_path / "plain.md"
+    p.write_text(text, encoding="utf-8")
+    src = read_lesson_source(p)
+    assert src.front_matter is None
+    assert src.text == text
+
+
+def test_front_matter_merges_under_course_yml_values(tmp_path: Path):
+    (tmp_path / "lessons").mkdir()
+    (tmp_path / "lessons" / "a.md").write_text(FRONT_MATTER, encoding="utf-8")
+    lessons = [
+        {"id": "from-file", "source": "lessons/a.md"},
+        {"id": "overridden", "source": "lessons/a.md", "title": "Course title", "duration": 5, "tags": []},
+    ]
+    data = {**META, "structure": {"modules": [{"id": "m1", "title": "M", "lessons": lessons}]}}
+    course_yml = tmp_path / "course.yml"
+
+    for lazy in (False, True):
+        a, b = validate_course_dict(data, source_course_yml=course_yml, lazy_bodies=lazy).modules[0].lessons
+        assert (a.title, a.duration, a.tags) == ("From front matter", 20, ["risk", "intro"])
+        assert (b.title, b.duration, b.tags) == ("Course title", 5, [])
+        assert a.content_blocks[0].body_text == "\n# Heading\n\nBody\n"
+
+    (tmp_path / "lessons" / "a.md").write_text("---\nduration: soon\n---\n# A\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Invalid front matter"):
+        validate_course_dict(data, source_course_yml=course_yml)
+
+
+def _age(p: Path) -> None:
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns - 10 * lesson_sources.SOURCE_SCAN_RACY_WINDOW_NS))
+
+
+def test_metadata_reads_of_unchanged_sources_are_cached(tmp_path: Path, monkeypatch):
+    p = tmp_path / "a.md"
+    p.write_text(FRONT_MATTER, encoding="utf-8")
+    _age(p)
+    first = read_lesson_source(p, keep_text=False)
+
+    def _no_read(path):
+        raise AssertionError("source re-read")
+
+    monkeypatch.setattr(lesson_sources, "_scan_lesson_source", _no_read)
+    assert read_lesson_source(p, keep_text=False) == first
+
+    p.write_text(FRONT_MATTER + "more\n", encoding="utf-8")
+    with pytest.raises(AssertionError, match="re-read"):
+        read_lesson_source(p, keep_text=False)
+
+
+def test_same_size_rewrite_within_one_mtime_tick_is_not_served_stale(tmp_path: Path):
+    p = tmp_path / "a.md"
+    p.write_text("# Old\n", encoding="utf-8")
+    st = p.stat()
+    assert read_lesson_source(p, keep_text=False).heading == "Old"
+
+    # Same size, same mtime (as on a coarse-mtime filesystem), same inode.
+    with p.open("r+b") as f:
+        f.write(b"# New\n")
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+    again = read_lesson_source(p, keep_text=False)
+    assert again.heading == "New"
+    assert again.sha256 == hashlib.sha256(b"# New\n").hexdigest()
+
+
+def test_scan_cache_keeps_a_bounded_number_of_entries(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(lesson_sources, "SOURCE_SCAN_CACHE_MAX_ENTRIES", 3)
+    for i in range(5):
+        p = tmp_path / f"{i}.md"
+        p.write_text(f"# {i}\n", encoding="utf-8")
+        _age(p)
+        read_lesson_source(p, keep_text=False)
+    assert len(list((tmp_path / "cache" / lesson_sources.SOURCE_SCAN_CACHE_SUBDIR).glob("*.json"))) == 3
+
+
+def test_heading_scan_stops_early_with_the_same_result(monkeypatch):
+    md = "intro\n" + "text\n" * 200 + "  # Found  \n# Later\n"
+    monkeypatch.setattr(lesson_sources, "_HEADING_SCAN_CHARS", 7)
+    assert lesson_sources.first_heading(md) == (True, "Found")
+    assert lesson_sources.infer_title_from_md(md) == "Found"
+    # Same line boundaries as str.splitlines().
+    assert lesson_sources.first_heading("intro\v# After a vertical tab\n") == (True, "After a vertical tab")
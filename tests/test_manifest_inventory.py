@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from course_engine.exporters.markdown import build_markdown_package
+from course_engine.schema import validate_course_dict
+from course_engine.utils import fileops
+from course_engine.utils import manifest as manifest_mod
+from course_engine.utils.manifest import build_file_inventory, refresh_manifest, update_manifest_after_render
+
+
+def _site(root: Path) -> Path:
+    files = {
+        "index.html": b"<html></html>",
+        "lessons/a.html": b"a" * 10,
+        "lessons/b.html": b"b" * 3000,
+        "site_libs/big.js": b"x" * (3 << 20),
+        "site_libs/empty.css": b"",
+        ".quarto/cache.json": b"{}",
+        "render.log": b"log",
+        "manifest.json": b"{}\n",
+    }
+    for rel, data in files.items():
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(data)
+    return root
+
+
+def _expected(root: Path) -> list[dict]:
+    return [
+        {"path": rel, "bytes": (root / rel).stat().st_size, "sha256": hashlib.sha256((root / rel).read_bytes()).hexdigest()}
+        for rel in ("index.html", "lessons/a.html", "lessons/b.html", "site_libs/big.js", "site_libs/empty.css")
+    ]
+
+
+@pytest.mark.parametrize("file_digest", [True, False])
+def test_concurrent_inventory_matches_serial_order_and_hashes(tmp_path: Path, monkeypatch, file_digest: bool):
+    site = _site(tmp_path / "site")
+    if not file_digest:
+        # Pre-3.11 path: memory map for large files, chunked reads otherwise.
+        monkeypatch.setattr(manifest_mod, "_file_digest", None)
+        monkeypatch.setattr(manifest_mod, "INVENTORY_MMAP_MIN_BYTES", 1000)
+
+    assert build_file_inventory(site) == _expected(site)
+    monkeypatch.setattr(manifest_mod, "INVENTORY_HASH_WORKERS", 1)
+    assert build_file_inventory(site) == _expected(site)
+
+
+def test_unreadable_file_is_recorded_without_hash(tmp_path: Path, monkeypatch):
+    site = _site(tmp_path / "site")
+    real = manifest_mod._sha256_file
+
+    def _flaky(path: Path, *args, **kwargs) -> str:
+        if path.name == "a.html":
+            raise PermissionError(path)
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(manifest_mod, "_sha256_file", _flaky)
+    inventory = build_file_inventory(site)
+    assert [e["path"] for e in inventory] == [e["path"] for e in _expected(site)]
+    assert inventory[1]["sha256"] is None
+    assert inventory[2]["sha256"] is not None
+
+
+def _age(root: Path, seconds: int = 3600) -> None:
+    for p in root.rglob("*"):
+        if p.is_file():
+            st = p.stat()
+            os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 10**9))
+
+
+def test_render_inventory_reuses_digests_of_unchanged_files(tmp_path: Path, monkeypatch):
+    site = _site(tmp_path / "site")
+    _age(site)
+    hashed: list[str] = []
+    real = manifest_mod._sha256_file
+
+    def _counting(path: Path, *args, **kwargs) -> str:
+        hashed.append(path.relative_to(site).as_posix())
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(manifest_mod, "_sha256_file", _counting)
+
+    update_manifest_after_render(site, to="html")
+    assert len(hashed) == 5
+    assert (site / manifest_mod.INVENTORY_CACHE_FILENAME).is_file()
+
+    hashed.clear()
+    mp = update_manifest_after_render(site, to="html")
+    assert hashed == []
+    assert json.loads(mp.read_text(encoding="utf-8"))["files"] == _expected(site)
+
+    # Same size, new content: the mtime changes, so the file is read again.
+    (site / "lessons" / "a.html").write_bytes(b"A" * 10)
+    fresh = site / "lessons" / "new.html"
+    fresh.write_bytes(b"new")
+    hashed.clear()
+    files = {e["path"]: e["sha256"] for e in json.loads(refresh_manifest(site).read_text(encoding="utf-8"))["files"]}
+    assert sorted(hashed) == ["lessons/a.html", "lessons/new.html"]
+    assert files["lessons/a.html"] == hashlib.sha256(b"A" * 10).hexdigest()
+
+    # Just-written files are not recorded (racy window), so they are read again.
+    hashed.clear()
+    refresh_manifest(site)
+    assert sorted(hashed) == ["lessons/a.html", "lessons/new.html"]
+
+    hashed.clear()
+    refresh_manifest(site, rehash=True)
+    assert len(hashed) == 6
+
+
+def test_inventory_cache_file_is_not_listed(tmp_path: Path):
+    site = _site(tmp_path / "site")
+    build_file_inventory(site, stat_cache=True)
+    assert (site / manifest_mod.INVENTORY_CACHE_FILENAME).exists()
+    assert build_file_inventory(site, stat_cache=True) == _expected(site)
+
+
+def test_walker_orders_like_sorted_rglob_and_prunes_excluded_dirs(tmp_path: Path, monkeypatch):
+    site = _site(tmp_path / "site")
+    for rel in ("a-b/x.html", "a/b.html", "a.b", "B.html", "b/.quarto/deep/f", "img/x.out", "img/.log", "z."):
+        p = site / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(rel.encode("utf-8"))
+    (site / "linked").symlink_to(site / "lessons", target_is_directory=True)
+    (site / "link.html").symlink_to(site / "index.html")
+
+    scanned: list[str] = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(manifest_mod.os, "scandir", lambda d: scanned.append(Path(d).name) or real_scandir(d))
+
+    inventory = build_file_inventory(site, include_hashes=False)
+    assert ".quarto" not in scanned and "linked" not in scanned
+    # Path-component order ("a/b.html" before "a-b/x.html"); ".log" is a name, not a suffix.
+    assert [e["path"] for e in inventory] == [
+        "B.html",
+        "a/b.html",
+        "a-b/x.html",
+        "a.b",
+        "img/.log",
+        "index.html",
+        "lessons/a.html",
+        "lessons/b.html",
+        "link.html",
+        "site_libs/big.js",
+        "site_libs/empty.css",
+        "z.",
+    ]
+    assert all(e["bytes"] == (site / e["path"]).stat().st_size for e in inventory)
+
+
+def test_per_format_exclude_sets_are_pinned():
+    default = manifest_mod.DEFAULT_INVENTORY_EXCLUDES
+    assert default.dirs == {".quarto"}
+    assert default.files == {
+        "manifest.json",
+        ".DS_Store",
+        ".gitignore",
+        manifest_mod.BUILD_STATE_FILENAME,
+        manifest_mod.INVENTORY_CACHE_FILENAME,
+    }
+    assert default.suffixes == {".log", ".aux", ".out"}
+
+    quarto = replace(default, dirs=frozenset({".quarto", "_freeze"}))
+    assert manifest_mod.INVENTORY_EXCLUDES == {"quarto": quarto, "html-single": quarto, "pdf": quarto}
+    assert manifest_mod.inventory_excludes("markdown") == manifest_mod.inventory_excludes(None) == default
+
+
+def test_quarto_project_formats_leave_out_the_freeze_dir(tmp_path: Path, monkeypatch):
+    site = _site(tmp_path / "site")
+    (site / "_freeze").mkdir()
+    (site / "_freeze" / "state.json").write_text("{}", encoding="utf-8")
+
+    assert "_freeze/state.json" in [e["path"] for e in build_file_inventory(site, include_hashes=False)]
+    markdown = build_file_inventory(site, include_hashes=False, output_format="markdown")
+    assert "_freeze/state.json" in [e["path"] for e in markdown]
+    for fmt in ("quarto", "html-single", "pdf"):
+        inventory = build_file_inventory(site, include_hashes=False, output_format=fmt)
+        assert inventory == [{"path": e["path"], "bytes": e["bytes"]} for e in _expected(site)]
+
+    monkeypatch.setitem(
+        manifest_mod.INVENTORY_EXCLUDES,
+        "markdown",
+        replace(manifest_mod.DEFAULT_INVENTORY_EXCLUDES, suffixes=frozenset({".css"})),
+    )
+    paths = [e["path"] for e in build_file_inventory(site, include_hashes=False, output_format="markdown")]
+    assert "site_libs/empty.css" not in paths and "render.log" in paths
+
+
+def test_tracked_writes_record_on_disk_digests(tmp_path: Path):
+    with fileops.track_writes() as writes:
+        fileops.write_text(tmp_path / "a.md", "one\ntwo\n")
+        fileops.write_stream(tmp_path / "sub" / "b.md", iter(["x\n", "", "y" * 5000]))
+    fileops.write_text(tmp_path / "untracked.md", "z")
+
+    assert len(writes) == 2
+    for rel in ("a.md", "sub/b.md"):
+        p = tmp_path / rel
+        record = writes.lookup(p.stat())
+        assert (record.bytes, record.sha256) == (p.stat().st_size, hashlib.sha256(p.read_bytes()).hexdigest())
+    assert writes.lookup((tmp_path / "untracked.md").stat()) is None
+
+
+def test_manifest_takes_digests_of_tracked_writes(tmp_path: Path, monkeypatch):
+    spec = validate_course_dict(
+        {
+            "course": {"id": "hw", "title": "Hash on write", "version": "0.1.0", "language": "en-GB"},
+            "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+            "structure": {
+                "modules": [
+                    {
+                        "id": "m1",
+                        "title": "One",
+                        "lessons": [
+                            {"id": f"l{i}", "title": f"L{i}", "content_blocks": [{"type": "markdown", "body": "x"}]}
+                            for i in range(3)
+                        ],
+                    }
+                ]
+            },
+        }
+    )
+    with fileops.track_writes() as writes:
+        out_dir = build_markdown_package(spec, out_root=tmp_path)
+    (out_dir / "extra.txt").write_bytes(b"added after the build")
+    edited = sorted((out_dir / "lessons").glob("*.md"))[0]
+    edited.write_text("changed", encoding="utf-8")
+    os.utime(edited, ns=(0, 10**18))  # no reliance on mtime granularity
+
+    hashed: list[str] = []
+    real = manifest_mod._sha256_file
+
+    def _counting(path: Path, *args, **kwargs) -> str:
+        hashed.append(path.relative_to(out_dir).as_posix())
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(manifest_mod, "_sha256_file", _counting)
+    tracked = manifest_mod.build_manifest(spec=spec, out_dir=out_dir, output_format="markdown", writes=writes)
+    assert sorted(hashed) == sorted(["extra.txt", edited.relative_to(out_dir).as_posix()])
+
+    untracked = manifest_mod.build_manifest(spec=spec, out_dir=out_dir, output_format="markdown")
+    assert tracked["files"] == untracked["files"]
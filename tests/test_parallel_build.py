@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from course_engine.generator import build as build_mod
+from course_engine.generator.build import build_quarto_project
+from course_engine.schema import validate_course_dict
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+@pytest.fixture(autouse=True)
+def _no_quarto_required(monkeypatch):
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+
+
+def _spec(n_lessons: int):
+    lessons = [
+        {
+            "id": f"l{i}",
+            "title": f"Lesson {i}",
+            "content_blocks": [{"type": "markdown", "body": f"Body {i}\n" * 20}],
+        }
+        for i in range(n_lessons)
+    ]
+    return validate_course_dict(
+        {
+            "course": {"id": "par-course", "title": "Par", "version": "0.1.0"},
+            "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+            "structure": {"modules": [{"id": "m1", "title": "Module 1", "lessons": lessons}]},
+        }
+    )
+
+
+def _tree(out_dir: Path) -> dict[str, bytes]:
+    return {p.relative_to(out_dir).as_posix(): p.read_bytes() for p in sorted(out_dir.rglob("*")) if p.is_file()}
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_parallel_build_is_byte_identical(tmp_path: Path, backend: str):
+    spec = _spec(12)
+    serial = build_quarto_project(spec, tmp_path / "serial", TEMPLATES_DIR)
+    parallel = build_quarto_project(spec, tmp_path / "parallel", TEMPLATES_DIR, jobs=4, jobs_backend=backend)
+
+    assert _tree(serial) == _tree(parallel)
+
+
+def test_parallel_build_reports_first_failure_in_nav_order(tmp_path: Path):
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates)
+    (templates / "lesson.qmd.j2").write_text(
+        '{% if lesson.id in ["l3", "l9"] %}{{ {}[lesson.id].boom }}{% endif %}{{ lesson.title }}\n',
+        encoding="utf-8",
+    )
+    spec = _spec(12)
+
+    with pytest.raises(Exception) as serial_err:
+        build_quarto_project(spec, tmp_path / "serial", templates)
+    with pytest.raises(Exception) as parallel_err:
+        build_quarto_project(spec, tmp_path / "parallel", templates, jobs=6)
+
+    assert type(parallel_err.value) is type(serial_err.value)
+    assert str(parallel_err.value) == str(serial_err.value)
+    assert "l3" in str(parallel_err.value)
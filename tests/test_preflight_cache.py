@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from course_engine.utils import preflight
+from course_engine.utils.preflight import PrereqError, require_pdf_toolchain
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="uses a POSIX shell stub")
+
+# Stand-in for the quarto binary: counts smoke renders; fails when FAKE_QUARTO_FAIL is set.
+FAKE_QUARTO = """#!/bin/sh
+if [ "$1" = "--version" ]; then echo "1.4.0"; exit 0; fi
+echo render >> "{log}"
+if [ -n "$FAKE_QUARTO_FAIL" ]; then echo "! LaTeX Error: missing" >&2; exit 1; fi
+exit 0
+"""
+
+
+@pytest.fixture
+def fake_quarto(tmp_path: Path, monkeypatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    exe = bin_dir / "quarto"
+    exe.write_text(FAKE_QUARTO.replace("{log}", str(bin_dir / "calls.log")), encoding="utf-8")
+    exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(preflight, "_PDF_PREFLIGHT_OK", None)
+    return exe
+
+
+def _smoke_renders(exe: Path) -> int:
+    log = exe.parent / "calls.log"
+    return len(log.read_text(encoding="utf-8").splitlines()) if log.exists() else 0
+
+
+def _new_process(monkeypatch) -> None:
+    # Simulate a fresh CLI invocation: only the on-disk cache survives.
+    monkeypatch.setattr(preflight, "_PDF_PREFLIGHT_OK", None)
+
+
+def test_success_is_cached_on_disk(fake_quarto: Path, monkeypatch):
+    assert require_pdf_toolchain() == "checked"
+    assert require_pdf_toolchain() == "process-cache"
+
+    _new_process(monkeypatch)
+    assert require_pdf_toolchain() == "disk-cache"
+    assert _smoke_renders(fake_quarto) == 1
+
+    _new_process(monkeypatch)
+    assert require_pdf_toolchain(refresh=True) == "checked"
+    assert _smoke_renders(fake_quarto) == 2
+
+
+def test_toolchain_change_invalidates_cache(fake_quarto: Path, monkeypatch):
+    require_pdf_toolchain()
+
+    st = fake_quarto.stat()
+    os.utime(fake_quarto, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    _new_process(monkeypatch)
+
+    assert require_pdf_toolchain() == "checked"
+    assert _smoke_renders(fake_quarto) == 2
+
+
+def test_ttl_expiry_rechecks(fake_quarto: Path, monkeypatch):
+    require_pdf_toolchain()
+
+    monkeypatch.setenv("COURSE_ENGINE_PREFLIGHT_TTL", "0")
+    _new_process(monkeypatch)
+
+    assert require_pdf_toolchain() == "checked"
+    assert _smoke_renders(fake_quarto) == 2
+
+
+def test_failures_are_not_cached(fake_quarto: Path, monkeypatch):
+    monkeypatch.setenv("FAKE_QUARTO_FAIL", "1")
+    with pytest.raises(PrereqError, match="LaTeX"):
+        require_pdf_toolchain()
+
+    monkeypatch.delenv("FAKE_QUARTO_FAIL")
+    _new_process(monkeypatch)
+    assert require_pdf_toolchain() == "checked"
+    assert _smoke_renders(fake_quarto) == 2
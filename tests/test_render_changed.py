@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from course_engine.generator import build as build_mod
+from course_engine.generator import render as render_mod
+from course_engine.generator.build import build_quarto_project
+from course_engine.generator.render import changed_render_inputs, render_quarto_changed
+from course_engine.schema import validate_course_dict
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+@pytest.fixture(autouse=True)
+def _no_quarto(monkeypatch):
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    calls: list[str | None] = []
+    monkeypatch.setattr(
+        render_mod,
+        "render_quarto",
+        lambda project_dir, *, input_file=None, to=None: calls.append(input_file),
+    )
+    return calls
+
+
+def _spec(bodies: list[str]):
+    lessons = [
+        {"id": f"l{i}", "title": f"Lesson {i}", "content_blocks": [{"type": "markdown", "body": b}]}
+        for i, b in enumerate(bodies)
+    ]
+    return validate_course_dict(
+        {
+            "course": {"id": "rc", "title": "RC", "version": "0.1.0"},
+            "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+            "structure": {"modules": [{"id": "m1", "title": "Module 1", "lessons": lessons}]},
+        }
+    )
+
+
+def test_first_render_is_full_then_only_changed(tmp_path: Path, render_calls):
+    out_dir = build_quarto_project(_spec(["a", "b", "c"]), tmp_path, TEMPLATES_DIR)
+
+    # Fresh build: _quarto.yml is pending -> full render.
+    assert changed_render_inputs(out_dir) is None
+    assert render_quarto_changed(out_dir) is None
+    assert render_calls == [None]
+
+    # Nothing changed since.
+    assert render_quarto_changed(out_dir) == []
+
+    build_quarto_project(_spec(["a", "B", "c"]), tmp_path, TEMPLATES_DIR, incremental=True)
+    assert render_quarto_changed(out_dir) == ["lessons/m1-l1-lesson-1.qmd"]
+    assert render_calls == [None, "lessons/m1-l1-lesson-1.qmd"]
+    assert changed_render_inputs(out_dir) == []
+
+
+def test_pending_changes_accumulate_across_builds(tmp_path: Path, render_calls):
+    out_dir = build_quarto_project(_spec(["a", "b", "c"]), tmp_path, TEMPLATES_DIR)
+    render_quarto_changed(out_dir)
+
+    build_quarto_project(_spec(["A", "b", "c"]), tmp_path, TEMPLATES_DIR, incremental=True)
+    build_quarto_project(_spec(["A", "b", "C"]), tmp_path, TEMPLATES_DIR, incremental=True)
+
+    assert changed_render_inputs(out_dir) == [
+        "lessons/m1-l0-lesson-0.qmd",
+        "lessons/m1-l2-lesson-2.qmd",
+    ]
+
+
+def test_without_build_state_falls_back_to_full_render(tmp_path: Path, render_calls):
+    (tmp_path / "_quarto.yml").write_text("project:\n  type: website\n", encoding="utf-8")
+
+    assert render_quarto_changed(tmp_path) is None
+    assert render_calls == [None]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from course_engine.generator.render import (
+    RenderFailed,
+    project_render_inputs,
+    render_quarto_parallel,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="uses a POSIX shell stub")
+
+# Stand-in for the quarto binary: records each input and fails for "bad" files.
+FAKE_QUARTO = """#!/bin/sh
+echo "rendering $2"
+echo "$2" >> "$(dirname "$0")/calls.log"
+case "$2" in
+  *bad*) echo "ERROR: cannot render $2" >&2; exit 1 ;;
+esac
+exit 0
+"""
+
+
+@pytest.fixture
+def fake_quarto(tmp_path: Path, monkeypatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    exe = bin_dir / "quarto"
+    exe.write_text(FAKE_QUARTO, encoding="utf-8")
+    exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    return bin_dir / "calls.log"
+
+
+def _project(root: Path, names: list[str]) -> Path:
+    project = root / "site"
+    (project / "lessons").mkdir(parents=True)
+    (project / "_site").mkdir()
+    (project / "_quarto.yml").write_text("project:\n  type: website\n", encoding="utf-8")
+    (project / "index.qmd").write_text("# Home\n", encoding="utf-8")
+    (project / "_site" / "ignored.qmd").write_text("x", encoding="utf-8")
+    (project / "lessons" / "_partial.qmd").write_text("x", encoding="utf-8")
+    for n in names:
+        (project / "lessons" / n).write_text(f"# {n}\n", encoding="utf-8")
+    return project
+
+
+def test_project_render_inputs_skips_underscore_and_dot_paths(tmp_path: Path):
+    project = _project(tmp_path, ["a.qmd", "b.qmd"])
+    assert project_render_inputs(project) == ["index.qmd", "lessons/a.qmd", "lessons/b.qmd"]
+
+
+def test_parallel_render_renders_every_input(tmp_path: Path, fake_quarto: Path):
+    project = _project(tmp_path, [f"l{i}.qmd" for i in range(7)])
+
+    shards = render_quarto_parallel(project, jobs=3)
+
+    assert len(shards) == 3
+    rendered = sorted(r.input_file for s in shards for r in s.results)
+    assert rendered == project_render_inputs(project)
+    assert len(fake_quarto.read_text(encoding="utf-8").splitlines()) == 8
+    assert "rendering" in shards[0].stdout
+
+
+def test_parallel_render_reports_failures_per_file(tmp_path: Path, fake_quarto: Path):
+    project = _project(tmp_path, ["ok1.qmd", "bad1.qmd", "ok2.qmd", "bad2.qmd"])
+
+    with pytest.raises(RenderFailed) as exc:
+        render_quarto_parallel(project, jobs=2)
+
+    failed = [r.input_file for r in exc.value.failures]
+    assert failed == ["lessons/bad1.qmd", "lessons/bad2.qmd"]
+    assert len(exc.value.results) == 5  # every input was still attempted
+    assert "cannot render" in str(exc.value)
@@ -95,3 +95,30 @@ def test_report_fail_on_gaps_exits_2(tmp_path: Path):
     res = runner.invoke(app, ["report", str(out_dir), "--fail-on-gaps"])
     assert res.exit_code == 2
     assert "Domains with gaps: 1" in res.stdout
+
+
+def test_report_to_text_returns_the_rendered_report():
+    from course_engine.utils.reporting import build_capability_report, report_to_text
+
+    manifest = {
+        "course": {"id": "c1", "title": "Course 1", "version": "0.1.0"},
+        "capability_mapping": {
+            "framework": "Framework",
+            "version": "2026",
+            "domains": {
+                "awareness": {"label": "Awareness", "coverage": ["m1"], "evidence": ["lesson:l1"]},
+            },
+        },
+    }
+    rep = build_capability_report(manifest)
+
+    text = report_to_text(rep)
+    assert isinstance(text, str)
+    assert text.startswith("Capability Coverage Report (v1.2)\n")
+    assert "- Tip: run with --verbose" in text
+    assert text.endswith("\n")
+
+    verbose = report_to_text(rep, verbose=True)
+    assert "Details (verbose)" in verbose
+    assert "  coverage: ['m1']" in verbose
+    assert verbose.endswith("\n")
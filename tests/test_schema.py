@@ -61,3 +61,43 @@ def test_quiz_block_semantics():
     }
     spec = validate_course_dict(data)
     assert spec.modules[0].lessons[0].content_blocks[0].type == "quiz"
+
+
+def test_spec_objects_are_slotted_frozen_and_picklable():
+    import dataclasses
+    import pickle
+
+    data = {
+        "course": {"id": "test-course", "title": "Test", "version": "0.1.0", "language": "en-GB"},
+        "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+        "structure": {
+            "modules": [
+                {
+                    "id": "m1",
+                    "title": "Module 1",
+                    "lessons": [
+                        {
+                            "id": f"l{i}",
+                            "title": f"Lesson {i}",
+                            "tags": ["".join(["co", "re"])],
+                            "content_blocks": [{"type": "markdown", "body": "Hello"}],
+                        }
+                        for i in range(2)
+                    ],
+                }
+            ]
+        },
+    }
+    spec = validate_course_dict(data)
+    l1, l2 = spec.modules[0].lessons
+    block = l1.content_blocks[0]
+
+    assert not hasattr(block, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        block.body = "changed"  # type: ignore[misc]
+
+    # Repeated strings share one object.
+    assert l1.tags[0] is l2.tags[0]
+    assert block.type is l2.content_blocks[0].type
+
+    assert pickle.loads(pickle.dumps(spec)) == spec
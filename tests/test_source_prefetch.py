@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from course_engine import schema
+from course_engine.schema import validate_course_dict
+
+
+def _course(modules: list[dict]) -> dict:
+    return {
+        "course": {"id": "prefetch", "title": "Prefetch", "version": "0.1.0", "language": "en-GB"},
+        "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+        "structure": {"modules": modules},
+    }
+
+
+def _module(mid: str, sources: list[str]) -> dict:
+    return {
+        "id": mid,
+        "title": f"Module {mid}",
+        "lessons": [{"id": f"l{i}", "source": s} for i, s in enumerate(sources, start=1)],
+    }
+
+
+def _write_sources(root: Path, n: int) -> list[str]:
+    (root / "lessons").mkdir(parents=True, exist_ok=True)
+    names = []
+    for i in range(n):
+        rel = f"lessons/{i:03d}.md"
+        (root / rel).write_text(f"# Lesson {i}\n\nBody {i}\n", encoding="utf-8")
+        names.append(rel)
+    return names
+
+
+def test_prefetched_spec_matches_declaration_order(tmp_path: Path):
+    names = _write_sources(tmp_path, 40)
+    data = _course([_module("m1", names[:20]), _module("m2", names[20:])])
+    spec = validate_course_dict(data, source_course_yml=tmp_path / "course.yml")
+
+    titles = [lesson.title for m in spec.modules for lesson in m.lessons]
+    assert titles == [f"Lesson {i}" for i in range(40)]
+    assert spec.modules[1].lessons[0].content_blocks[0].body == "# Lesson 20\n\nBody 20\n"
+
+
+def test_first_missing_source_is_reported(tmp_path: Path):
+    names = _write_sources(tmp_path, 5)
+    data = _course([_module("m1", names[:2] + ["lessons/missing-a.md"]), _module("m2", ["lessons/missing-b.md"])])
+
+    with pytest.raises(ValueError, match="missing-a.md"):
+        validate_course_dict(data, source_course_yml=tmp_path / "course.yml")
+
+
+def test_source_error_before_invalid_module_wins(tmp_path: Path):
+    names = _write_sources(tmp_path, 3)
+    data = _course([_module("m1", names + ["lessons/missing.md"]), {"id": "m2"}])
+
+    with pytest.raises(ValueError, match="Lesson source file not found"):
+        validate_course_dict(data, source_course_yml=tmp_path / "course.yml")
+
+
+def test_invalid_module_before_source_error_wins(tmp_path: Path):
+    names = _write_sources(tmp_path, 3)
+    data = _course([_module("m1", names), {"id": "m2"}, _module("m3", ["lessons/missing.md"])])
+
+    with pytest.raises(ValueError) as exc:
+        validate_course_dict(data, source_course_yml=tmp_path / "course.yml")
+    assert "missing.md" not in str(exc.value)
+    assert "title" in str(exc.value)
+
+
+def test_reads_run_concurrently_with_bounded_workers(tmp_path: Path, monkeypatch):
+    names = _write_sources(tmp_path, 40)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_read(base_dir: Path, source: str):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return schema.read_course_source(base_dir, source)
+
+    monkeypatch.setattr(schema, "SOURCE_PREFETCH_WORKERS", 4)
+    data = _course([_module("m1", names)])
+    validate_course_dict(data, source_course_yml=tmp_path / "course.yml", read_source=slow_read)
+
+    assert 1 < peak <= 4
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from course_engine.cli import app
+from course_engine.generator.templates import get_env, precompile_templates
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+def test_get_env_is_shared_per_templates_dir(tmp_path: Path):
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates)
+
+    env = get_env(templates)
+    assert get_env(templates) is env
+    assert get_env(tmp_path / "templates" / ".." / "templates") is env
+
+
+def test_get_env_picks_up_template_edits(tmp_path: Path):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "t.j2").write_text("v1 {{ x }}", encoding="utf-8")
+
+    env1 = get_env(templates)
+    assert env1.get_template("t.j2").render(x=1) == "v1 1"
+
+    (templates / "t.j2").write_text("v2 {{ x }}", encoding="utf-8")
+    st = (templates / "t.j2").stat()
+    os.utime(templates / "t.j2", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    env2 = get_env(templates)
+    assert env2 is not env1
+    assert env2.get_template("t.j2").render(x=1) == "v2 1"
+
+
+def test_get_env_does_not_read_template_files(tmp_path: Path, monkeypatch):
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates)
+    env = get_env(templates)
+
+    def _no_read(self, *args, **kwargs):
+        raise AssertionError(f"read {self}")
+
+    monkeypatch.setattr(Path, "read_bytes", _no_read)
+    monkeypatch.setattr(Path, "read_text", _no_read)
+    assert get_env(templates) is env
+
+
+def test_precompile_populates_bytecode_cache(tmp_path: Path, monkeypatch):
+    cache_root = tmp_path / "cache"
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(cache_root))
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates)
+
+    n = precompile_templates(templates)
+
+    assert n == len(list(TEMPLATES_DIR.glob("*.j2")))
+    assert len(list((cache_root / "jinja-bytecode").iterdir())) == n
+
+
+def test_warm_cache_command_compiles_templates(tmp_path: Path, monkeypatch):
+    cache_root = tmp_path / "cache"
+    monkeypatch.setenv("COURSE_ENGINE_CACHE_DIR", str(cache_root))
+    templates = tmp_path / "templates"
+    shutil.copytree(TEMPLATES_DIR, templates)
+
+    result = CliRunner().invoke(app, ["warm-cache", "--templates", str(templates)])
+    assert result.exit_code == 0, result.output
+    n = len(list(TEMPLATES_DIR.glob("*.j2")))
+    assert f"Compiled {n} template(s)" in result.output
+    assert len(list((cache_root / "jinja-bytecode").iterdir())) == n
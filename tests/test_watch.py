@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from course_engine.generator import build as build_mod
+from course_engine.generator import watch as watch_mod
+from course_engine.generator.watch import WatchSession
+from course_engine.utils.watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    _load_libc,
+    wait_for_changes,
+)
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
+
+
+@pytest.fixture(autouse=True)
+def _no_quarto_required(monkeypatch):
+    monkeypatch.setattr(build_mod, "_require_quarto", lambda: None)
+
+
+def _project(root: Path) -> Path:
+    (root / "lessons").mkdir(parents=True)
+    for n in (1, 2):
+        (root / "lessons" / f"l{n}.md").write_text(f"# Lesson {n}\n\nBody {n}\n", encoding="utf-8")
+    data = {
+        "course": {"id": "watch-course", "title": "Watch", "version": "0.1.0", "language": "en-GB"},
+        "framework_alignment": {"framework_name": "Framework", "domains": ["Awareness"]},
+        "structure": {
+            "modules": [
+                {
+                    "id": "m1",
+                    "title": "Module 1",
+                    "lessons": [
+                        {"id": "l1", "source": "lessons/l1.md"},
+                        {"id": "l2", "source": "lessons/l2.md"},
+                    ],
+                }
+            ]
+        },
+    }
+    course_yml = root / "course.yml"
+    course_yml.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+    return course_yml
+
+
+def _touch_content(path: Path, text: str) -> None:
+    path.write_text(text, encoding="utf-8")
+    st = path.stat()
+    # Guarantee a visible mtime change on coarse-grained filesystems.
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_cycle_reuses_parsed_state_and_rewrites_only_affected_lesson(tmp_path: Path):
+    course_yml = _project(tmp_path / "src")
+    session = WatchSession(course_yml, out_root=tmp_path / "dist", templates_dir=TEMPLATES_DIR)
+
+    first = session.run_cycle()
+    assert first.error is None
+    assert first.reparsed and first.sources_read == 2
+    assert {p.name for p in session.watched_files()} == {"course.yml", "l1.md", "l2.md"}
+
+    lesson = tmp_path / "src" / "lessons" / "l2.md"
+    _touch_content(lesson, "# Lesson 2\n\nEdited\n")
+    second = session.run_cycle({lesson})
+
+    assert second.error is None
+    assert not second.reparsed
+    assert second.sources_read == 1
+    assert second.written == ["lessons/m1-l2-lesson-2.qmd"]
+    out = tmp_path / "dist" / "watch-course" / "lessons" / "m1-l2-lesson-2.qmd"
+    assert "Edited" in out.read_text(encoding="utf-8")
+
+
+def test_unchanged_course_yml_is_not_reparsed(tmp_path: Path):
+    course_yml = _project(tmp_path / "src")
+    session = WatchSession(course_yml, out_root=tmp_path / "dist", templates_dir=TEMPLATES_DIR)
+    session.run_cycle()
+
+    os.utime(course_yml)  # touched, bytes identical
+    result = session.run_cycle({course_yml})
+    assert result.error is None
+    assert not result.reparsed
+    assert result.sources_read == 0
+    assert result.written == []
+
+
+def test_bad_edit_is_reported_and_recovers(tmp_path: Path):
+    course_yml = _project(tmp_path / "src")
+    session = WatchSession(course_yml, out_root=tmp_path / "dist", templates_dir=TEMPLATES_DIR)
+    session.run_cycle()
+    good = course_yml.read_text(encoding="utf-8")
+
+    _touch_content(course_yml, "course: [broken\n")
+    assert session.run_cycle({course_yml}).error
+
+    _touch_content(course_yml, good.replace("title: Watch", "title: Watched"))
+    result = session.run_cycle({course_yml})
+    assert result.error is None and result.reparsed
+    assert "index.qmd" in result.written
+
+
+def _exercise_watcher(watcher, tmp_path: Path) -> None:
+    watched = tmp_path / "a.md"
+    other = tmp_path / "unrelated.txt"
+    tpl_dir = tmp_path / "templates"
+    tpl_dir.mkdir()
+    watched.write_text("a", encoding="utf-8")
+    watcher.set_paths([watched], [tpl_dir])
+    try:
+        assert watcher.poll(0.05) == set()
+
+        other.write_text("ignored", encoding="utf-8")
+        _touch_content(watched, "b")
+        assert wait_for_changes(watcher, debounce=0.1, timeout=2.0) == {watched}
+
+        (tpl_dir / "new.j2").write_text("x", encoding="utf-8")
+        assert tpl_dir / "new.j2" in wait_for_changes(watcher, debounce=0.1, timeout=2.0)
+    finally:
+        watcher.close()
+
+
+def test_polling_watcher(tmp_path: Path):
+    _exercise_watcher(PollingWatcher(interval=0.02), tmp_path)
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux") or _load_libc() is None, reason="inotify not available"
+)
+def test_inotify_watcher(tmp_path: Path):
+    _exercise_watcher(InotifyWatcher(_load_libc()), tmp_path)
+
+
+def _watchers():
+    yield pytest.param(lambda: PollingWatcher(interval=0.02), id="polling")
+    inotify_ok = sys.platform.startswith("linux") and _load_libc() is not None
+    yield pytest.param(
+        lambda: InotifyWatcher(_load_libc()),
+        id="inotify",
+        marks=pytest.mark.skipif(not inotify_ok, reason="inotify not available"),
+    )
+
+
+@pytest.mark.parametrize("make_watcher", list(_watchers()))
+def test_edit_saved_during_a_rebuild_triggers_the_next_cycle(tmp_path: Path, monkeypatch, make_watcher):
+    course_yml = _project(tmp_path / "src")
+    session = WatchSession(course_yml, out_root=tmp_path / "out", templates_dir=TEMPLATES_DIR)
+    session.run_cycle()
+    l1, l2 = tmp_path / "src" / "lessons" / "l1.md", tmp_path / "src" / "lessons" / "l2.md"
+
+    watcher = make_watcher()
+    watcher.set_paths(session.watched_files(), [TEMPLATES_DIR])
+    real_build = watch_mod.build_quarto_project
+    saved: list[Path] = []
+
+    def _build_then_save(*args, **kwargs):
+        out = real_build(*args, **kwargs)
+        if not saved:
+            _touch_content(l2, "# Lesson 2\n\nSaved mid-rebuild\n")
+            saved.append(l2)
+        return out
+
+    monkeypatch.setattr(watch_mod, "build_quarto_project", _build_then_save)
+    try:
+        _touch_content(l1, "# Lesson 1\n\nEdited\n")
+        changed = wait_for_changes(watcher, debounce=0.1, timeout=2.0)
+        assert changed == {Path(os.path.abspath(l1))}
+        assert session.run_cycle(changed).error is None
+
+        # Re-registering the same paths (or a changed set) must not absorb the edit.
+        watcher.set_paths(session.watched_files(), [TEMPLATES_DIR])
+        assert wait_for_changes(watcher, debounce=0.1, timeout=2.0) == {Path(os.path.abspath(l2))}
+    finally:
+        watcher.close()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from course_engine.utils import yaml_io
+
+DOC = """\
+course:
+  id: yaml-io
+  title: "Café — YAML"
+  version: 0.1.0
+  published: 2024-01-02
+  flags: [yes, no, on, off, ~]
+  numbers: {octal: 0o17, hex: 0x1F, float: 1.5e3, sexagesimal: 1:30}
+lessons:
+  - &base {id: l1, title: One}
+  - <<: *base
+    id: l2
+  - content: |
+      # Heading
+
+      Body with trailing spaces   
+"""
+
+
+def test_safe_load_matches_pyyaml_safe_load():
+    assert yaml_io.safe_load(DOC) == yaml.safe_load(DOC)
+    assert yaml_io.safe_load(DOC.encode("utf-8")) == yaml.safe_load(DOC)
+
+
+def test_pure_python_override_gives_identical_result(monkeypatch):
+    fast = yaml_io.safe_load(DOC)
+    monkeypatch.setenv(yaml_io.PURE_YAML_ENV, "1")
+    assert yaml_io.safe_loader() is yaml.SafeLoader
+    assert yaml_io.safe_load(DOC) == fast
+
+
+@pytest.mark.skipif(not yaml_io.LIBYAML_AVAILABLE, reason="PyYAML built without LibYAML")
+def test_libyaml_loader_used_when_available(monkeypatch):
+    monkeypatch.delenv(yaml_io.PURE_YAML_ENV, raising=False)
+    assert yaml_io.safe_loader() is yaml.CSafeLoader
+
+
+def test_unsafe_tags_rejected():
+    with pytest.raises(yaml.YAMLError):
+        yaml_io.safe_load("x: !!python/object/apply:os.getcwd []")
+
+
+def test_invalid_utf8_bytes_raise():
+    with pytest.raises(UnicodeDecodeError):
+        yaml_io.safe_load(b"title: \xff\xfe")
+
+
+def test_load_file_returns_bytes_and_document(tmp_path: Path):
+    p = tmp_path / "course.yml"
+    p.write_text(DOC, encoding="utf-8")
+    data_bytes, doc = yaml_io.load_file(p)
+    assert data_bytes == p.read_bytes()
+    assert doc == yaml.safe_load(DOC)